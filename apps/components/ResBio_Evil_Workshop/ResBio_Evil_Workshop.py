@@ -1,6 +1,6 @@
 
 #!/usr/bin/env python3
-#this belongs in ~/apps/components/ResBio_Evil_Workshop/ResBio_Evil_Workshop.py - Version: 1
+#this belongs in ~/apps/components/ResBio_Evil_Workshop/ResBio_Evil_Workshop.py - Version: 32
 # X-Seti - December11 2025 - template - placeholder
 
 """
@@ -9,6 +9,7 @@ Gui dest, Information
 
 import os
 import sys
+import tempfile
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple, Any
 
@@ -17,9 +18,31 @@ from PyQt6.QtWidgets import (
 
 
 from apps.methods.resbio_svg_icons import ResBioSVGIcons
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect, QTimer
+from apps.methods.rdt_file import (RDTFile, RDT_NUM_OFFSETS, RDT_SECTION_COLLISION, RDT_SECTION_EVENT_SCRIPTS,
+                                   RDT_SECTION_EXEC_SCRIPT, RDT_SECTION_INIT_SCRIPT, RDT_SECTION_NAMES)
+from apps.methods.scd_script import disassemble_script, format_scripts
+from apps.methods.script_index import ScriptIndex, parse_ref_query
+from apps.methods.sca_collision import SCA_TYPE_NAMES
+from apps.methods.collision_bvh import CollisionBVH, camera_line_of_sight
+from apps.methods.rdt_catalog import RDTCatalog, find_rdt_files
+from apps.methods.stage_validator import format_validation_report, validate_stage
+from apps.methods.emd_model import EmdModel, read_emd1_directory
+from apps.methods.emd_anim import EmdAnimation
+from apps.methods.tim_image import TimImage, is_tim
+from apps.methods.pak_file import load_pak_file, pack_pak_batch
+from apps.methods.sld_file import SLDFile
+from apps.methods.bss_file import BSSFile
+from apps.methods.prs_file import PRS_EXTENSION, load_prs_file
+from apps.methods.rofs_file import RofsFileSystem, find_rofs_archives
+from apps.methods.iso_file import ISOImage, is_iso_image
+from apps.methods.bin_file import BinArchive
+from apps.methods.asset_vfs import AssetVFS, join_vfs_path, split_vfs_path
+from apps.methods.asset_md5 import ASSET_CACHE_FILENAME, AssetIdentifier
+from apps.methods.adt_file import (ADT_DEPACKED_RAW, ADT_DEPACKED_TIM, ADT_HEIGHT, ADT_WIDTH,
+    adt_image_type, adt_to_rgba, depack_adt)
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPoint, QRect, QTimer, QThread
 from PyQt6.QtGui import (
-    QFont, QIcon, QPixmap, QColor, QPainter, QPen, QBrush, QAction, QCursor, QKeySequence, QPainterPath)
+    QFont, QIcon, QImage, QPixmap, QColor, QPainter, QPen, QBrush, QAction, QCursor, QKeySequence, QPainterPath)
 
 from depends.svg_icon_factory import SVGIconFactory
 
@@ -188,6 +211,102 @@ class img_debugger:
 
 
 # - GUI SHELL ONLY BELOW
+class StageScanThread(QThread): #vers 1
+    """Runs RDTCatalog.scan off the Qt thread - workers are separate processes"""
+    scan_progress = pyqtSignal(int, int)
+    scan_finished = pyqtSignal(object)
+    scan_failed = pyqtSignal(str)
+
+    def __init__(self, game_root, parent=None): #vers 1
+        super().__init__(parent)
+        self.game_root = game_root
+
+    def run(self): #vers 1
+        try:
+            catalog = RDTCatalog(self.game_root)
+            catalog.scan(progress=self.scan_progress.emit)
+            self.scan_finished.emit(catalog)
+        except Exception as e:
+            self.scan_failed.emit(str(e))
+
+
+class StageValidateThread(QThread): #vers 1
+    """Runs validate_stage off the Qt thread - rooms are checked in separate processes"""
+    validate_progress = pyqtSignal(int, int)
+    validate_finished = pyqtSignal(object)
+    validate_failed = pyqtSignal(str)
+
+    def __init__(self, game_root, parent=None): #vers 1
+        super().__init__(parent)
+        self.game_root = game_root
+
+    def run(self): #vers 1
+        try:
+            results = validate_stage(find_rdt_files(self.game_root), progress=self.validate_progress.emit)
+            self.validate_finished.emit(results)
+        except Exception as e:
+            self.validate_failed.emit(str(e))
+
+
+class ScriptIndexThread(QThread): #vers 1
+    """Runs ScriptIndex.scan off the Qt thread - only new or changed rooms are decoded, in separate processes"""
+    index_progress = pyqtSignal(int, int)
+    index_finished = pyqtSignal(object)
+    index_failed = pyqtSignal(str)
+
+    def __init__(self, game_root, parent=None): #vers 1
+        super().__init__(parent)
+        self.game_root = game_root
+
+    def run(self): #vers 1
+        try:
+            index = ScriptIndex(self.game_root)
+            index.scan(progress=self.index_progress.emit)
+            self.index_finished.emit(index)
+        except Exception as e:
+            self.index_failed.emit(str(e))
+
+
+class AssetIdentifyThread(QThread): #vers 1
+    """Runs AssetIdentifier.identify_folder off the Qt thread - files are hashed on a thread pool"""
+    identify_progress = pyqtSignal(int, int)
+    identify_finished = pyqtSignal(object)
+    identify_failed = pyqtSignal(str)
+
+    def __init__(self, folder, parent=None): #vers 1
+        super().__init__(parent)
+        self.folder = folder
+
+    def run(self): #vers 1
+        try:
+            identifier = AssetIdentifier(cache_path=os.path.join(self.folder, ASSET_CACHE_FILENAME))
+            results = identifier.identify_folder(self.folder, progress=self.identify_progress.emit)
+            self.identify_finished.emit(results)
+        except Exception as e:
+            self.identify_failed.emit(str(e))
+
+
+class PakBatchThread(QThread): #vers 1
+    """Runs pack_pak_batch off the Qt thread - images are packed in separate processes"""
+    pack_progress = pyqtSignal(int, int)
+    pack_finished = pyqtSignal(object)
+    pack_failed = pyqtSignal(str)
+
+    def __init__(self, file_paths, out_dir=None, remove4pix=False, parent=None): #vers 1
+        super().__init__(parent)
+        self.file_paths = file_paths
+        self.out_dir = out_dir
+        self.remove4pix = remove4pix
+
+    def run(self): #vers 1
+        try:
+            results = pack_pak_batch(self.file_paths, self.out_dir, self.remove4pix,
+                                     progress=self.pack_progress.emit)
+            self.pack_finished.emit(results)
+        except Exception as e:
+            self.pack_failed.emit(str(e))
+
+
 class ObjListWidget(QListWidget):
     model_selected = pyqtSignal(int)
     model_context_menu = pyqtSignal(int, object)
@@ -444,6 +563,20 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         self.setMouseTracking(True)
         self.dock_display_mode = None
         self.file_form = []
+        self.current_file_path = None
+        self.current_rdt = None
+        self.current_rdt_bvh = None
+        self.script_index = None
+        self.current_emd = None
+        self.current_emd_meshes = []
+        self.current_emd_anim = None
+        self.current_tim = None
+        self.current_sld = None
+        self.current_adt_data = None
+        self.current_bss = None
+        self.current_bss_index = 0
+        # Loose files and mounted ROFS/ISO/BIN containers - one shared block cache
+        self.vfs = AssetVFS()
 
         # Get app_settings from main_window if available
         if main_window and hasattr(main_window, 'app_settings'):
@@ -1569,7 +1702,7 @@ class ResBioEvilWorkshop(QWidget): #ver 1
 
 # - Panel Creation
 
-    def _create_toolbar(self): #vers 1
+    def _create_toolbar(self): #vers 7
         #Create toolbar - FIXED: Hide drag button when docked, ensure buttons visible
         from depends.svg_icon_factory import SVGIconFactory
 
@@ -1652,6 +1785,78 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         self.open_btn.clicked.connect(self._open_file)
         layout.addWidget(self.open_btn)
 
+        # Scan stage button
+        self.scan_stage_btn = QPushButton("Scan Stage")
+        self.scan_stage_btn.setFont(self.button_font)
+        self.scan_stage_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.scan_stage_btn.setToolTip("Scan extracted game folder for STAGE* rooms")
+        self.scan_stage_btn.clicked.connect(self._scan_stage_folder)
+        layout.addWidget(self.scan_stage_btn)
+
+        # Stage collision validator button
+        self.validate_stage_btn = QPushButton("Validate")
+        self.validate_stage_btn.setFont(self.button_font)
+        self.validate_stage_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.validate_stage_btn.setToolTip("Check item, enemy spawn and camera positions of every room against its collision")
+        self.validate_stage_btn.clicked.connect(self._validate_stage_folder)
+        layout.addWidget(self.validate_stage_btn)
+
+        # Cross-room script reference search button
+        self.script_refs_btn = QPushButton("Script Refs")
+        self.script_refs_btn.setFont(self.button_font)
+        self.script_refs_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.script_refs_btn.setToolTip("Find rooms that set a flag, spawn an enemy type or place an item")
+        self.script_refs_btn.clicked.connect(self._search_script_refs)
+        layout.addWidget(self.script_refs_btn)
+
+        # Script reference query - enabled once an index is loaded
+        self.script_query_edit = QLineEdit()
+        self.script_query_edit.setPlaceholderText("flag 3 17 / test 3 17 / enemy 0x12 / item 33 / door 1 5")
+        self.script_query_edit.setToolTip("Script reference query - kind followed by its values")
+        self.script_query_edit.setMinimumWidth(180)
+        self.script_query_edit.setEnabled(False)
+        self.script_query_edit.returnPressed.connect(self._query_script_refs)
+        layout.addWidget(self.script_query_edit)
+
+        self.script_query_btn = QPushButton("Find")
+        self.script_query_btn.setFont(self.button_font)
+        self.script_query_btn.setToolTip("List every room script referencing the query")
+        self.script_query_btn.setEnabled(False)
+        self.script_query_btn.clicked.connect(self._query_script_refs)
+        layout.addWidget(self.script_query_btn)
+
+        # Batch PAK packer button
+        self.pack_pak_btn = QPushButton("Pack PAK")
+        self.pack_pak_btn.setFont(self.button_font)
+        self.pack_pak_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.pack_pak_btn.setToolTip("Pack TIM backgrounds to PC PAK files (verified round trip)")
+        self.pack_pak_btn.clicked.connect(self._pack_pak_files)
+        layout.addWidget(self.pack_pak_btn)
+
+        # RE3 PC ROFS archive browser button
+        self.open_rofs_btn = QPushButton("Open ROFS")
+        self.open_rofs_btn.setFont(self.button_font)
+        self.open_rofs_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.open_rofs_btn.setToolTip("Browse RE3 PC ROFS*.DAT archives without extracting them")
+        self.open_rofs_btn.clicked.connect(self._open_rofs_folder)
+        layout.addWidget(self.open_rofs_btn)
+
+        # PS1 CD image browser button
+        self.open_iso_btn = QPushButton("Open ISO")
+        self.open_iso_btn.setFont(self.button_font)
+        self.open_iso_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.open_iso_btn.setToolTip("Browse a PS1 .iso/.bin image and open files straight from it")
+        self.open_iso_btn.clicked.connect(self._open_iso_image)
+        layout.addWidget(self.open_iso_btn)
+
+        # Loose dump identifier button
+        self.identify_btn = QPushButton("Identify")
+        self.identify_btn.setFont(self.button_font)
+        self.identify_btn.setIconSize(QSize(self.buticonsizex, self.buticonsizey))
+        self.identify_btn.setToolTip("Label a folder of dumped files by MD5 (known RE2/RE3 files)")
+        self.identify_btn.clicked.connect(self._identify_asset_folder)
+        layout.addWidget(self.identify_btn)
+
         # Save button
         self.save_btn = QPushButton()
         self.save_btn.setFont(self.button_font)
@@ -1832,18 +2037,9 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         return self.toolbar
 
 
-    def _create_left_panel(self): #vers 5
-        # Create left panel - COL file list (only in IMG Factory mode)
-        # In standalone mode, don't create this panel
-        if self.standalone_mode:
-            self.col_list_widget = None  # Explicitly set to None
-            return None
-
-        if not self.main_window:
-            # Standalone mode - return None to hide this panel
-            return None
-
-        # Only create panel in IMG Factory mode
+    def _create_left_panel(self): #vers 6
+        # Create left panel - room/file list
+        # In standalone mode the panel stays hidden until a stage is scanned
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel)
         panel.setMinimumWidth(200)
@@ -1860,9 +2056,13 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         self.col_list_widget.setAlternatingRowColors(True)
         self.col_list_widget.itemClicked.connect(self._on_col_selected)
         layout.addWidget(self.col_list_widget)
+
+        self.left_panel = panel
+        if self.standalone_mode:
+            panel.setVisible(False)
         return panel
 
-    def _create_middle_panel(self): #ver 1
+    def _create_middle_panel(self): #ver 2
         panel = QGroupBox()
         panel.setStyleSheet("""
             QGroupBox {
@@ -1885,11 +2085,12 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         self.middle_list.setIconSize(QSize(self.iconsizex, self.iconsizey))
         self.middle_list.setColumnWidth(0, 100)
         self.middle_list.horizontalHeader().setStretchLastSection(True)
+        self.middle_list.cellClicked.connect(self._on_middle_cell_clicked)
         layout.addWidget(self.middle_list)
 
         return panel
 
-    def _create_right_panel(self): #vers 10
+    def _create_right_panel(self): #vers 13
         #Create right panel with editing controls - compact layout
         panel = QFrame()
         panel.setFrameStyle(QFrame.Shape.StyledPanel)
@@ -1922,6 +2123,26 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         self.display_mode_combo.setMaximumWidth(120)
         self.display_mode_combo.currentTextChanged.connect(self._on_display_mode_changed)
         mode_layout.addWidget(self.display_mode_combo)
+
+        # CLUT selector for multi palette TIMs
+        self.palette_label = QLabel("CLUT:")
+        self.palette_label.setFont(self.panel_font)
+        mode_layout.addWidget(self.palette_label)
+        self.palette_spin = QSpinBox()
+        self.palette_spin.setFont(self.panel_font)
+        self.palette_spin.setWrapping(True)
+        self.palette_spin.valueChanged.connect(self._on_palette_changed)
+        mode_layout.addWidget(self.palette_spin)
+        self.palette_label.setVisible(False)
+        self.palette_spin.setVisible(False)
+
+        # Mask overlay for PSX BSS backgrounds
+        self.bss_mask_check = QCheckBox("Mask")
+        self.bss_mask_check.setFont(self.panel_font)
+        self.bss_mask_check.setToolTip("Draw the camera mask stored after the BSS background")
+        self.bss_mask_check.toggled.connect(self._on_bss_mask_toggled)
+        mode_layout.addWidget(self.bss_mask_check)
+        self.bss_mask_check.setVisible(False)
         mode_layout.addStretch()
 
         display_layout.addLayout(mode_layout)
@@ -1951,7 +2172,7 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         self.display_stack.addWidget(texture_display)
 
         # === PAGE 3: Collision Viewer (placeholder) ===
-        collision_display = QLabel("Collision Viewer\n(Coming soon)")
+        collision_display = QLabel("Collision Viewer\n(select an RDT collision section)")
         collision_display.setAlignment(Qt.AlignmentFlag.AlignCenter)
         collision_display.setStyleSheet("QLabel { background-color: #1a1a1a; color: #666; }")
         self.collision_display = collision_display
@@ -2520,17 +2741,74 @@ class ResBioEvilWorkshop(QWidget): #ver 1
             self.display_mode_combo.setCurrentIndex(1)  # Switch to 3D mode
             img_debugger.debug("Model viewer activated")
 
-    def show_texture(self, texture_data): #vers 1
-        """Display texture (placeholder for future implementation)"""
-        if hasattr(self, 'texture_display'):
-            self.display_mode_combo.setCurrentIndex(2)  # Switch to Texture mode
-            img_debugger.debug("Texture viewer activated")
+    def show_texture(self, texture_data, palette=0): #vers 4
+        """Display TimImage (or dict with rgba_data/width/height) in texture viewer"""
+        if not hasattr(self, 'texture_display'):
+            return
+        tim_source = isinstance(texture_data, TimImage)
+        if hasattr(self, 'palette_spin'):
+            multi = tim_source and texture_data.palette_count > 1
+            self.palette_spin.blockSignals(True)
+            self.palette_spin.setRange(0, max(texture_data.palette_count - 1, 0) if tim_source else 0)
+            self.palette_spin.setValue(palette)
+            self.palette_spin.blockSignals(False)
+            self.palette_label.setVisible(multi)
+            self.palette_spin.setVisible(multi)
+        if tim_source:
+            width, height = texture_data.width, texture_data.height
+            rgba_data = texture_data.to_rgba_bytes(palette)
+        else:
+            width = texture_data.get('width', 0)
+            height = texture_data.get('height', 0)
+            rgba_data = texture_data.get('rgba_data')
 
-    def show_collision(self, collision_data): #vers 1
-        """Display collision data (placeholder for future implementation)"""
-        if hasattr(self, 'collision_display'):
-            self.display_mode_combo.setCurrentIndex(3)  # Switch to Collision mode
-            img_debugger.debug("Collision viewer activated")
+        if rgba_data and width > 0:
+            # QImage does not copy - keep buffer alive with the label
+            self._texture_rgba = rgba_data
+            image = QImage(rgba_data, width, height, width * 4, QImage.Format.Format_RGBA8888)
+            self.texture_display.setPixmap(QPixmap.fromImage(image))
+        else:
+            self.texture_display.setText("No Data")
+        self.display_mode_combo.setCurrentIndex(2)  # Switch to Texture mode
+        img_debugger.debug("Texture viewer activated")
+
+    def show_collision(self, collision_data): #vers 2
+        """Top-down plot of SCACollision boundaries, one colour per boundary type"""
+        if not hasattr(self, 'collision_display'):
+            return
+        self.display_mode_combo.setCurrentIndex(3)  # Switch to Collision mode
+        if collision_data is None or not len(collision_data):
+            self.collision_display.setText("No collision boundaries")
+            return
+
+        boxes = collision_data.boxes
+        x0, z0 = boxes[:, 0].min(), boxes[:, 1].min()
+        span = max(int(boxes[:, 2].max() - x0), int(boxes[:, 3].max() - z0), 1)
+        size = max(min(self.collision_display.width(), self.collision_display.height()) - 16, 256)
+        scale = size / span
+
+        colours = [QColor(220, 80, 80), QColor(80, 160, 220), QColor(90, 200, 90),
+                   QColor(230, 180, 60), QColor(160, 160, 160)]
+        pixmap = QPixmap(size + 1, size + 1)
+        pixmap.fill(QColor(26, 26, 26))
+        painter = QPainter(pixmap)
+        for index, (bx0, bz0, bx1, bz1) in enumerate(boxes.tolist()):
+            colour = colours[collision_data.types[index]]
+            painter.setPen(QPen(colour, 1))
+            fill = QColor(colour)
+            fill.setAlpha(60)
+            painter.setBrush(QBrush(fill))
+            # Z grows away from the camera - flip so north is up
+            painter.drawRect(int((bx0 - x0) * scale), int(size - (bz1 - z0) * scale),
+                             max(int((bx1 - bx0) * scale), 1), max(int((bz1 - bz0) * scale), 1))
+        painter.end()
+        self.collision_display.setPixmap(pixmap)
+
+        summary = ", ".join(f"{name}: {count}" for name, count in zip(SCA_TYPE_NAMES, collision_data.counts))
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"Collision | {len(collision_data)} boundaries | Cx {collision_data.cx} Cz {collision_data.cz} | {summary}")
+        img_debugger.debug(f"Collision viewer activated: {len(collision_data)} boundaries")
 
     def clear_display(self): #vers 1
         """Clear all display content"""
@@ -4538,14 +4816,14 @@ class ResBioEvilWorkshop(QWidget): #ver 1
         locale_text = self.settings_locale_combo.currentText()
 
 
-    def _open_file(self): #vers 1
-        """Open file dialog and load COL file"""
+    def _open_file(self): #vers 3
+        """Open file dialog and load game file"""
         try:
             file_path, _ = QFileDialog.getOpenFileName(
                 self,
                 "Open Obj File",
                 "",
-                "Obj Files (*.col);;All Files (*)"
+                "Game Files (*.rdt *.RDT *.emd *.EMD *.tim *.TIM *.pak *.PAK *.sld *.SLD *.adt *.ADT *.bss *.BSS *.prs *.PRS *.bin *.BIN *.iso *.ISO);;Room Files (*.rdt *.RDT);;Model Files (*.emd *.EMD);;Textures (*.tim *.TIM *.pak *.PAK *.sld *.SLD *.adt *.ADT *.bss *.BSS);;Archives/CD Images (*.bin *.BIN *.iso *.ISO);;All Files (*)"
             )
 
             if file_path:
@@ -4556,6 +4834,678 @@ class ResBioEvilWorkshop(QWidget): #ver 1
             QMessageBox.critical(self, "Error", f"Failed to open file:\n{str(e)}")
 
 
+    def open_obj_file(self, file_path, data=None): #vers 9
+        """Route a game file (loose path or 'mount::path') to its format loader by extension - every file is
+        resolved through the asset VFS: TIM/EMD and container entries are read through its block cache, loose
+        rooms and archives are handed to their loaders by path (mmap), Saturn .prs files are depacked first"""
+        loaders = {
+            '.rdt': self._load_rdt_file,
+            '.emd': self._load_emd_file,
+            '.tim': self._load_tim_file,
+            '.pak': self._load_pak_file,
+            '.sld': self._load_sld_file,
+            '.adt': self._load_adt_file,
+            '.bss': self._load_bss_file,
+            '.bin': self._load_bin_file,
+            '.iso': self._load_iso_image,
+        }
+        data_loaders = ('.rdt', '.emd', '.tim')
+        cached_loaders = ('.emd', '.tim')
+        mount, inner = split_vfs_path(file_path)
+        ext = os.path.splitext(inner)[1].lower()
+        load_path = file_path
+        if data is None:
+            local_path = self.vfs.local_path(file_path)
+            if local_path is not None and ext not in cached_loaders:
+                # Loose rooms and archives are mapped in place - no second copy in the block cache
+                load_path = local_path
+            else:
+                data = self.vfs.read(file_path)
+        if data is not None and ext not in data_loaders:
+            # Path only loaders (mmap based) still need a file on disk
+            load_path = self._write_temp_file("resbio_vfs", os.path.basename(inner), data)
+            data = None
+        if ext == PRS_EXTENSION:
+            # Streamed entries only exist as the temp copy - depack that, not the entry path
+            load_path = self._unwrap_prs(load_path)
+            ext = os.path.splitext(load_path)[1].lower()
+        loader = loaders.get(ext)
+        if loader is None:
+            QMessageBox.warning(self, "Open", f"Unsupported file type: {ext}")
+            return False
+
+        if hasattr(self, 'bss_mask_check'):
+            self.bss_mask_check.setVisible(False)
+        if data is not None:
+            loader(load_path, data)
+        else:
+            loader(load_path)
+        self.current_file_path = file_path
+        self.setWindowTitle(f"{App_name}: {os.path.basename(file_path)}")
+        img_debugger.success(f"Opened: {file_path}")
+        return True
+
+
+    def _write_temp_file(self, folder, name, data): #vers 1
+        """Write unpacked asset bytes to <tmp>/<folder>/<name> so path based loaders can open it"""
+        out_dir = os.path.join(tempfile.gettempdir(), folder)
+        os.makedirs(out_dir, exist_ok=True)
+        out_path = os.path.join(out_dir, name)
+        with open(out_path, 'wb') as f:
+            f.write(data)
+        return out_path
+
+    def _unwrap_prs(self, file_path): #vers 2
+        """Depack Saturn PRS file to the temp folder - name.ext.prs opens as name.ext"""
+        data = load_prs_file(file_path)
+        inner_name = os.path.splitext(os.path.basename(file_path))[0]
+        if not os.path.splitext(inner_name)[1] and is_tim(data):
+            inner_name += ".tim"
+        inner_path = self._write_temp_file("resbio_prs", inner_name, data)
+        img_debugger.debug(f"PRS depacked: {file_path} -> {inner_path} ({len(data)} bytes)")
+        return inner_path
+
+
+    def _load_emd_file(self, file_path, data=None): #vers 6
+        """Decode EMD (RE1/2/3) meshes into array buffers and list them in the middle table"""
+        self.current_emd = EmdModel(file_path, data=data)
+        self.current_emd_meshes = self.current_emd.get_meshes()
+        self.current_emd_anim = None
+        if self.current_emd.version == 1:
+            try:
+                self.current_emd_anim = EmdAnimation(self.current_emd)
+            except Exception as e:
+                img_debugger.warning(f"EMD animation unavailable: {e}")
+            try:
+                tim_offset = read_emd1_directory(self.current_emd.data)["tim"]
+                self.current_tim = TimImage(data=self.current_emd.data, offset=tim_offset)
+            except Exception as e:
+                img_debugger.warning(f"EMD texture unavailable: {e}")
+
+        self.middle_list.setRowCount(0)
+        for index, mesh in enumerate(self.current_emd_meshes):
+            row = self.middle_list.rowCount()
+            self.middle_list.insertRow(row)
+            name_item = QTableWidgetItem(f"Mesh {index:02d}")
+            name_item.setData(Qt.ItemDataRole.UserRole, index)
+            self.middle_list.setItem(row, 0, name_item)
+            self.middle_list.setItem(row, 1, QTableWidgetItem(
+                f"{mesh.vertex_count} vertices  {mesh.face_count} triangles"))
+
+        if hasattr(self, 'viewer_3d') and hasattr(self.viewer_3d, 'set_mesh_arrays'):
+            self.viewer_3d.set_mesh_arrays(self.current_emd_meshes)
+            if not getattr(self, '_viewport_pick_connected', False):
+                self.viewer_3d.model_selected.connect(self._on_viewport_picked)
+                self._viewport_pick_connected = True
+        if hasattr(self, 'status_label'):
+            total = sum(mesh.face_count for mesh in self.current_emd_meshes)
+            self.status_label.setText(
+                f"{os.path.basename(file_path)} | RE{self.current_emd.version} EMD | "
+                f"meshes: {len(self.current_emd_meshes)} | triangles: {total}"
+                + (f" | animations: {self.current_emd_anim.sequence_count}" if self.current_emd_anim else ""))
+
+
+    def _on_viewport_picked(self, prim): #vers 1
+        """3D viewport click - select the mesh row of the picked triangle"""
+        element = self.viewer_3d.selected_element
+        if not element or element[0] != "mesh":
+            return
+        self.middle_list.selectRow(element[1])
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Picked mesh {element[1]:02d} triangle {element[2]}")
+
+
+    def _load_adt_file(self, file_path): #vers 1
+        """Depack RE2 PC ADT background - raw images can be viewed with or without reorganize"""
+        with open(file_path, 'rb') as f:
+            depacked = depack_adt(f.read())
+        image_type = adt_image_type(depacked)
+        self.middle_list.setRowCount(0)
+        if image_type == ADT_DEPACKED_TIM:
+            self._load_tim_file(file_path, bytes(depacked))
+            return
+        if image_type != ADT_DEPACKED_RAW:
+            raise ValueError(f"Unknown ADT content ({len(depacked)} bytes depacked)")
+
+        self.current_adt_data = depacked
+        for reorganize, label in ((True, "Reorganized"), (False, "No reorg")):
+            row = self.middle_list.rowCount()
+            self.middle_list.insertRow(row)
+            name_item = QTableWidgetItem(label)
+            name_item.setData(Qt.ItemDataRole.UserRole, ("adt", reorganize))
+            self.middle_list.setItem(row, 0, name_item)
+            self.middle_list.setItem(row, 1, QTableWidgetItem(
+                "256x256 + 2x64x128 blocks" if reorganize else "linear 320x240"))
+        self._show_adt(True)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"{os.path.basename(file_path)} | ADT {ADT_WIDTH}x{ADT_HEIGHT} | {len(depacked)} bytes depacked")
+
+    def _show_adt(self, reorganize): #vers 1
+        rgba = adt_to_rgba(self.current_adt_data, reorganize)
+        self.show_texture({'width': ADT_WIDTH, 'height': ADT_HEIGHT, 'rgba_data': rgba.tobytes()})
+
+    def _load_bss_file(self, file_path): #vers 2
+        """Index RE2/RE3 PSX BSS backgrounds - one MDEC frame per camera, decoded when picked"""
+        if self.current_bss is not None:
+            self.current_bss.close()
+        self.current_bss = BSSFile(file_path)
+        self.middle_list.setRowCount(0)
+        for index, offset in enumerate(self.current_bss.frames):
+            row = self.middle_list.rowCount()
+            self.middle_list.insertRow(row)
+            name_item = QTableWidgetItem(f"Camera {index:02d}")
+            name_item.setData(Qt.ItemDataRole.UserRole, ("bss", index))
+            self.middle_list.setItem(row, 0, name_item)
+            self.middle_list.setItem(row, 1, QTableWidgetItem(f"0x{offset:06X}  MDEC frame"))
+        self._show_bss(0)
+        if hasattr(self, 'bss_mask_check'):
+            self.bss_mask_check.setVisible(True)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"{os.path.basename(file_path)} | BSS {self.current_bss.width}x{self.current_bss.height} | "
+                f"cameras: {len(self.current_bss)}")
+
+    def _show_bss(self, index): #vers 2
+        """Show one camera - masks are depacked from the open BSS and cached for the room"""
+        self.current_bss_index = index
+        masked = hasattr(self, 'bss_mask_check') and self.bss_mask_check.isChecked()
+        try:
+            rgba = self.current_bss.get_rgba_bytes(index, masked)
+        except (ValueError, IndexError) as e:
+            img_debugger.error(f"BSS frame {index} failed: {e}")
+            QMessageBox.warning(self, "BSS", f"Failed to decode background {index}:\n{e}")
+            return
+        self.show_texture({'width': self.current_bss.width, 'height': self.current_bss.height, 'rgba_data': rgba})
+
+    def _load_sld_file(self, file_path): #vers 2
+        """Index RE3 SLD mask archive and mount it as 'sld' - masks are read through the VFS when a
+        camera row is picked"""
+        # Mounting over the previous 'sld' closes it
+        self.current_sld = SLDFile(file_path)
+        self.vfs.mount("sld", self.current_sld)
+        self.middle_list.setRowCount(0)
+        for index, (offset, length) in enumerate(self.current_sld.entries):
+            row = self.middle_list.rowCount()
+            self.middle_list.insertRow(row)
+            name_item = QTableWidgetItem(f"Camera {index:02d}")
+            name_item.setData(Qt.ItemDataRole.UserRole, ("sld", index))
+            self.middle_list.setItem(row, 0, name_item)
+            details = "empty" if length == 0 else f"0x{offset:06X}  {length} bytes packed"
+            self.middle_list.setItem(row, 1, QTableWidgetItem(details))
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"{os.path.basename(file_path)} | SLD masks: {len(self.current_sld)}")
+
+    def _load_pak_file(self, file_path): #vers 1
+        """Depack PC PAK background to TIM and show it"""
+        self._load_tim_file(file_path, load_pak_file(file_path))
+
+    def _load_tim_file(self, file_path, tim_data=None): #vers 3
+        """Decode standalone TIM texture (or already depacked TIM bytes) and show it"""
+        self.current_tim = TimImage(file_path, data=tim_data)
+        self.middle_list.setRowCount(0)
+        for index in range(self.current_tim.palette_count):
+            row = self.middle_list.rowCount()
+            self.middle_list.insertRow(row)
+            name_item = QTableWidgetItem(f"CLUT {index:02d}")
+            name_item.setData(Qt.ItemDataRole.UserRole, ("clut", index))
+            self.middle_list.setItem(row, 0, name_item)
+            self.middle_list.setItem(row, 1, QTableWidgetItem(f"{self.current_tim.palettes.shape[1]} colours"))
+        self.show_texture(self.current_tim)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"{os.path.basename(file_path)} | TIM {self.current_tim.width}x{self.current_tim.height} "
+                f"{self.current_tim.bpp}bpp | palettes: {self.current_tim.palette_count}")
+
+
+    def _on_middle_cell_clicked(self, row, column): #vers 9
+        """Middle table row picked - CLUT rows switch palette, SLD/BSS rows decode one camera, ADT rows pick layout,
+        RDT collision row plots boundaries and camera line of sight, RDT script rows list disassembly"""
+        item = self.middle_list.item(row, 0)
+        data = item.data(Qt.ItemDataRole.UserRole) if item else None
+        if not isinstance(data, tuple):
+            return
+        if data[0] == "clut" and self.current_tim is not None:
+            self.show_texture(self.current_tim, data[1])
+        elif data[0] == "sld" and self.current_sld is not None:
+            if self.current_sld.is_empty(data[1]):
+                self.texture_display.setText(f"Camera {data[1]:02d}: no mask")
+                return
+            try:
+                self.current_tim = TimImage(data=self.vfs.read(join_vfs_path("sld", f"{data[1]:02d}.tim")))
+                self.show_texture(self.current_tim)
+            except (ValueError, IndexError) as e:
+                img_debugger.error(f"SLD entry {data[1]} failed: {e}")
+                QMessageBox.warning(self, "SLD", f"Failed to decode mask {data[1]}:\n{e}")
+        elif data[0] == "adt" and self.current_adt_data is not None:
+            self._show_adt(data[1])
+        elif data[0] == "bss" and self.current_bss is not None:
+            self._show_bss(data[1])
+        elif data[0] == "rdt" and self.current_rdt is not None and data[1] == RDT_SECTION_COLLISION:
+            try:
+                collision = self.current_rdt.collision
+                self.show_collision(collision)
+                cameras = self.current_rdt.cameras
+                if collision is not None and len(collision) and len(cameras):
+                    # Built once per room - reset by _load_rdt_file
+                    if self.current_rdt_bvh is None:
+                        self.current_rdt_bvh = CollisionBVH.from_scene(collision)
+                    visible, blockers = camera_line_of_sight(self.current_rdt_bvh, cameras)
+                    blocked = []
+                    for index, prim in enumerate(blockers.tolist()):
+                        if prim >= 0:
+                            boundary = self.current_rdt_bvh.element(prim)[1]
+                            blocked.append(f"cam {index:02d} by {collision.type_name(boundary)} {boundary}")
+                    if hasattr(self, 'status_label'):
+                        self.status_label.setText(
+                            f"{self.status_label.text()} | line of sight {int(visible.sum())}/{len(visible)} clear"
+                            + (f" | blocked: {', '.join(blocked)}" if blocked else ""))
+            except ValueError as e:
+                img_debugger.error(f"SCA decode failed: {e}")
+                QMessageBox.warning(self, "Collision", f"Failed to decode collision section:\n{e}")
+        elif data[0] == "rdt" and self.current_rdt is not None and data[1] in (
+                RDT_SECTION_INIT_SCRIPT, RDT_SECTION_EXEC_SCRIPT, RDT_SECTION_EVENT_SCRIPTS):
+            self._show_rdt_scripts(data[1])
+
+    def _show_rdt_scripts(self, section): #vers 1
+        """Disassemble an RDT script section into the text viewer - cached by bytecode hash"""
+        try:
+            if section == RDT_SECTION_EVENT_SCRIPTS:
+                scripts = [(f"event {index:02d}", disassemble_script(event["bytecode"]))
+                           for index, event in enumerate(self.current_rdt.event_scripts or [])]
+            else:
+                script = self.current_rdt.get_section(section)
+                label = "init" if section == RDT_SECTION_INIT_SCRIPT else "exec"
+                scripts = [(label, disassemble_script(script["bytecode"]))] if script else []
+        except ValueError as e:
+            img_debugger.error(f"Script decode failed: {e}")
+            QMessageBox.warning(self, "Scripts", f"Failed to read script section:\n{e}")
+            return
+        self.show_research_content(format_scripts(scripts))
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"{RDT_SECTION_NAMES[section]} | {len(scripts)} script(s) | "
+                f"{sum(len(script) for _, script in scripts)} instructions")
+
+    def _on_bss_mask_toggled(self, checked): #vers 1
+        """Mask check box - redraw current BSS camera from the cached frame/mask"""
+        if self.current_bss is not None:
+            self._show_bss(self.current_bss_index)
+
+    def _on_palette_changed(self, palette): #vers 1
+        """CLUT spin box - re-run only the palette lookup (cached per CLUT)"""
+        if self.current_tim is not None and self.current_tim.palette_count:
+            self.show_texture(self.current_tim, palette)
+
+
+    def _scan_stage_folder(self): #vers 1
+        """Pick game folder and build/refresh its RDT catalog in the background"""
+        game_root = QFileDialog.getExistingDirectory(self, "Select Game Folder (contains STAGE*)")
+        if not game_root:
+            return
+        if getattr(self, 'stage_scan_thread', None) is not None and self.stage_scan_thread.isRunning():
+            return
+
+        self.scan_stage_btn.setEnabled(False)
+        self.stage_scan_thread = StageScanThread(game_root, self)
+        self.stage_scan_thread.scan_progress.connect(self._on_stage_scan_progress)
+        self.stage_scan_thread.scan_finished.connect(self._on_stage_scanned)
+        self.stage_scan_thread.scan_failed.connect(self._on_stage_scan_failed)
+        self.stage_scan_thread.start()
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Scanning {game_root}...")
+
+
+    def _on_stage_scan_progress(self, done, total): #vers 1
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Scanning rooms: {done}/{total}")
+
+
+    def _on_stage_scanned(self, catalog): #vers 1
+        """Fill room list from catalog"""
+        self.scan_stage_btn.setEnabled(True)
+        self.rdt_catalog = catalog
+        self.col_list_widget.clear()
+        for room in catalog.get_rooms():
+            item = QListWidgetItem(f"{room['rel_path']}  ({room['num_cameras']} cams)")
+            item.setData(Qt.ItemDataRole.UserRole, room['path'])
+            self.col_list_widget.addItem(item)
+        self.left_panel.setVisible(True)
+
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"Stage catalog: {len(catalog.get_rooms())} rooms, {len(catalog.errors)} errors")
+        for rel_path, error in catalog.errors.items():
+            img_debugger.warning(f"RDT scan failed: {rel_path}: {error}")
+
+
+    def _on_stage_scan_failed(self, error): #vers 1
+        self.scan_stage_btn.setEnabled(True)
+        img_debugger.error(f"Stage scan failed: {error}")
+        QMessageBox.critical(self, "Scan Stage", f"Failed to scan stage:\n{error}")
+
+
+    def _validate_stage_folder(self): #vers 1
+        """Pick game folder and test every room's placements against its collision in the background"""
+        game_root = QFileDialog.getExistingDirectory(self, "Select Game Folder (contains STAGE*)")
+        if not game_root:
+            return
+        if getattr(self, 'validate_thread', None) is not None and self.validate_thread.isRunning():
+            return
+
+        self.validate_stage_btn.setEnabled(False)
+        self.validate_root = game_root
+        self.validate_thread = StageValidateThread(game_root, self)
+        self.validate_thread.validate_progress.connect(self._on_validate_progress)
+        self.validate_thread.validate_finished.connect(self._on_stage_validated)
+        self.validate_thread.validate_failed.connect(self._on_validate_failed)
+        self.validate_thread.start()
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Validating {game_root}...")
+
+
+    def _on_validate_progress(self, done, total): #vers 1
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Validating rooms: {done}/{total}")
+
+
+    def _on_stage_validated(self, results): #vers 1
+        """Show offending rooms in the text viewer"""
+        self.validate_stage_btn.setEnabled(True)
+        self.show_research_content(format_validation_report(results, self.validate_root))
+        issues = sum(len(result["issues"]) for result in results)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Validated {len(results)} rooms: {issues} collision issues")
+        img_debugger.success(f"Stage validated: {len(results)} rooms, {issues} issues")
+
+
+    def _on_validate_failed(self, error): #vers 1
+        self.validate_stage_btn.setEnabled(True)
+        img_debugger.error(f"Stage validation failed: {error}")
+        QMessageBox.critical(self, "Validate Stage", f"Failed to validate stage:\n{error}")
+
+
+    def _search_script_refs(self): #vers 2
+        """Pick game folder and bring its script index up to date in the background"""
+        game_root = QFileDialog.getExistingDirectory(self, "Select Game Folder (contains STAGE*)")
+        if not game_root:
+            return
+        if getattr(self, 'script_index_thread', None) is not None and self.script_index_thread.isRunning():
+            return
+
+        self.script_refs_btn.setEnabled(False)
+        self.script_index_thread = ScriptIndexThread(game_root, self)
+        self.script_index_thread.index_progress.connect(self._on_script_index_progress)
+        self.script_index_thread.index_finished.connect(self._on_script_indexed)
+        self.script_index_thread.index_failed.connect(self._on_script_index_failed)
+        self.script_index_thread.start()
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Indexing scripts in {game_root}...")
+
+
+    def _on_script_index_progress(self, done, total): #vers 1
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Indexing room scripts: {done}/{total}")
+
+
+    def _on_script_indexed(self, index): #vers 2
+        """Index ready - keep it and enable the query field"""
+        self.script_refs_btn.setEnabled(True)
+        self.script_index = index
+        for rel_path, error in index.errors.items():
+            img_debugger.warning(f"Script index failed: {rel_path}: {error}")
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Script index: {len(index.rooms)} rooms, {len(index.postings)} keys")
+        self.script_query_edit.setEnabled(True)
+        self.script_query_btn.setEnabled(True)
+        self.script_query_edit.setFocus()
+
+
+    def _query_script_refs(self): #vers 1
+        """Run the query field against the loaded script index and list the hits"""
+        text = self.script_query_edit.text().strip()
+        if self.script_index is None or not text:
+            return
+        try:
+            kind, values = parse_ref_query(text)
+        except ValueError as e:
+            img_debugger.warning(f"Script query: {e}")
+            QMessageBox.warning(self, "Script Refs", str(e))
+            return
+        postings = self.script_index.query(kind, *values)
+        lines = [f"{text} - {len(postings)} reference(s)", ""]
+        lines += [f"{room}  {label}  @{offset:04X}" for room, label, offset in postings]
+        self.show_research_content("\n".join(lines))
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Script Refs | {text} | {len(postings)} reference(s)")
+
+
+    def _on_script_index_failed(self, error): #vers 1
+        self.script_refs_btn.setEnabled(True)
+        img_debugger.error(f"Script index failed: {error}")
+        QMessageBox.critical(self, "Script Refs", f"Failed to index scripts:\n{error}")
+
+
+    def _pack_pak_files(self): #vers 1
+        """Pick TIM backgrounds and pack them to .pak across a process pool"""
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "Select TIM Backgrounds", "", "TIM Images (*.tim *.TIM);;All Files (*)")
+        if not file_paths:
+            return
+        if getattr(self, 'pak_batch_thread', None) is not None and self.pak_batch_thread.isRunning():
+            return
+        remove4pix = QMessageBox.question(
+            self, "Pack PAK", "Store images with 4 pixels less (-r4, shaking rooms)?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+            QMessageBox.StandardButton.No) == QMessageBox.StandardButton.Yes
+
+        self.pack_pak_btn.setEnabled(False)
+        self.pak_batch_thread = PakBatchThread(file_paths, None, remove4pix, self)
+        self.pak_batch_thread.pack_progress.connect(self._on_pak_pack_progress)
+        self.pak_batch_thread.pack_finished.connect(self._on_pak_packed)
+        self.pak_batch_thread.pack_failed.connect(self._on_pak_pack_failed)
+        self.pak_batch_thread.start()
+
+
+    def _on_pak_pack_progress(self, done, total): #vers 1
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Packing PAK: {done}/{total}")
+
+
+    def _on_pak_packed(self, results): #vers 1
+        """Report packed/verified counts"""
+        self.pack_pak_btn.setEnabled(True)
+        failed = [r for r in results if not r.get("verified")]
+        for result in failed:
+            img_debugger.warning(f"PAK pack failed: {result['path']}: {result.get('error', 'round trip mismatch')}")
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Packed {len(results) - len(failed)}/{len(results)} PAK files (verified)")
+        if failed:
+            QMessageBox.warning(self, "Pack PAK", f"{len(failed)} of {len(results)} images failed to pack or verify")
+
+
+    def _on_pak_pack_failed(self, error): #vers 1
+        self.pack_pak_btn.setEnabled(True)
+        img_debugger.error(f"PAK batch failed: {error}")
+        QMessageBox.critical(self, "Pack PAK", f"Failed to pack PAK files:\n{error}")
+
+
+    def _open_rofs_folder(self): #vers 2
+        """Pick RE3 PC folder, index every ROFS*.DAT once and list their files"""
+        game_dir = QFileDialog.getExistingDirectory(self, "Select RE3 Folder (contains ROFS*.DAT)")
+        if not game_dir:
+            return
+        archive_paths = find_rofs_archives(game_dir)
+        if not archive_paths:
+            QMessageBox.warning(self, "Open ROFS", f"No ROFS*.DAT archives in:\n{game_dir}")
+            return
+        try:
+            rofs = RofsFileSystem(archive_paths)
+        except Exception as e:
+            img_debugger.error(f"ROFS index failed: {e}")
+            QMessageBox.critical(self, "Open ROFS", f"Failed to read ROFS archives:\n{e}")
+            return
+        self.vfs.mount("rofs", rofs)
+
+        self.col_list_widget.clear()
+        for path in sorted(rofs.paths(), key=str.lower):
+            info = rofs.file_info(path)
+            item = QListWidgetItem(path)
+            item.setData(Qt.ItemDataRole.UserRole, join_vfs_path("rofs", path))
+            item.setToolTip(f"{os.path.basename(info['archive'])} @ 0x{info['offset']:08X}  {info['length']} bytes")
+            self.col_list_widget.addItem(item)
+        self.left_panel.setVisible(True)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"ROFS: {len(archive_paths)} archives, {len(rofs)} files")
+
+    def _identify_asset_folder(self): #vers 1
+        """Pick a folder of loose dumps and match every file against the known MD5 tables"""
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder of Dumped Files")
+        if not folder:
+            return
+        if getattr(self, 'identify_thread', None) is not None and self.identify_thread.isRunning():
+            return
+        self.identify_btn.setEnabled(False)
+        self.identify_thread = AssetIdentifyThread(folder, self)
+        self.identify_thread.identify_progress.connect(self._on_identify_progress)
+        self.identify_thread.identify_finished.connect(self._on_assets_identified)
+        self.identify_thread.identify_failed.connect(self._on_identify_failed)
+        self.identify_thread.start()
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Hashing {folder}...")
+
+    def _on_identify_progress(self, done, total): #vers 1
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Hashing files: {done}/{total}")
+
+    def _on_assets_identified(self, results): #vers 1
+        """List every file with its known name, region and role - known files first"""
+        self.identify_btn.setEnabled(True)
+        self.col_list_widget.clear()
+        known = 0
+        for result in sorted(results, key=lambda r: (not r.get("matches"), r["path"].lower())):
+            name = os.path.basename(result["path"])
+            if "error" in result:
+                img_debugger.warning(f"Hash failed: {result['path']}: {result['error']}")
+                continue
+            matches = result["matches"]
+            if matches:
+                known += 1
+                first = matches[0]
+                label = f"{name}  ->  {first['game']} {first['path']}  ({first['region']}, {first['role']})"
+                item = QListWidgetItem(label)
+                item.setData(Qt.ItemDataRole.UserRole, ("asset", result["path"], first["path"]))
+                item.setToolTip("\n".join(f"{m['game']} {m['path']}" for m in matches) + f"\nMD5 {result['md5']}")
+            else:
+                item = QListWidgetItem(f"{name}  (unknown)")
+                item.setData(Qt.ItemDataRole.UserRole, result["path"])
+                item.setToolTip(f"MD5 {result['md5']}")
+            self.col_list_widget.addItem(item)
+        self.left_panel.setVisible(True)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"Identified {known}/{len(results)} files")
+
+    def _on_identify_failed(self, error): #vers 1
+        self.identify_btn.setEnabled(True)
+        img_debugger.error(f"Asset identify failed: {error}")
+        QMessageBox.critical(self, "Identify", f"Failed to identify files:\n{error}")
+
+    def _open_asset_entry(self, file_path, known_path): #vers 2
+        """Open an identified dump - files with a generic extension load by their known name"""
+        if os.path.splitext(file_path)[1].lower() == os.path.splitext(known_path)[1].lower():
+            self.open_obj_file(file_path)
+            return
+        data = self.vfs.read(file_path)
+        self.open_obj_file(os.path.join(os.path.dirname(file_path), os.path.basename(known_path)), data)
+
+    def _open_iso_image(self): #vers 2
+        """Pick a PS1 CD image and list its files"""
+        image_path, _ = QFileDialog.getOpenFileName(
+            self, "Open CD Image", "", "CD Images (*.iso *.ISO *.bin *.BIN *.img *.IMG);;All Files (*)")
+        if not image_path:
+            return
+        try:
+            self._load_iso_image(image_path)
+        except Exception as e:
+            img_debugger.error(f"ISO index failed: {e}")
+            QMessageBox.critical(self, "Open ISO", f"Failed to read CD image:\n{e}")
+
+    def _load_iso_image(self, image_path): #vers 2
+        """Walk the ISO9660 tree of a CD image once, mount it as 'iso' and list its files"""
+        iso = ISOImage(image_path)
+        self.vfs.mount("iso", iso)
+
+        self.col_list_widget.clear()
+        for path in sorted(iso.paths(), key=str.lower):
+            info = iso.file_info(path)
+            item = QListWidgetItem(path)
+            item.setData(Qt.ItemDataRole.UserRole, join_vfs_path("iso", path))
+            item.setToolTip(f"LBA {info['lba']}  {info['length']} bytes")
+            self.col_list_widget.addItem(item)
+        self.left_panel.setVisible(True)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"ISO: {iso.volume_id or os.path.basename(image_path)} | {iso.sector_size} byte sectors | {len(iso)} files")
+
+    def _load_bin_file(self, file_path): #vers 2
+        """Mount an RE2 PS1 BIN archive as 'bin' and list its entries - raw .bin CD images go to the ISO browser"""
+        if is_iso_image(file_path):
+            self._load_iso_image(file_path)
+            return
+        archive = BinArchive(file_path)
+        self.vfs.mount("bin", archive)
+
+        self.col_list_widget.clear()
+        for index, (offset, length, entry_id, name) in enumerate(archive.entries):
+            item = QListWidgetItem(f"{index:03d} {name}")
+            item.setData(Qt.ItemDataRole.UserRole, join_vfs_path("bin", f"{index:03d}/{name}"))
+            item.setToolTip(f"0x{offset:08X}  {length} bytes  id {entry_id}")
+            self.col_list_widget.addItem(item)
+        self.left_panel.setVisible(True)
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(f"{os.path.basename(file_path)} | BIN archive | {len(archive)} entries")
+
+    def _on_col_selected(self, item): #vers 6
+        """Open the room/file stored on a left panel entry (loose or VFS path, or identified dump)"""
+        file_path = item.data(Qt.ItemDataRole.UserRole)
+        if not file_path:
+            return
+        try:
+            if isinstance(file_path, tuple) and file_path[0] == "asset":
+                self._open_asset_entry(file_path[1], file_path[2])
+                return
+            self.open_obj_file(file_path)
+        except Exception as e:
+            img_debugger.error(f"Error opening {file_path}: {str(e)}")
+            QMessageBox.critical(self, "Error", f"Failed to open file:\n{str(e)}")
+
+
+    def _load_rdt_file(self, file_path, data=None): #vers 4
+        """Map RDT room (or wrap streamed bytes) and list its sections - sections decode when selected"""
+        if self.current_rdt is not None:
+            self.current_rdt.close()
+        rdt = RDTFile(file_path, data)
+        self.current_rdt = rdt
+        self.current_rdt_bvh = None
+
+        self.middle_list.setRowCount(0)
+        for index in range(RDT_NUM_OFFSETS):
+            if not rdt.has_section(index):
+                continue
+            start, end = rdt.get_section_range(index)
+            row = self.middle_list.rowCount()
+            self.middle_list.insertRow(row)
+            name_item = QTableWidgetItem(f"{index:02d} {RDT_SECTION_NAMES[index]}")
+            name_item.setData(Qt.ItemDataRole.UserRole, ("rdt", index))
+            self.middle_list.setItem(row, 0, name_item)
+            self.middle_list.setItem(row, 1, QTableWidgetItem(f"0x{start:06X}  {end - start} bytes"))
+
+        if hasattr(self, 'status_label'):
+            self.status_label.setText(
+                f"{os.path.basename(file_path)} | cameras: {rdt.num_cameras} | {rdt.file_size / 1024:.1f} KB")
+
+
     def _save_file(self): #vers 1
         """Save current COL file"""
         try:
@@ -5441,7 +6391,8 @@ class ResBioEvilWorkshop(QWidget): #ver 1
             self.showMaximized()
 
 
-    def closeEvent(self, event): #ver 1
+    def closeEvent(self, event): #ver 2
+        self.vfs.close()
         self.window_closed.emit()
         event.accept()
 
@@ -0,0 +1,211 @@
+#this belongs in apps/methods/adt_file.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - ADT Background Depacker
+"""
+ADT Background Depacker - Resident Evil 2 PC ADT backgrounds (port of
+adt_depack / adt_surface from reevengi-tools depack_adt.c and the image type
+check of adt2img.c). Huffman codes are decoded through 16 bit lookup tables
+instead of a bit-by-bit tree walk, and the 256x256 + 2x64x128 block layout is
+rebuilt with NumPy reshape/concatenate. Raw images come back as RGBA8888.
+"""
+
+import struct
+from typing import List
+
+import numpy as np
+
+from apps.methods.tim_image import bgr555_to_rgba
+
+##Methods list -
+# _build_decode_table
+# adt_image_type
+# adt_surface
+# adt_to_rgba
+# depack_adt
+
+ADT_WIDTH = 320
+ADT_HEIGHT = 240
+ADT_RAW_SIZE = 320 * 256 * 2      # 256x256 block + 128x128 block of 16 bit pixels
+ADT_CHUNK_SIZE = 0x8000           # adt_depack grows (and reports) its buffer in these steps
+ADT_WINDOW_MASK = 0x3FFF          # 16KB history ring
+ADT_MAX_CODE_BITS = 16
+
+ADT_DEPACKED_RAW = "raw"          # raw 16 bits image
+ADT_DEPACKED_TIM = "tim"          # tim image
+ADT_DEPACKED_UNK = "unknown"      # other type
+
+TIM_MAGIC = 0x10
+TIM_TYPES = (2, 8, 9)             # 16bpp, 4bpp+CLUT, 8bpp+CLUT
+
+
+def _build_decode_table(lengths: List[int]) -> List[int]: #vers 1
+    """Canonical code lengths -> 65536 entry table of (length << 10) | symbol (0 = invalid)"""
+    lengths_arr = np.asarray(lengths, dtype=np.int64)
+    if lengths_arr.size and lengths_arr.max() > ADT_MAX_CODE_BITS:
+        raise ValueError("ADT code length above 16 bits")
+    freq = np.bincount(lengths_arr, minlength=ADT_MAX_CODE_BITS + 1)
+    next_code = [0] * (ADT_MAX_CODE_BITS + 2)
+    for i in range(ADT_MAX_CODE_BITS):
+        next_code[i + 2] = ((next_code[i + 1] + int(freq[i + 1])) << 1) & 0xFFFF
+
+    table = np.zeros(1 << ADT_MAX_CODE_BITS, dtype=np.int32)
+    for symbol, length in enumerate(lengths):
+        if length == 0:
+            continue
+        code = next_code[length]
+        next_code[length] += 1
+        shift = ADT_MAX_CODE_BITS - length
+        low, high = code << shift, (code + 1) << shift
+        if high > table.size:
+            raise ValueError("ADT code table oversubscribed")
+        table[low:high] = (length << 10) | symbol
+    return table.tolist()
+
+
+def depack_adt(data) -> bytearray: #vers 1
+    """Depack an ADT stream (4 byte header, then Huffman/LZ blocks)"""
+    src = bytes(data) + b"\0\0\0\0\0\0"
+    total_bits = len(data) * 8
+    from_bytes = int.from_bytes
+    pos = 32  # skip header
+
+    def read_bits(num_bits):
+        nonlocal pos
+        byte = pos >> 3
+        value = (from_bytes(src[byte:byte + 4], 'big') >> (32 - (pos & 7) - num_bits)) & ((1 << num_bits) - 1)
+        pos += num_bits
+        return value
+
+    def read_bit():
+        nonlocal pos
+        value = (src[pos >> 3] >> (7 - (pos & 7))) & 1
+        pos += 1
+        return value
+
+    def read_bitfield():
+        # Elias gamma - zero bits give the length of the value
+        nonlocal pos
+        zeros = 0
+        while not read_bit():
+            zeros += 1
+            if pos > total_bits:
+                raise ValueError("ADT stream truncated")
+        return read_bits(zeros) | (1 << zeros) if zeros else 1
+
+    def read_code(table):
+        nonlocal pos
+        byte = pos >> 3
+        entry = table[(from_bytes(src[byte:byte + 4], 'big') >> (16 - (pos & 7))) & 0xFFFF]
+        if not entry:
+            raise ValueError("ADT invalid Huffman code")
+        pos += entry >> 10
+        return entry & 0x3FF
+
+    def read_delta_lengths(count):
+        lengths = []
+        prev = 0
+        for _ in range(count):
+            if read_bit():
+                prev = read_bitfield() ^ prev
+            lengths.append(prev)
+        return lengths
+
+    out = bytearray()
+    block_length = read_bits(8) | (read_bits(8) << 8)
+    while block_length > 0:
+        if pos > total_bits:
+            raise ValueError("ADT stream truncated")
+
+        # Array 1 - code lengths of the length alphabet
+        table1 = _build_decode_table(read_delta_lengths(16))
+
+        # Array 2 - 512 symbol literal/match alphabet, run length coded
+        tmp = [0] * 512
+        cur_bit = read_bit()
+        j = 0
+        while j < 512:
+            count = read_bitfield()
+            if j + count > 512:
+                raise ValueError("ADT length table overflow")
+            if cur_bit:
+                for i in range(count):
+                    tmp[j + i] = read_code(table1)
+            j += count
+            cur_bit ^= 1
+        lengths2 = []
+        acc = 0
+        for value in tmp:
+            acc ^= value
+            lengths2.append(acc)
+        table2 = _build_decode_table(lengths2)
+
+        # Array 3 - distance bit counts
+        table3 = _build_decode_table(read_delta_lengths(16))
+
+        for _ in range(block_length):
+            symbol = read_code(table2)
+            if symbol < 256:
+                out.append(symbol)
+                continue
+            count = symbol - 0xFD
+            distance = read_code(table3)
+            if distance != 0:
+                num_bits = distance - 1
+                distance = (read_bits(num_bits) if num_bits else 0) + (1 << num_bits)
+            back = (distance + 1) & ADT_WINDOW_MASK or ADT_WINDOW_MASK + 1
+            start = len(out) - back
+            if start < 0:
+                # Window starts zero filled
+                prefix = bytes(-start)
+                history = prefix + bytes(out)
+                start = 0
+            else:
+                history = out
+            if count <= back:
+                out += history[start:start + count]
+            else:
+                pattern = bytes(history[start:start + back])
+                out += (pattern * (count // back + 1))[:count]
+
+        block_length = read_bits(8) | (read_bits(8) << 8)
+    return out
+
+
+def adt_image_type(depacked) -> str: #vers 1
+    """Same test as adt2img - raw 16 bit image, TIM, or unknown"""
+    length = len(depacked)
+    rounded = (length + ADT_CHUNK_SIZE - 1) // ADT_CHUNK_SIZE * ADT_CHUNK_SIZE
+    if rounded != ADT_RAW_SIZE:
+        return ADT_DEPACKED_TIM
+    if length < 4:
+        return ADT_DEPACKED_UNK
+    offset = struct.unpack_from("<I", depacked, 0)[0]
+    if offset >= ADT_RAW_SIZE:
+        return ADT_DEPACKED_UNK
+    offset &= ~3
+    if offset + 8 > length:
+        return ADT_DEPACKED_RAW
+    magic, tim_type = struct.unpack_from("<2I", depacked, offset)
+    if magic != TIM_MAGIC or tim_type not in TIM_TYPES:
+        return ADT_DEPACKED_RAW
+    return ADT_DEPACKED_UNK
+
+
+def adt_surface(depacked, reorganize: bool = True) -> np.ndarray: #vers 1
+    """(240, 320) uint16 BGR555 - reorganize rebuilds 256x256 + 2x64x128 layout"""
+    pixels = np.zeros(ADT_RAW_SIZE // 2, dtype="<u2")
+    count = min(len(depacked) // 2, pixels.size)
+    pixels[:count] = np.frombuffer(depacked, dtype="<u2", count=count)
+    if not reorganize:
+        return pixels[:ADT_WIDTH * ADT_HEIGHT].reshape(ADT_HEIGHT, ADT_WIDTH)
+
+    left = pixels[:256 * 256].reshape(256, 256)[:ADT_HEIGHT]
+    right_block = pixels[256 * 256:].reshape(128, 128)
+    right = np.concatenate((right_block[:, :64], right_block[:ADT_HEIGHT - 128, 64:]), axis=0)
+    return np.concatenate((left, right), axis=1)
+
+
+def adt_to_rgba(depacked, reorganize: bool = True) -> np.ndarray: #vers 1
+    """(240, 320, 4) uint8 RGBA8888 - backgrounds are fully opaque"""
+    rgba = bgr555_to_rgba(adt_surface(depacked, reorganize))
+    rgba[..., 3] = 255
+    return rgba
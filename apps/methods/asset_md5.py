@@ -0,0 +1,651 @@
+#this belongs in apps/methods/asset_md5.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - MD5 Asset Identifier
+"""
+MD5 Asset Identifier - Labels loose dumped files by matching their MD5 against
+the known RE2/RE3 file tables of reevengi-tools iso_search.c (md5_checks_re2 /
+md5_checks_re3). Files are hashed on a thread pool (hashlib releases the GIL
+on large buffers) and the digests are kept in a JSON cache keyed by path,
+size and mtime, so unchanged files are never hashed twice.
+"""
+
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+from apps.methods.json_store import load_json_store, save_json_store
+
+##Methods list -
+# asset_region
+# asset_role
+# find_asset_files
+# md5_file
+
+##class KnownAssets: -
+# __init__
+# __len__
+# add
+# load_json
+# lookup
+
+##class AssetIdentifier: -
+# __init__
+# _load_cache
+# _save_cache
+# identify
+# identify_folder
+
+ASSET_CACHE_VERSION = 1
+ASSET_CACHE_FILENAME = "asset_md5_cache.json"
+MD5_CHUNK_SIZE = 1 << 20
+MAX_ASSET_SIZE = 512 << 10         # iso_search.c MAX_FILE_SIZE - nothing in the tables is larger
+
+# Last letter of data_X / data_aX folders
+ASSET_REGIONS = {"u": "USA", "e": "Europe", "f": "France", "j": "Japan"}
+# RE2 player folders are per scenario
+ASSET_SCENARIOS = {"pl0": "Leon", "pl1": "Claire"}
+
+KNOWN_MD5_RE2 = (
+    ("8479ebef2e5e49489ece15227620f814", "pl0/emd0/em010.emd"),
+    ("4385f25501af1b41eb87df27ac515e26", "pl0/emd0/em010.tim"),
+    ("0594f2f8e99daf0fe1d4c33ff296404e", "pl0/emd0/em011.emd"),
+    ("1bd30c3c9d2d34b538f71fe0daac039a", "pl0/emd0/em011.tim"),
+    ("3c2cbc1ddfeae4dc9809ca6ff7593a3d", "pl0/emd0/em012.emd"),
+    ("478d50899cab520e569f1b4790acc74d", "pl0/emd0/em012.tim"),
+    ("57160c3b92a876daec05b09e040ec894", "pl0/emd0/em013.emd"),
+    ("6b60ee48d12032a6154b5bf8b54f9b15", "pl0/emd0/em013.tim"),
+    ("8e7024afb96cbc7a2359dbe2b5a750aa", "pl0/emd0/em015.emd"),
+    ("54b016b6078faf327f7940d54f35bb53", "pl0/emd0/em015.tim"),
+    ("38cb59dfbb944fdaeb3f329782011f6a", "pl0/emd0/em016.emd"),
+    ("5cdf267b2e7aaca4150bfa890cc98848", "pl0/emd0/em016.tim"),
+    ("d83098df3592f75997762b1d009aeb66", "pl0/emd0/em017.emd"),
+    ("e87820d85d8c14526f2a7594c77d83e7", "pl0/emd0/em017.tim"),
+    ("7ea5c9e93671c06cde44660b188f9486", "pl0/emd0/em018.emd"),
+    ("eded3183637af0bdff389fd47c0871f6", "pl0/emd0/em018.tim"),
+    ("7ea5c9e93671c06cde44660b188f9486", "pl0/emd0/em01e.emd"),
+    ("81da2b41c60639ff7bca00d15385ca16", "pl0/emd0/em01e.tim"),
+    ("7ea5c9e93671c06cde44660b188f9486", "pl0/emd0/em01f.emd"),
+    ("a9ca56311527a0f0780b8f790e521f1b", "pl0/emd0/em020.emd"),
+    ("e989eff61ae9451875d7bb811d8f84ab", "pl0/emd0/em020.tim"),
+    ("bc370bac2306e3b716db6c6c4f3077cc", "pl0/emd0/em021.emd"),
+    ("9dace0a69e32b1a4ef7638a5847bc235", "pl0/emd0/em021.tim"),
+    ("09aa186fd0d17cd256a4cce6980a021e", "pl0/emd0/em022.emd"),
+    ("cb66446c89e7de18fc8954d8cf46b90e", "pl0/emd0/em022.tim"),
+    ("9673f75fb713ef5947232b6c32b37242", "pl0/emd0/em023.emd"),
+    ("37dd53a15bae3a104fb35c7589276c1c", "pl0/emd0/em023.tim"),
+    ("7b4ff1861a79e4bc1341aee310755101", "pl0/emd0/em024.emd"),
+    ("672431dfacf710b6b5b1fdb5b88bcf24", "pl0/emd0/em024.tim"),
+    ("8b91976d410b964b87580ff384a8901a", "pl0/emd0/em025.emd"),
+    ("8ef6d0faef12f3f4f30e3f23b0f76457", "pl0/emd0/em025.tim"),
+    ("97949726ee43871544c00e3455ba1e1d", "pl0/emd0/em026.emd"),
+    ("6ea27dfbb8388f5fd7d1e150eeebfc30", "pl0/emd0/em026.tim"),
+    ("6f50669cfec2e783dddab5e2e59b8ece", "pl0/emd0/em027.emd"),
+    ("c6c2d650d18a58b94c2f75d544806bf0", "pl0/emd0/em027.tim"),
+    ("08fe2e5c3c96a9922e0ac339e119faec", "pl0/emd0/em028.emd"),
+    ("8fc09baefbf3cfbd3e38a5492ce45df9", "pl0/emd0/em028.tim"),
+    ("a3c290ffa3cfd425ee939ab0c826378f", "pl0/emd0/em029.emd"),
+    ("12061e2481721831d15ff784dc8eea8a", "pl0/emd0/em029.tim"),
+    ("0cc92755c016333f69e0069eb413ce15", "pl0/emd0/em02a.emd"),
+    ("b93c27aa658957ff7ff1f047453d0cb8", "pl0/emd0/em02a.tim"),
+    ("40b9b0cc398b6ff8573d95ac31fbe7aa", "pl0/emd0/em02b.emd"),
+    ("f8013ea530c5b1b54e97c60f728a2a87", "pl0/emd0/em02b.tim"),
+    ("3dceb40786c3b340ee1ccfbea181ee2c", "pl0/emd0/em02c.emd"),
+    ("af3a30ec501813db390fb2954c55c4ae", "pl0/emd0/em02c.tim"),
+    ("39d093569618311805c03ce9a1ef67e7", "pl0/emd0/em02d.emd"),
+    ("c965e1faa886bde5f873a4d92da0b35b", "pl0/emd0/em02d.tim"),
+    ("da1a245c7a3e11fdbe228d099ca10893", "pl0/emd0/em02e.emd"),
+    ("597393acf844348b6ae01232c3d0e9a6", "pl0/emd0/em02e.tim"),
+    ("762f6f048607c3eebf1280714f55e06f", "pl0/emd0/em02f.emd"),
+    ("75e52e00a5f6a8d1c00963fd8a155a35", "pl0/emd0/em02f.tim"),
+    ("aa67358d9f8ecc7e4588c262b8d287ec", "pl0/emd0/em030.emd"),
+    ("e203e27ca42c6929d6e783c53fe36b07", "pl0/emd0/em030.tim"),
+    ("9eaf491b7196a6f64e00dbb98fab8d1f", "pl0/emd0/em031.emd"),
+    ("abf89ee4772dc4b0be5f61d840f2338f", "pl0/emd0/em031.tim"),
+    ("043ae92f189c8270fdb59a049a0c5e43", "pl0/emd0/em033.emd"),
+    ("a03ef4b1a217bb620ed723cdbc2f4456", "pl0/emd0/em033.tim"),
+    ("034cb7b8b67df59c38fda499309fe9a5", "pl0/emd0/em034.emd"),
+    ("67d5f6322485677a7e43c8ac2cac1800", "pl0/emd0/em034.tim"),
+    ("3a49b091f8aded3c93540856349f5c5d", "pl0/emd0/em036.emd"),
+    ("274087f2c77f1363efd1cb2a841211e9", "pl0/emd0/em036.tim"),
+    ("22756bc25cfda5ce4233e2028fa5941a", "pl0/emd0/em037.emd"),
+    ("e3c118c118921ffb90480f493a6c3e64", "pl0/emd0/em037.tim"),
+    ("ec318c6e6f94dedb2187cd81a45a0637", "pl0/emd0/em038.emd"),
+    ("58b1e69b04cbcf9cdeecc6ef63075b13", "pl0/emd0/em038.tim"),
+    ("da1a245c7a3e11fdbe228d099ca10893", "pl0/emd0/em039.emd"),
+    ("50edab0ce1d66682b2c5600ce592f67a", "pl0/emd0/em039.tim"),
+    ("c084ef69626b557fcb6324f45f40f5fd", "pl0/emd0/em03A.emd"),
+    ("e086b31a3f3a0eaaea7daeb24952e6ec", "pl0/emd0/em03A.tim"),
+    ("75189ca3adf7e8b01be9f00810ffc985", "pl0/emd0/em03b.emd"),
+    ("d51a0fddd0d785b7b4918da7615e4619", "pl0/emd0/em03b.tim"),
+    ("dd592c77fb2eadd6259046930682ed4f", "pl0/emd0/em03e.emd"),
+    ("e0fd7b02739b8f2ba7b363cd27868ef0", "pl0/emd0/em03e.tim"),
+    ("bd3ca4f4c45a1b38db7c306744579ae5", "pl0/emd0/em03f.emd"),
+    ("34be3c0203aed4a7f9bb504b7ab95976", "pl0/emd0/em03f.tim"),
+    ("c68e845ffb355b5dbdb0220f1d457718", "pl0/emd0/em040.emd"),
+    ("e064a33abaa0ea2e037f2df3c8684586", "pl0/emd0/em040.tim"),
+    ("90e56a51ee2c250b5c8552efaa627a1e", "pl0/emd0/em041.emd"),
+    ("50c153de82d122a1b44e10db267ff015", "pl0/emd0/em041.tim"),
+    ("7da29a58770816df6d7d1dc31f6a63ac", "pl0/emd0/em042.emd"),
+    ("9845a7b6df4cbc7471a404144d373b03", "pl0/emd0/em042.tim"),
+    ("90e56a51ee2c250b5c8552efaa627a1e", "pl0/emd0/em043.emd"),
+    ("77a7d106562cb9530eabb8f722f18732", "pl0/emd0/em043.tim"),
+    ("dac46b9373ae893ac862da275abda750", "pl0/emd0/em044.emd"),
+    ("1e9adf1aa2301634d4846f1010b9e4f8", "pl0/emd0/em044.tim"),
+    ("b56695f236d17706abdcdbf18318cdf4", "pl0/emd0/em045.emd"),
+    ("01651b5abb5efe846a078f59ae048688", "pl0/emd0/em045.tim"),
+    ("dac46b9373ae893ac862da275abda750", "pl0/emd0/em046.emd"),
+    ("c3886b32d5dddbc7a73bca3ef3b2f3df", "pl0/emd0/em046.tim"),
+    ("88ca733bfe6ee5aacda66e6ecf47dfe1", "pl0/emd0/em047.emd"),
+    ("cbf238857adba90a47f364c48fcddaf2", "pl0/emd0/em047.tim"),
+    ("63dd2c1b864c3d9a98e49e278df6a992", "pl0/emd0/em048.emd"),
+    ("bccefccabaaf5839e7e19d413db6a9f1", "pl0/emd0/em048.tim"),
+    ("f556ba26e51e97c26af0e7d3e919ee16", "pl0/emd0/em049.tim"),
+    ("8e9c72a9d3733bcd0ed257808b85bf9d", "pl0/emd0/em04a.emd"),
+    ("4d0a6328f194e4f9386200f1582b905a", "pl0/emd0/em04a.tim"),
+    ("f0c3ca390cc4be5579c5320b809b7299", "pl0/emd0/em04b.emd"),
+    ("374a746bf9ece6544e3d6fe234a9e698", "pl0/emd0/em04b.tim"),
+    ("710c76fcdd808ca2dc1d0f2f3aee04a7", "pl0/emd0/em04c.tim"),
+    ("7f1cc178056133ae506fecc721f02e6c", "pl0/emd0/em04f.emd"),
+    ("a8b1f204345315c69062a6836891cb59", "pl0/emd0/em04f.tim"),
+    ("e3f108230e364c8eb3730500bb70b2e7", "pl0/emd0/em050.emd"),
+    ("97836541381842f855415f271661e214", "pl0/emd0/em050.tim"),
+    ("eb11c964a87eb2ed8009a026098e406a", "pl0/emd0/em051.emd"),
+    ("7ac74ba3ea23345671347930431fda6c", "pl0/emd0/em051.tim"),
+    ("e3f108230e364c8eb3730500bb70b2e7", "pl0/emd0/em054.emd"),
+    ("e69a5156b1834285d0a0c3e61abae6b7", "pl0/emd0/em054.tim"),
+    ("9217988693cf44925fb1d0aaf8993c21", "pl0/emd0/em055.emd"),
+    ("7b6d631b69d71c73adaffd05a5510a7d", "pl0/emd0/em055.tim"),
+    ("5489924c864d3e10d6a5f9048af4b393", "pl0/emd0/em058.emd"),
+    ("e4fea702c120d38842d998fbfcede435", "pl0/emd0/em058.tim"),
+    ("6525392db19f11575f3ac684f4005bac", "pl0/emd0/em059.emd"),
+    ("62a20d18355fdfe6a84a5de70fa97533", "pl0/emd0/em059.tim"),
+    ("5ed409a2f1d755dd5117912d6148a71a", "pl0/emd0/em05a.emd"),
+    ("8dc47a09016872406d7c9a6426aee2e4", "pl0/emd0/em05a.tim"),
+    ("b5e0f6d1e1f00b3dd93d938045849ef6", "pl0/emd0/em13a.tim"),
+    ("fbbeea85c53cb0b52a155ae54915feab", "pl1/emd1/em110.emd"),
+    ("281187a3081824c12fbcf73aeb759df9", "pl1/emd1/em111.emd"),
+    ("601059eb87629150b4bf666419eed0a0", "pl1/emd1/em112.emd"),
+    ("14e19d90eba7586f51d6641530a522f0", "pl1/emd1/em113.emd"),
+    ("4a77d3cec668dfc1a1d5ab22afa2d797", "pl1/emd1/em115.emd"),
+    ("c9a5ba480c01de3ce99de0ee591b0a9d", "pl1/emd1/em116.emd"),
+    ("4eb367f155f864ee82ee742b450ec43c", "pl1/emd1/em117.emd"),
+    ("f157bd9bf9f7d917d8d15ed7601bcbfc", "pl1/emd1/em118.emd"),
+    ("f157bd9bf9f7d917d8d15ed7601bcbfc", "pl1/emd1/em11e.emd"),
+    ("f157bd9bf9f7d917d8d15ed7601bcbfc", "pl1/emd1/em11f.emd"),
+    ("b95b5b435552e86c3b35da3036f12b5c", "pl1/emd1/em120.emd"),
+    ("356c4f4855b871398274922d8794f1aa", "pl1/emd1/em121.emd"),
+    ("bf168891667fcf313a46c177b4bc5cad", "pl1/emd1/em122.emd"),
+    ("05e49a8710100e53b4765ed867e252f9", "pl1/emd1/em123.emd"),
+    ("7b4ff1861a79e4bc1341aee310755101", "pl1/emd1/em124.emd"),
+    ("8b91976d410b964b87580ff384a8901a", "pl1/emd1/em125.emd"),
+    ("fcd60f4d49d46b86ed6b3ae116a81594", "pl1/emd1/em126.emd"),
+    ("71b1caa84ddbca135fb14a0437c1042e", "pl1/emd1/em127.emd"),
+    ("ba0fb709c16dda6444097af318c1ff39", "pl1/emd1/em128.emd"),
+    ("d7c505ceee8a4d782a592ac8099c8634", "pl1/emd1/em129.emd"),
+    ("b53e26dd014e48026d3e424653d865ab", "pl1/emd1/em12a.emd"),
+    ("a896bb6f7ff1592ae8057e664b4d60d8", "pl1/emd1/em12b.emd"),
+    ("37a2e00c405e30da738a3bcf3807df02", "pl1/emd1/em12c.emd"),
+    ("7e03d04e46fcf21f5dae9954e612a41c", "pl1/emd1/em12d.emd"),
+    ("7cae35510f0da78dcb1a4aa81416dd3c", "pl1/emd1/em12e.emd"),
+    ("f51a209ae70951c7ca351e75b6321fb5", "pl1/emd1/em130.emd"),
+    ("e01ad6106c9c38c064e9560d8b7cd282", "pl1/emd1/em131.emd"),
+    ("990fb36ecf6a3ee6649080cbf109475e", "pl1/emd1/em133.emd"),
+    ("1f0a78e4d7aa767afb994fbf59f4f21d", "pl1/emd1/em134.emd"),
+    ("3a49b091f8aded3c93540856349f5c5d", "pl1/emd1/em136.emd"),
+    ("9ca54ae9d3019f39f3c3986e37c0c6fb", "pl1/emd1/em137.emd"),
+    ("ec318c6e6f94dedb2187cd81a45a0637", "pl1/emd1/em138.emd"),
+    ("7cae35510f0da78dcb1a4aa81416dd3c", "pl1/emd1/em139.emd"),
+    ("527b4578a9ce18b17cbe21577d221c93", "pl1/emd1/em13a.emd"),
+    ("75189ca3adf7e8b01be9f00810ffc985", "pl1/emd1/em13b.emd"),
+    ("dd592c77fb2eadd6259046930682ed4f", "pl1/emd1/em13e.emd"),
+    ("bd3ca4f4c45a1b38db7c306744579ae5", "pl1/emd1/em13f.emd"),
+    ("2743183673067f15b56a431e7834a688", "pl1/emd1/em141.emd"),
+    ("b6ee62b485b3218aadb93a86bb17c049", "pl1/emd1/em142.emd"),
+    ("2743183673067f15b56a431e7834a688", "pl1/emd1/em143.emd"),
+    ("a8cff2b11a22f4e964ef03b51e8d51ff", "pl1/emd1/em148.emd"),
+    ("29377fdfc788152e1e9fdc88fe446a10", "pl1/emd1/em14a.emd"),
+)
+
+KNOWN_MD5_RE3 = (
+    ("3199387aa01f9b4483859d7bdff1ba99", "data/etc/capcom.tim"),
+    ("e66a2dd333f61ba00359b070c5f55e47", "data/etc/continue.tim"),
+    ("ee67bc522607a3c707d0be2b6215a76d", "data/etc/eidos.tim"),
+    ("9f2f16eeb762d31cd857d7e4b5792f56", "data/etc/filei.tim"),
+    ("9891a5bf8bdf355a450bbd19cb0c0e2e", "data/etc/radar.tim"),
+    ("1de0325d42dc7a70d80bbf43f3b4abc9", "data_a/pld/pl000.tim"),
+    ("53d47acf108f767564929a2507cc5616", "data_a/pld/pl006.tim"),
+    ("7ea884f111d98e29316e494bc4429936", "data_af/etc2/filegf03.tim"),
+    ("e633271dc934a5656cea1a89d47e8cda", "data_af/etc2/filegf04.tim"),
+    ("7f68a6076bda5be42804490fc524d4a6", "data_af/etc2/filegf05.tim"),
+    ("b36b78b4d08a9fceb3e154784eeea20f", "data_af/etc2/filegf06.tim"),
+    ("d73711137ae535f947e8abb35b9e5555", "data_af/etc2/filegf07.tim"),
+    ("78ea6982929d3798770ec97cece8efa2", "data_af/etc2/filegf08.tim"),
+    ("77e05992512b975e468a6464eefbcca3", "data_af/etc2/filegf09.tim"),
+    ("ac97d763a9b5d62a247ac3106085d733", "data_af/etc2/filegf10.tim"),
+    ("007aa157b73f3ede33d2c43925fa3905", "data_af/etc2/titlef03.tim"),
+    ("0187053a56e14d76f5358613b76440da", "data_au/etc2/filegu03.tim"),
+    ("a8298626dc79f0fe1371f9fa0f7a5c3f", "data_au/etc2/filegu04.tim"),
+    ("52e3f28b7ade94fbf6c734b06c65b088", "data_au/etc2/filegu05.tim"),
+    ("583cadf1d7f72fb8c0620730008a1132", "data_au/etc2/filegu06.tim"),
+    ("95361274b394b496d5d8d7f83f9a4ffa", "data_au/etc2/filegu07.tim"),
+    ("4bbf70625d883a076525311fdf27985d", "data_au/etc2/filegu08.tim"),
+    ("c9b4f780e38847c0566787f6fada6329", "data_au/etc2/filegu09.tim"),
+    ("f987f1d0ec9ed8b9da8e64c2cca0c130", "data_au/etc2/filegu10.tim"),
+    ("983a0b93e5fd771ed379e25b1c8de10d", "data_au/etc2/titleu03.tim"),
+    ("9dbfc72e924087799b692382d24acdc3", "data_ae/etc2/filege03.tim"),
+    ("a8298626dc79f0fe1371f9fa0f7a5c3f", "data_ae/etc2/filege04.tim"),
+    ("124c42bf6f479338a752397153e8ecc7", "data_ae/etc2/filege05.tim"),
+    ("c0f4bc5a5758953761ce40f4a77aad51", "data_ae/etc2/filege06.tim"),
+    ("3deda931b27840a69a822c209166a160", "data_ae/etc2/filege07.tim"),
+    ("4ff1465d9bfaa33d79b7d528e600a455", "data_ae/etc2/filege08.tim"),
+    ("acec10d5c4c4b1a5b67803afc3eb9951", "data_ae/etc2/filege09.tim"),
+    ("7495db72e68014becf3a01de8ff59d5a", "data_ae/etc2/filege10.tim"),
+    ("983a0b93e5fd771ed379e25b1c8de10d", "data_ae/etc2/titlee03.tim"),
+    ("060aee019f3f4af95682648d0d3d4a48", "data_f/etc2/core00f.tim"),
+    ("f6c102ae8c82d14ad4c9e28ea85df905", "data_f/etc2/died00f.tim"),
+    ("0682b60cb12ba23fe85fbc59be76901e", "data_f/etc2/fileif.tim"),
+    ("ea4a596937e502b991b1c1d984ea0c08", "data_f/etc2/jill_bgf.tim"),
+    ("da5ffe2f28f6bb2f369a900208c0b51e", "data_f/etc2/jill_obf.tim"),
+    ("b4abb0c6ca41115e7009cc4b3b9a05c1", "data_f/etc2/res0_bgf.tim"),
+    ("f3d53210b23328151dad7ed2725e0f92", "data_f/etc2/res0_obf.tim"),
+    ("c5549bc68a0b0717e5ea14505a81ca73", "data_f/etc2/res3_bgf.tim"),
+    ("e798f1d09e589e895c87848c4c5615bc", "data_f/etc2/res4_bgf.tim"),
+    ("d7e79a107a0be7676f340ab6480b9146", "data_f/etc2/res5_bgf.tim"),
+    ("d4c5520737e6a43633e64044252eb6d4", "data_f/etc2/sele_bgf.tim"),
+    ("3ddabd8f78e7ce68a78555d6374884d7", "data_f/etc2/sele_obf.tim"),
+    ("2f25df1830a829b7633ac03a06158c01", "data_f/etc2/stmain0f.tim"),
+    ("3b4fb7d190186ea6b370034228e5a2f9", "data_f/etc2/stmain1f.tim"),
+    ("ae858af6be0e745a544a0ddb62b37886", "data_f/etc2/stmain2f.tim"),
+    ("6ef1ddba2db5639d1c8ef19ab14127c6", "data_f/etc2/stmain3f.tim"),
+    ("6cf2a4173e18c999c06e4afbd1238da2", "data_f/etc2/stmojif.tim"),
+    ("0c4d429e7ae6cd14fa3a4a70f47e8bee", "data_f/etc2/texf.tim"),
+    ("a3e94b4fd87d5e1177eb79a1d51df32f", "data_f/etc2/warnf.tim"),
+    ("060aee019f3f4af95682648d0d3d4a48", "data_u/etc2/core00u.tim"),
+    ("c4e05c9e7bea68cff76ce917f64729b3", "data_u/etc2/died00u.tim"),
+    ("9f2f16eeb762d31cd857d7e4b5792f56", "data_u/etc2/fileiu.tim"),
+    ("ea4a596937e502b991b1c1d984ea0c08", "data_u/etc2/jill_bgu.tim"),
+    ("3e761cf7911c861bdf0d5222920c0ef3", "data_u/etc2/jill_obu.tim"),
+    ("b4abb0c6ca41115e7009cc4b3b9a05c1", "data_u/etc2/res0_bgu.tim"),
+    ("9201a0e1e8eb60ede2a6129a91f078d2", "data_u/etc2/res0_obu.tim"),
+    ("cac4563872acd7a385c72cc236fd8660", "data_u/etc2/res2_bgu.tim"),
+    ("c5549bc68a0b0717e5ea14505a81ca73", "data_u/etc2/res3_bgu.tim"),
+    ("f14c05a19be463198f2728237aa30971", "data_u/etc2/res4_bgu.tim"),
+    ("d7e79a107a0be7676f340ab6480b9146", "data_u/etc2/res5_bgu.tim"),
+    ("d4c5520737e6a43633e64044252eb6d4", "data_u/etc2/sele_bgu.tim"),
+    ("cc80746fbee129bf18501b5be2d504db", "data_u/etc2/sele_obu.tim"),
+    ("80821521d23a97dfcc930454de6bc67a", "data_u/etc2/stmain0u.tim"),
+    ("eb6a9933439aec065738482fffa188cf", "data_u/etc2/stmain1u.tim"),
+    ("1541018e0c6723ee8b8f0497234d2616", "data_u/etc2/stmain2u.tim"),
+    ("168d4a01eaf0fe54dfb8a7331d957575", "data_u/etc2/stmain3u.tim"),
+    ("1d2efac68cc5fc1c1d86aaa0126c43d1", "data_u/etc2/stmojiu.tim"),
+    ("d6f2241418311622eca1258f14a2a1c1", "data_u/etc2/texu.tim"),
+    ("eee1894d64e256144ff783327fd10e09", "data_u/etc2/warnu.tim"),
+    ("060aee019f3f4af95682648d0d3d4a48", "data_e/etc2/core00e.tim"),
+    ("c4e05c9e7bea68cff76ce917f64729b3", "data_e/etc2/died00e.tim"),
+    ("9f2f16eeb762d31cd857d7e4b5792f56", "data_e/etc2/fileie.tim"),
+    ("ea4a596937e502b991b1c1d984ea0c08", "data_e/etc2/jill_bge.tim"),
+    ("3e761cf7911c861bdf0d5222920c0ef3", "data_e/etc2/jill_obe.tim"),
+    ("b4abb0c6ca41115e7009cc4b3b9a05c1", "data_e/etc2/res0_bge.tim"),
+    ("9201a0e1e8eb60ede2a6129a91f078d2", "data_e/etc2/res0_obe.tim"),
+    ("c5549bc68a0b0717e5ea14505a81ca73", "data_e/etc2/res3_bge.tim"),
+    ("f14c05a19be463198f2728237aa30971", "data_e/etc2/res4_bge.tim"),
+    ("d7e79a107a0be7676f340ab6480b9146", "data_e/etc2/res5_bge.tim"),
+    ("d4c5520737e6a43633e64044252eb6d4", "data_e/etc2/sele_bge.tim"),
+    ("8a07218711bd2da04a9eef84ee55fb9b", "data_e/etc2/sele_obe.tim"),
+    ("80821521d23a97dfcc930454de6bc67a", "data_e/etc2/stmain0e.tim"),
+    ("eb6a9933439aec065738482fffa188cf", "data_e/etc2/stmain1e.tim"),
+    ("1541018e0c6723ee8b8f0497234d2616", "data_e/etc2/stmain2e.tim"),
+    ("168d4a01eaf0fe54dfb8a7331d957575", "data_e/etc2/stmain3e.tim"),
+    ("1d2efac68cc5fc1c1d86aaa0126c43d1", "data_e/etc2/stmojie.tim"),
+    ("d6f2241418311622eca1258f14a2a1c1", "data_e/etc2/texe.tim"),
+    ("eee1894d64e256144ff783327fd10e09", "data_e/etc2/warne.tim"),
+    ("9bcc78189acac849f6cda0986ce084d9", "room/emd/em10.emd"),
+    ("02613fdd2a9402284c7c906283d80973", "room/emd/em10.tim"),
+    ("b3172c3aa228533c637e328d84a4a0e7", "room/emd/em11.emd"),
+    ("0c29e033124028068ca56da61a19c4a7", "room/emd/em11.tim"),
+    ("c16bbc8652accffca210b3047dcaf810", "room/emd/em12.emd"),
+    ("7e04298f5a5adecb14b9d60c9b2d163e", "room/emd/em12.tim"),
+    ("523090faa3f1e3bc3842fda8c13a20fb", "room/emd/em13.emd"),
+    ("db00767cce785ef6da1c8e5755fbfe2f", "room/emd/em13.tim"),
+    ("6e8153cd2db6405aeb2671471b22bb35", "room/emd/em14.emd"),
+    ("1225b45f80f7a991830d39ec23fd3e20", "room/emd/em14.tim"),
+    ("318b4f532fd391a484ea28efaefa1c70", "room/emd/em15.emd"),
+    ("002bf41b7c8dab37cc177aba973b910f", "room/emd/em15.tim"),
+    ("3401c8a6295f9a965095377bef78c093", "room/emd/em16.emd"),
+    ("098a614f991bdaefdb706fac38900a89", "room/emd/em16.tim"),
+    ("4b46fb238b5078434093950b7d3539aa", "room/emd/em17.emd"),
+    ("a4acbb1a32c3301b9a722cf7f4d50f4a", "room/emd/em17.tim"),
+    ("ae9b192d93a9af6b9270cdd279d388c1", "room/emd/em18.emd"),
+    ("bd64827a53ac83376a37fb8540e42239", "room/emd/em18.tim"),
+    ("f62b85aa2410aba623052652978e9a4b", "room/emd/em19.emd"),
+    ("d04ef240fd3157785bd3f46feabc0de6", "room/emd/em19.tim"),
+    ("f8a39d03ed7f568b78cf5232a351f1d4", "room/emd/em1a.emd"),
+    ("47f3d7b46cc1e57d637ac328e17d7a26", "room/emd/em1a.tim"),
+    ("fa7e9e13ae269c1507c5abae56368f18", "room/emd/em1b.emd"),
+    ("d0188eb8a5e34bdd0f78a899e1b0bcc5", "room/emd/em1b.tim"),
+    ("f3bb3369dc66a3b3f44643a2fff9dec6", "room/emd/em1c.emd"),
+    ("8f37dfd58aab16ea2bb67d68529d5a21", "room/emd/em1c.tim"),
+    ("b01ebf1df508fb1d56910559c7251a11", "room/emd/em1d.emd"),
+    ("907c31e1adbe9807c256a4842cfb9a15", "room/emd/em1d.tim"),
+    ("3401c8a6295f9a965095377bef78c093", "room/emd/em1e.emd"),
+    ("098a614f991bdaefdb706fac38900a89", "room/emd/em1e.tim"),
+    ("c94f3ceb8c613d4f9ef4e3838fd68b26", "room/emd/em1f.emd"),
+    ("fcb5c49f6ebba4330c0376ed65b751f9", "room/emd/em1f.tim"),
+    ("0e1ec3e2b13de764b9b9cc9850eeb7e1", "room/emd/em20.emd"),
+    ("b8ad398255ae64ebe1eebb77ce0984a9", "room/emd/em20.tim"),
+    ("84446e90460e558418d500902f99bd0a", "room/emd/em21.emd"),
+    ("413c9653df474b05f18f778a6cf5a1a2", "room/emd/em21.tim"),
+    ("ad896f4aaefa49e3186ef388f3affdd8", "room/emd/em22.emd"),
+    ("aeaf4bac057e0b19b23e85a707bf4631", "room/emd/em22.tim"),
+    ("05c86b22e071ac58190219bba7af072c", "room/emd/em23.emd"),
+    ("77d6dc3597fedd07dee5c2d4fddc3ab6", "room/emd/em23.tim"),
+    ("6f168094b6c9838546398d9c21d0a055", "room/emd/em24.emd"),
+    ("6a5aae2906ea61bd978513811e7dc050", "room/emd/em24.tim"),
+    ("97d0268b25e62a84d1dfe51498e04a4d", "room/emd/em25.emd"),
+    ("33d63344a232dc5292c5e9d3188a293b", "room/emd/em25.tim"),
+    ("84dde72548a5b980242bd268271d0f3c", "room/emd/em26.emd"),
+    ("09a18a39781045f65c527c13ce6dbf3b", "room/emd/em26.tim"),
+    ("9311c8e236bc04939c2e4607a5b105b6", "room/emd/em27.emd"),
+    ("7514ff8bbcbaca75b2b87c2d3c61c343", "room/emd/em27.tim"),
+    ("6bb3c76fa7e079bfa59095bfedde0dc7", "room/emd/em28.emd"),
+    ("1dde25c43a8027bae6e3c221b88c909f", "room/emd/em28.tim"),
+    ("942cd7da477c36402c1d95f8badefa28", "room/emd/em2c.emd"),
+    ("9fd98d162d710fd39e1a2d19ef84b25f", "room/emd/em2c.tim"),
+    ("9aa73cd765be331e3b33e5325b767988", "room/emd/em2d.emd"),
+    ("c965e1faa886bde5f873a4d92da0b35b", "room/emd/em2d.tim"),
+    ("f1bb239b039b546ff02fdb656a133f8a", "room/emd/em2e.emd"),
+    ("4bbe791db00d84a618abce4d23d66d99", "room/emd/em2e.tim"),
+    ("ee2c79a51839e69a9677640f4d179f60", "room/emd/em2f.emd"),
+    ("b414d04bdb0fd4c4fb20927a1c85f4b8", "room/emd/em2f.tim"),
+    ("b3f81d8b8e638bb6bf7612f10b33d868", "room/emd/em30.emd"),
+    ("4cf5acb565dc57c9456f1961f6c3e284", "room/emd/em30.tim"),
+    ("ef3a11eae0d61dbfa7e2e620b698b0ca", "room/emd/em32.emd"),
+    ("a15eb28823b1463954861ba1100ca2b7", "room/emd/em32.tim"),
+    ("d26111f8fc18044000f655da29a5746b", "room/emd/em33.emd"),
+    ("a3c4eccccca8de15f006e7f6d13a6b7e", "room/emd/em33.tim"),
+    ("d820f094e6d85cc822dc1af3de626967", "room/emd/em34.emd"),
+    ("40c92c76cf55988fc8aaf6903fb74d6e", "room/emd/em34.tim"),
+    ("9f673280ee9bd2647eaec6c3512ba53b", "room/emd/em35.emd"),
+    ("fef483ea0d083f025528f572ced803b8", "room/emd/em35.tim"),
+    ("be080f67d85e8af8de3968f8cdccb502", "room/emd/em36.emd"),
+    ("f381d1228e1f293b4aba8815c77d0319", "room/emd/em36.tim"),
+    ("cb2caf355f68ba54faac06d8824db816", "room/emd/em37.emd"),
+    ("0166fe0b59d0ccd56ff6370a20d5cbe2", "room/emd/em37.tim"),
+    ("2d59fb9e12fc0bfd5f939e94dc4a215e", "room/emd/em38.emd"),
+    ("3d97aa2a862a825682faf8326185d151", "room/emd/em38.tim"),
+    ("13a0166a6bf6f57fdf5c0ae106aa7ca8", "room/emd/em39.emd"),
+    ("35203d7fc448e4a7b5398a9c52f9c840", "room/emd/em39.tim"),
+    ("1c6e07531be585a2cf09c2e27bca859c", "room/emd/em3a.emd"),
+    ("9043a2e9d4921f44d172adc219a2e1d7", "room/emd/em3a.tim"),
+    ("3bc3dac621d67b678141a3f606c303e2", "room/emd/em3b.emd"),
+    ("0166fe0b59d0ccd56ff6370a20d5cbe2", "room/emd/em3b.tim"),
+    ("85499323e9c8bf4887aeb1ba8bd49a50", "room/emd/em3e.emd"),
+    ("4a238804882f4fcacb9b20f13d117540", "room/emd/em3e.tim"),
+    ("f5efe027786879d0f4f24a438fa21edc", "room/emd/em3f.emd"),
+    ("4c32ccd33e33ea4bd640d6740b98f975", "room/emd/em3f.tim"),
+    ("7c3b495f2b1f9e1f4c23bc97b4e43f74", "room/emd/em40.emd"),
+    ("4edf797ab6cf75f49806499282b32ced", "room/emd/em40.tim"),
+    ("fb3b79cd7fc65baf6327c3574b8c551b", "room/emd/em50.emd"),
+    ("8a6b23c802dda1934922d00d5acfe3e8", "room/emd/em50.tim"),
+    ("f8dc87952885e36a41663189f3feaf56", "room/emd/em51.emd"),
+    ("bf68961bdd817cf8e827631d23127cef", "room/emd/em51.tim"),
+    ("10482a5caf2090c12d0481819bad5c4f", "room/emd/em52.emd"),
+    ("8ae1eb4e8c9a4b71dba96899da284397", "room/emd/em52.tim"),
+    ("e666720fd6d71c7acb9ab94bf12e43e0", "room/emd/em53.emd"),
+    ("58f6405de070393b1a1978fb2add9832", "room/emd/em53.tim"),
+    ("b756093ae4ecf24371ae578402cc4bd2", "room/emd/em54.emd"),
+    ("9cbfad29fbdb8b9c9c455840eab2d8bb", "room/emd/em54.tim"),
+    ("5ecff12c4ec3f4a3f7f5722c66b9755b", "room/emd/em55.emd"),
+    ("4bbe791db00d84a618abce4d23d66d99", "room/emd/em55.tim"),
+    ("152145fbf233f55128af760a289cf5b0", "room/emd/em56.emd"),
+    ("983c220257e26c614616d4892809eb79", "room/emd/em56.tim"),
+    ("fa75db12f62d6f89af75216e45c11758", "room/emd/em57.emd"),
+    ("b414d04bdb0fd4c4fb20927a1c85f4b8", "room/emd/em57.tim"),
+    ("95b9255cd0d01b927a750424a7580f3c", "room/emd/em58.emd"),
+    ("6589fe16175c3695c127baf1a5f7f571", "room/emd/em58.tim"),
+    ("a6ac51db0209ace9d332d9c22157104d", "room/emd/em59.emd"),
+    ("696356ddcf30d8245c915f6deada485d", "room/emd/em59.tim"),
+    ("c05d9862d6d259d36a2cfdf9b8c634cd", "room/emd/em5a.emd"),
+    ("db10b5519defebb6d388fa219d0985f3", "room/emd/em5a.tim"),
+    ("c07ca5c8773e7ef30a6b197d6f977729", "room/emd/em5b.emd"),
+    ("0ce4cd9daa73d3afb71e107aba1520d0", "room/emd/em5b.tim"),
+    ("80e51a1b7278e1578a4e1234c44e91df", "room/emd/em5c.emd"),
+    ("3d3e73855a963156f24b5f9049dd7d23", "room/emd/em5c.tim"),
+    ("f74bdc7cb7c1c08cd2012024affa321f", "room/emd/em5d.emd"),
+    ("dc777650bacc4d6855f223222511d3f2", "room/emd/em5d.tim"),
+    ("6a312fd033ebeaa92605f35f2cdebf39", "room/emd/em5e.emd"),
+    ("e02b686deeb531f82990e2105f7c9b75", "room/emd/em5e.tim"),
+    ("5584d19d51d1dd6321929743f9371c11", "room/emd/em5f.emd"),
+    ("5c7dbae23df4467d97c8ff2f3097bdb5", "room/emd/em5f.tim"),
+    ("103a8891cdae8eac38a7c33bda9ebbc0", "room/emd/em60.emd"),
+    ("e7b52f10d424975099864ab88fd6d963", "room/emd/em60.tim"),
+    ("83811e5554f05d45743a908becfbb5cc", "room/emd/em61.emd"),
+    ("b1e85ed30a337ef650619018994aa2b0", "room/emd/em61.tim"),
+    ("fbd62743ad76cddec47b783507809e55", "room/emd/em62.emd"),
+    ("4f7972b7572fb9b2946c6a8fee3d1626", "room/emd/em62.tim"),
+    ("b6a14ccaba32f6eea0a26d67d8ee3865", "room/emd/em63.emd"),
+    ("e349e9d3650ebd34b30f0a5061c13fd3", "room/emd/em63.tim"),
+    ("3fe9ce5b0c51a5f0d73a67bb6ae8b3bf", "room/emd/em64.emd"),
+    ("e129c22479b5c8b9c839f39a2e959afe", "room/emd/em64.tim"),
+    ("018fe203e7861de009795ef04271c85e", "room/emd/em65.emd"),
+    ("ee7ffde6488972d391ae862ad7d9a49a", "room/emd/em65.tim"),
+    ("de0a2d754501781550af8193d9d2ba2a", "room/emd/em66.emd"),
+    ("f8ce609e6c4f7f8f9ad79e4ad9066ac8", "room/emd/em66.tim"),
+    ("8ec7f6fb2ba954aa9b155bd10a814415", "room/emd/em67.emd"),
+    ("c540b4355f0463220407c9b28bf76a05", "room/emd/em67.tim"),
+    ("c07ca5c8773e7ef30a6b197d6f977729", "room/emd/em70.emd"),
+    ("20bf8d887b0ab13de60ad034412d55f0", "room/emd/em70.tim"),
+    ("fbd62743ad76cddec47b783507809e55", "room/emd/em71.emd"),
+    ("53d47acf108f767564929a2507cc5616", "room/emd/em71.tim"),
+    ("e94c394189a7ba9838499a14831ab55f", "room/emd08/em10.emd"),
+    ("02613fdd2a9402284c7c906283d80973", "room/emd08/em10.tim"),
+    ("9319e8f07a511de51fe97122260915de", "room/emd08/em11.emd"),
+    ("0c29e033124028068ca56da61a19c4a7", "room/emd08/em11.tim"),
+    ("ed4662ca2fa969fd817c912df883c145", "room/emd08/em12.emd"),
+    ("7e04298f5a5adecb14b9d60c9b2d163e", "room/emd08/em12.tim"),
+    ("1097f3636e29f3636e9913419c0e86fe", "room/emd08/em13.emd"),
+    ("db00767cce785ef6da1c8e5755fbfe2f", "room/emd08/em13.tim"),
+    ("909fe3a144469c5a54060c37818f3afa", "room/emd08/em14.emd"),
+    ("1225b45f80f7a991830d39ec23fd3e20", "room/emd08/em14.tim"),
+    ("6d4e63bdf331012f0efa85a7f0f1c7f3", "room/emd08/em15.emd"),
+    ("002bf41b7c8dab37cc177aba973b910f", "room/emd08/em15.tim"),
+    ("4de6fb76829ad287ef9bf5292e0e1462", "room/emd08/em16.emd"),
+    ("098a614f991bdaefdb706fac38900a89", "room/emd08/em16.tim"),
+    ("25e7b308734d35c3cd0ee49e914c1ae8", "room/emd08/em17.emd"),
+    ("a4acbb1a32c3301b9a722cf7f4d50f4a", "room/emd08/em17.tim"),
+    ("29295928b296beb71156436f1ffe45b8", "room/emd08/em18.emd"),
+    ("bd64827a53ac83376a37fb8540e42239", "room/emd08/em18.tim"),
+    ("5b94f8b24e43fc5833f4392d70f3dcfc", "room/emd08/em19.emd"),
+    ("d04ef240fd3157785bd3f46feabc0de6", "room/emd08/em19.tim"),
+    ("b9cdbbc179ffa4a7c025bb0cb9d8d511", "room/emd08/em1a.emd"),
+    ("47f3d7b46cc1e57d637ac328e17d7a26", "room/emd08/em1a.tim"),
+    ("e31177270c9b1ccca4ddaa6c0cf74705", "room/emd08/em1b.emd"),
+    ("d0188eb8a5e34bdd0f78a899e1b0bcc5", "room/emd08/em1b.tim"),
+    ("c4dc50f0c4d4a7f4ce4920eb772982c5", "room/emd08/em1c.emd"),
+    ("8f37dfd58aab16ea2bb67d68529d5a21", "room/emd08/em1c.tim"),
+    ("5238df561d645b7d94ca126c16a3468e", "room/emd08/em1d.emd"),
+    ("907c31e1adbe9807c256a4842cfb9a15", "room/emd08/em1d.tim"),
+    ("0f0a82e2e5c3cb26dac54e4e7f5bfa92", "room/emd08/em1e.emd"),
+    ("098a614f991bdaefdb706fac38900a89", "room/emd08/em1e.tim"),
+    ("aaf71ecbfb363a6c7a330a62a5e95a8a", "room/emd08/em1f.emd"),
+    ("fcb5c49f6ebba4330c0376ed65b751f9", "room/emd08/em1f.tim"),
+    ("371104bfcf44e95e5ada1af030755903", "room/emd08/em20.emd"),
+    ("b8ad398255ae64ebe1eebb77ce0984a9", "room/emd08/em20.tim"),
+    ("82bec8accce5a47bf44f5fa06a0ac55e", "room/emd08/em21.emd"),
+    ("413c9653df474b05f18f778a6cf5a1a2", "room/emd08/em21.tim"),
+    ("4db50dd8f49bd75a81239e0d96c582ff", "room/emd08/em22.emd"),
+    ("aeaf4bac057e0b19b23e85a707bf4631", "room/emd08/em22.tim"),
+    ("ec0bba0099f7d28979006066589eccc8", "room/emd08/em23.emd"),
+    ("77d6dc3597fedd07dee5c2d4fddc3ab6", "room/emd08/em23.tim"),
+    ("e4e2f5539874d814e67903198d863393", "room/emd08/em24.emd"),
+    ("6a5aae2906ea61bd978513811e7dc050", "room/emd08/em24.tim"),
+    ("97d0268b25e62a84d1dfe51498e04a4d", "room/emd08/em25.emd"),
+    ("33d63344a232dc5292c5e9d3188a293b", "room/emd08/em25.tim"),
+    ("84dde72548a5b980242bd268271d0f3c", "room/emd08/em26.emd"),
+    ("09a18a39781045f65c527c13ce6dbf3b", "room/emd08/em26.tim"),
+    ("d5afb99d8c826eec6519b6569616ac6f", "room/emd08/em27.emd"),
+    ("7514ff8bbcbaca75b2b87c2d3c61c343", "room/emd08/em27.tim"),
+    ("5c38f7a33b53507902638b93440591ab", "room/emd08/em28.emd"),
+    ("1dde25c43a8027bae6e3c221b88c909f", "room/emd08/em28.tim"),
+    ("a9a96c955f5b1fe804e1d93a3643e9a1", "room/emd08/em32.emd"),
+    ("a15eb28823b1463954861ba1100ca2b7", "room/emd08/em32.tim"),
+    ("140c686178a8ec05be929ffce0fbd2e1", "room/emd08/em34.emd"),
+    ("40c92c76cf55988fc8aaf6903fb74d6e", "room/emd08/em34.tim"),
+    ("d1cee2a89853c00c433b800dd42993eb", "room/emd08/em36.emd"),
+    ("f381d1228e1f293b4aba8815c77d0319", "room/emd08/em36.tim"),
+    ("cb2caf355f68ba54faac06d8824db816", "room/emd08/em37.emd"),
+    ("0166fe0b59d0ccd56ff6370a20d5cbe2", "room/emd08/em37.tim"),
+    ("1c6e07531be585a2cf09c2e27bca859c", "room/emd08/em3a.emd"),
+    ("9043a2e9d4921f44d172adc219a2e1d7", "room/emd08/em3a.tim"),
+    ("3bc3dac621d67b678141a3f606c303e2", "room/emd08/em3b.emd"),
+    ("0166fe0b59d0ccd56ff6370a20d5cbe2", "room/emd08/em3b.tim"),
+)
+
+
+def md5_file(file_path: str, chunk_size: int = MD5_CHUNK_SIZE) -> str: #vers 1
+    """Hex MD5 of a file - large chunks so hashlib runs without the GIL"""
+    digest = hashlib.md5()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def asset_region(path: str) -> str: #vers 1
+    """Region from the data_X folder - shared folders (data, data_a, room, pl0...) are 'common'"""
+    top = path.replace("\\", "/").lower().split("/")[0]
+    if top.startswith("data_") and top != "data_a":
+        return ASSET_REGIONS.get(top[-1], "common")
+    return "common"
+
+
+def asset_role(path: str) -> str: #vers 1
+    """Short role label from folder and extension"""
+    parts = path.replace("\\", "/").lower().split("/")
+    ext = os.path.splitext(parts[-1])[1]
+    kind = {".emd": "model", ".tim": "texture"}.get(ext, ext.lstrip(".") or "file")
+    folder = parts[-2] if len(parts) > 1 else ""
+    if folder.startswith("etc"):
+        role = "menu image" if ext == ".tim" else f"menu {kind}"
+    elif folder == "pld":
+        role = f"player {kind}"
+    elif folder.startswith("emd"):
+        role = f"enemy {kind}"
+    else:
+        role = kind
+    scenario = ASSET_SCENARIOS.get(parts[0])
+    return f"{role} ({scenario})" if scenario else role
+
+
+def find_asset_files(root: str, max_size: int = MAX_ASSET_SIZE) -> List[str]: #vers 1
+    """All files below root small enough to be in the tables, sorted"""
+    found = []
+    for dir_path, _, file_names in os.walk(root):
+        for name in file_names:
+            if name == ASSET_CACHE_FILENAME:
+                continue
+            file_path = os.path.join(dir_path, name)
+            if os.path.getsize(file_path) <= max_size:
+                found.append(file_path)
+    return sorted(found)
+
+
+class KnownAssets: #vers 1
+    """MD5 -> known game files table - built-in RE2/RE3 tables plus user additions"""
+
+    def __init__(self, builtin: bool = True): #vers 1
+        self._table: Dict[str, List[Tuple[str, str]]] = {}
+        if builtin:
+            for game, entries in (("RE2", KNOWN_MD5_RE2), ("RE3", KNOWN_MD5_RE3)):
+                for md5, path in entries:
+                    self.add(md5, path, game)
+
+    def __len__(self): #vers 1
+        return sum(len(matches) for matches in self._table.values())
+
+    def add(self, md5: str, path: str, game: str = ""): #vers 1
+        """Register one known file - the same digest may name several files"""
+        matches = self._table.setdefault(md5.lower(), [])
+        if (game, path) not in matches:
+            matches.append((game, path))
+
+    def load_json(self, json_path: str) -> int: #vers 1
+        """Merge {game: {md5: path}} from a JSON file, return entries read"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        count = 0
+        for game, entries in data.items():
+            for md5, path in entries.items():
+                self.add(md5, path, game)
+                count += 1
+        return count
+
+    def lookup(self, md5: str) -> List[Dict]: #vers 1
+        """Every known file with this digest, with region and role labels"""
+        return [{"game": game, "path": path, "region": asset_region(path), "role": asset_role(path)}
+                for game, path in self._table.get(md5.lower(), [])]
+
+
+class AssetIdentifier: #vers 2
+    """Hashes files on a thread pool and matches them against KnownAssets - digests cached by size/mtime"""
+
+    def __init__(self, known: Optional[KnownAssets] = None, cache_path: Optional[str] = None): #vers 1
+        """cache_path None keeps digests in memory only"""
+        self.known = known if known is not None else KnownAssets()
+        self.cache_path = cache_path
+        self.cache: Dict[str, Dict] = self._load_cache()
+
+    def _load_cache(self) -> Dict[str, Dict]: #vers 2
+        """Read digest cache, empty when missing or of another version"""
+        return load_json_store(self.cache_path, ASSET_CACHE_VERSION, "asset MD5 cache").get("files", {})
+
+    def _save_cache(self) -> bool: #vers 2
+        """Write digest cache in compact form"""
+        return save_json_store(self.cache_path, ASSET_CACHE_VERSION, {"files": self.cache}, "asset MD5 cache")
+
+    def identify(self, file_paths: List[str], max_workers: Optional[int] = None,
+                 progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]: #vers 1
+        """{'path', 'size', 'md5', 'matches'} per file in input order - errors in 'error'"""
+        results: List[Optional[Dict]] = [None] * len(file_paths)
+        pending = []
+        for index, file_path in enumerate(file_paths):
+            key = os.path.abspath(file_path)
+            try:
+                stat = os.stat(file_path)
+            except OSError as e:
+                results[index] = {"path": file_path, "error": str(e)}
+                continue
+            entry = self.cache.get(key)
+            if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+                pending.append((index, key, stat))
+                continue
+            results[index] = {"path": file_path, "size": stat.st_size, "md5": entry["md5"]}
+
+        if pending:
+            done = 0
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = {pool.submit(md5_file, file_paths[index]): (index, key, stat)
+                           for index, key, stat in pending}
+                for future in as_completed(futures):
+                    index, key, stat = futures[future]
+                    try:
+                        md5 = future.result()
+                        self.cache[key] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "md5": md5}
+                        results[index] = {"path": file_paths[index], "size": stat.st_size, "md5": md5}
+                    except OSError as e:
+                        results[index] = {"path": file_paths[index], "error": str(e)}
+                    done += 1
+                    if progress:
+                        progress(done, len(pending))
+            self._save_cache()
+
+        for result in results:
+            if "md5" in result:
+                result["matches"] = self.known.lookup(result["md5"])
+        return results
+
+    def identify_folder(self, root: str, max_workers: Optional[int] = None,
+                        progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]: #vers 1
+        """Identify every candidate file below root"""
+        return self.identify(find_asset_files(root), max_workers, progress)
@@ -0,0 +1,472 @@
+#this belongs in apps/methods/asset_vfs.py - Version: 4
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - Asset Virtual File System
+"""
+Asset Virtual File System - One read path for loose files, ROFS/SLD/BIN
+archives and ISO images (stands in for the per tool file handling of
+reevengi-tools file_functions.c). Containers are mounted under a name and
+addressed as 'name::inner/path'; plain paths are loose files. Reads go
+through one bounded block cache, so rereading an archive region is served
+from memory; ROFS/SLD files are depacked whole and served from the small
+LRU their archive already keeps, so they are never held twice.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+from apps.methods.bin_file import BIN_EXTENSION, BinArchive
+from apps.methods.iso_file import ISO_DATA_LENGTH, ISOImage, is_iso_image
+from apps.methods.rofs_file import RofsFileSystem
+from apps.methods.sld_file import SLDFile
+
+##Methods list -
+# join_vfs_path
+# split_vfs_path
+
+##class BlockCache: -
+# __init__
+# __len__
+# clear
+# get
+# put
+
+##class LooseSource: -
+# __init__
+# _full
+# close
+# exists
+# local_path
+# paths
+# read_range
+# size
+# stamp
+
+##class IsoSource: -
+# __init__
+# close
+# exists
+# paths
+# read_range
+# size
+# stamp
+
+##class BinSource: -
+# __init__
+# _index
+# close
+# exists
+# paths
+# read_range
+# size
+# stamp
+
+##class RofsSource: -
+# __init__
+# close
+# exists
+# paths
+# read_range
+# size
+# stamp
+
+##class SldSource: -
+# __init__
+# _index
+# close
+# exists
+# paths
+# read_range
+# size
+# stamp
+
+##class AssetVFS: -
+# __init__
+# __enter__
+# __exit__
+# _file_size
+# _resolve
+# close
+# exists
+# local_path
+# mount
+# mount_path
+# paths
+# read
+# unmount
+
+VFS_SEPARATOR = "::"
+VFS_BLOCK_SIZE = 0x10000                 # 64KB cache blocks
+VFS_CACHE_BYTES = 64 << 20
+
+
+def split_vfs_path(path: str) -> Tuple[str, str]: #vers 1
+    """'mount::inner' -> (mount, inner) - plain paths are ('', path)"""
+    if VFS_SEPARATOR in path:
+        mount, inner = path.split(VFS_SEPARATOR, 1)
+        return mount, inner.strip("/")
+    return "", path
+
+
+def join_vfs_path(mount: str, inner: str) -> str: #vers 1
+    return f"{mount}{VFS_SEPARATOR}{inner}" if mount else inner
+
+
+class BlockCache: #vers 1
+    """Thread-safe LRU of file blocks bounded by total bytes"""
+
+    def __init__(self, max_bytes: int = VFS_CACHE_BYTES): #vers 1
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._blocks: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self): #vers 1
+        return len(self._blocks)
+
+    def get(self, key: Tuple) -> Optional[bytes]: #vers 1
+        with self._lock:
+            block = self._blocks.get(key)
+            if block is not None:
+                self._blocks.move_to_end(key)
+            return block
+
+    def put(self, key: Tuple, block: bytes): #vers 1
+        with self._lock:
+            old = self._blocks.pop(key, None)
+            if old is not None:
+                self.used_bytes -= len(old)
+            self._blocks[key] = block
+            self.used_bytes += len(block)
+            while self.used_bytes > self.max_bytes and len(self._blocks) > 1:
+                _, dropped = self._blocks.popitem(last=False)
+                self.used_bytes -= len(dropped)
+
+    def clear(self): #vers 1
+        with self._lock:
+            self._blocks.clear()
+            self.used_bytes = 0
+
+
+class LooseSource: #vers 3
+    """Files on disk - below root, or absolute paths when root is None"""
+    whole_file = False
+
+    def __init__(self, root: Optional[str] = None): #vers 1
+        self.root = os.path.abspath(root) if root else None
+
+    def _full(self, path: str) -> str: #vers 1
+        return os.path.join(self.root, path) if self.root else path
+
+    def close(self): #vers 1
+        pass
+
+    def paths(self) -> List[str]: #vers 1
+        if not self.root:
+            return []
+        found = []
+        for dir_path, _, file_names in os.walk(self.root):
+            for name in file_names:
+                found.append(os.path.relpath(os.path.join(dir_path, name), self.root).replace(os.sep, "/"))
+        return sorted(found)
+
+    def exists(self, path: str) -> bool: #vers 1
+        return os.path.isfile(self._full(path))
+
+    def local_path(self, path: str) -> str: #vers 1
+        """On-disk path of a file - raises FileNotFoundError like a read would"""
+        full = self._full(path)
+        if not os.path.isfile(full):
+            raise FileNotFoundError(f"File not found: {full}")
+        return full
+
+    def size(self, path: str) -> int: #vers 1
+        return os.path.getsize(self._full(path))
+
+    def stamp(self, path: str): #vers 1
+        """Size and mtime - cached blocks of a changed file are never reused"""
+        stat = os.stat(self._full(path))
+        return (stat.st_size, stat.st_mtime_ns)
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes: #vers 1
+        with open(self._full(path), 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+
+
+class IsoSource: #vers 2
+    """ISO9660 image - ranges are read as whole sectors"""
+    whole_file = False
+
+    def __init__(self, iso: ISOImage): #vers 1
+        self.archive = iso
+
+    def close(self): #vers 1
+        self.archive.close()
+
+    def paths(self) -> List[str]: #vers 1
+        return self.archive.paths()
+
+    def exists(self, path: str) -> bool: #vers 1
+        try:
+            self.archive.file_info(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def size(self, path: str) -> int: #vers 1
+        return self.archive.file_info(path)["length"]
+
+    def stamp(self, path: str): #vers 1
+        return None
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes: #vers 1
+        info = self.archive.file_info(path)
+        end = min(offset + length, info["length"])
+        if end <= offset:
+            return b""
+        first = offset // ISO_DATA_LENGTH
+        count = (end + ISO_DATA_LENGTH - 1) // ISO_DATA_LENGTH - first
+        data = self.archive.read_sectors(info["lba"] + first, count)
+        start = offset - first * ISO_DATA_LENGTH
+        return bytes(data[start:start + end - offset])
+
+
+class BinSource: #vers 2
+    """RE2 BIN archive - entries addressed as 'NNN/NAME' (names may repeat)"""
+    whole_file = False
+
+    def __init__(self, archive: BinArchive): #vers 1
+        self.archive = archive
+
+    def _index(self, path: str) -> int: #vers 1
+        try:
+            return int(path.split("/", 1)[0])
+        except ValueError:
+            index = self.archive.find(path)
+            if index is None:
+                raise FileNotFoundError(f"BIN entry not found: {path}")
+            return index
+
+    def close(self): #vers 1
+        self.archive.close()
+
+    def paths(self) -> List[str]: #vers 1
+        return [f"{index:03d}/{name}" for index, name in enumerate(self.archive.names())]
+
+    def exists(self, path: str) -> bool: #vers 1
+        """Same lookup as reads - 'NNN/NAME' by index or a bare name"""
+        try:
+            return 0 <= self._index(path) < len(self.archive)
+        except FileNotFoundError:
+            return False
+
+    def size(self, path: str) -> int: #vers 1
+        return self.archive.entries[self._index(path)][1]
+
+    def stamp(self, path: str): #vers 1
+        return None
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes: #vers 1
+        return bytes(self.archive.get_entry(self._index(path))[offset:offset + length])
+
+
+class RofsSource: #vers 3
+    """ROFS archives - files are decrypted/depacked whole, RofsFileSystem caches them"""
+    whole_file = True
+
+    def __init__(self, rofs: RofsFileSystem): #vers 1
+        self.archive = rofs
+
+    def close(self): #vers 1
+        self.archive.close()
+
+    def paths(self) -> List[str]: #vers 1
+        return self.archive.paths()
+
+    def exists(self, path: str) -> bool: #vers 1
+        """Directory lookup only - the file is not depacked"""
+        try:
+            self.archive.file_info(path)
+        except KeyError:
+            return False
+        return True
+
+    def size(self, path: str) -> int: #vers 2
+        return self.archive.file_size(path)
+
+    def stamp(self, path: str): #vers 1
+        return None
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes: #vers 1
+        return self.archive.read(path)[offset:offset + length]
+
+
+class SldSource: #vers 3
+    """SLD mask archive - non-empty entries as 'NN.tim', depacked whole, SLDFile caches them"""
+    whole_file = True
+
+    def __init__(self, sld: SLDFile): #vers 1
+        self.archive = sld
+
+    def _index(self, path: str) -> int: #vers 1
+        try:
+            return int(os.path.splitext(path)[0])
+        except ValueError:
+            raise FileNotFoundError(f"SLD entry not found: {path}")
+
+    def close(self): #vers 1
+        self.archive.close()
+
+    def paths(self) -> List[str]: #vers 1
+        return [f"{index:02d}.tim" for index in range(len(self.archive)) if not self.archive.is_empty(index)]
+
+    def exists(self, path: str) -> bool: #vers 1
+        try:
+            index = self._index(path)
+        except FileNotFoundError:
+            return False
+        return 0 <= index < len(self.archive) and not self.archive.is_empty(index)
+
+    def size(self, path: str) -> int: #vers 1
+        return len(self.archive.get_entry(self._index(path)))
+
+    def stamp(self, path: str): #vers 1
+        return None
+
+    def read_range(self, path: str, offset: int, length: int) -> bytes: #vers 1
+        return self.archive.get_entry(self._index(path))[offset:offset + length]
+
+
+class AssetVFS: #vers 3
+    """Mount table over loose files and containers - every read goes through one shared block cache"""
+
+    def __init__(self, cache: Optional[BlockCache] = None): #vers 1
+        self.cache = cache if cache is not None else BlockCache()
+        self.mounts: Dict[str, Tuple[int, object]] = {"": (0, LooseSource())}
+        self._sizes: Dict[Tuple, int] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def mount(self, name: str, source) -> str: #vers 1
+        """Mount a source (or an ISOImage/BinArchive/RofsFileSystem/SLDFile) - replaces a mount of the same name"""
+        wrappers = {ISOImage: IsoSource, BinArchive: BinSource, RofsFileSystem: RofsSource, SLDFile: SldSource}
+        wrapper = wrappers.get(type(source))
+        if wrapper is not None:
+            source = wrapper(source)
+        if VFS_SEPARATOR in name:
+            raise ValueError(f"Mount name may not contain '{VFS_SEPARATOR}': {name}")
+        self.unmount(name)
+        with self._lock:
+            self.mounts[name] = (self._next_id, source)
+            self._next_id += 1
+        return name
+
+    def mount_path(self, path: str, name: Optional[str] = None) -> str: #vers 1
+        """Mount a folder, ROFS*.DAT, .sld, .bin (archive or CD image) or .iso by its type"""
+        name = name or os.path.basename(os.path.normpath(path))
+        ext = os.path.splitext(path)[1].lower()
+        if os.path.isdir(path):
+            return self.mount(name, LooseSource(path))
+        if ext == ".sld":
+            return self.mount(name, SLDFile(path))
+        if ext == ".dat" and os.path.basename(path).lower().startswith("rofs"):
+            return self.mount(name, RofsFileSystem([path]))
+        if ext == BIN_EXTENSION and not is_iso_image(path):
+            return self.mount(name, BinArchive(path))
+        return self.mount(name, ISOImage(path))
+
+    def unmount(self, name: str): #vers 1
+        """Close and drop a mount - its cached blocks age out of the LRU"""
+        if not name:
+            return
+        with self._lock:
+            entry = self.mounts.pop(name, None)
+            if entry is None:
+                return
+            mount_id = entry[0]
+            self._sizes = {key: size for key, size in self._sizes.items() if key[0] != mount_id}
+        entry[1].close()
+
+    def close(self): #vers 1
+        for name in [name for name in self.mounts if name]:
+            self.unmount(name)
+        self.cache.clear()
+
+    def _resolve(self, path: str) -> Tuple[int, object, str]: #vers 1
+        """(mount id, source, inner path) of a vfs path"""
+        mount, inner = split_vfs_path(path)
+        entry = self.mounts.get(mount)
+        if entry is None:
+            raise FileNotFoundError(f"Nothing mounted as '{mount}': {path}")
+        return entry[0], entry[1], inner
+
+    def _file_size(self, mount_id: int, source, inner: str, stamp) -> int: #vers 2
+        """File length - from the stamp of loose files, else asked once per file"""
+        if stamp is not None:
+            return stamp[0]
+        key = (mount_id, inner.lower())
+        size = self._sizes.get(key)
+        if size is None:
+            size = source.size(inner)
+            self._sizes[key] = size
+        return size
+
+    def exists(self, path: str) -> bool: #vers 2
+        """True when read would find the file - each source answers with its own lookup"""
+        try:
+            _, source, inner = self._resolve(path)
+        except FileNotFoundError:
+            return False
+        return source.exists(inner)
+
+    def local_path(self, path: str) -> Optional[str]: #vers 1
+        """On-disk path of a loose file (for loaders that mmap it in place), None for container entries"""
+        _, source, inner = self._resolve(path)
+        if isinstance(source, LooseSource):
+            return source.local_path(inner)
+        return None
+
+    def paths(self, mount: str) -> List[str]: #vers 1
+        """'mount::inner' paths of every file of one mount"""
+        _, source = self.mounts[mount]
+        return [join_vfs_path(mount, inner) for inner in source.paths()]
+
+    def read(self, path: str, offset: int = 0, length: Optional[int] = None) -> bytes: #vers 2
+        """Bytes of a file (or a range of it) - served from cached blocks where possible, whole-file
+        sources straight from their archive's own LRU"""
+        mount_id, source, inner = self._resolve(path)
+        stamp = source.stamp(inner)
+        size = self._file_size(mount_id, source, inner, stamp)
+        end = size if length is None else min(size, offset + length)
+        if end <= offset:
+            return b""
+        if source.whole_file:
+            return bytes(source.read_range(inner, offset, end - offset))
+
+        key_base = (mount_id, inner.lower(), stamp)
+        first = offset // VFS_BLOCK_SIZE
+        last = (end - 1) // VFS_BLOCK_SIZE
+        blocks: List[Optional[bytes]] = [self.cache.get(key_base + (index,)) for index in range(first, last + 1)]
+        missing = [i for i, block in enumerate(blocks) if block is None]
+        if missing:
+            # One read covering every missing block
+            read_start = (first + missing[0]) * VFS_BLOCK_SIZE
+            read_end = min(size, (first + missing[-1] + 1) * VFS_BLOCK_SIZE)
+            data = source.read_range(inner, read_start, read_end - read_start)
+            for block_start in range(read_start, read_end, VFS_BLOCK_SIZE):
+                index = block_start // VFS_BLOCK_SIZE
+                block = bytes(data[block_start - read_start:block_start - read_start + VFS_BLOCK_SIZE])
+                self.cache.put(key_base + (index,), block)
+                if first <= index <= last:
+                    blocks[index - first] = block
+
+        joined = b"".join(blocks)
+        start = offset - first * VFS_BLOCK_SIZE
+        return joined[start:start + end - offset]
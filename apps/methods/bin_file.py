@@ -0,0 +1,118 @@
+#this belongs in apps/methods/bin_file.py - Version: 1
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - RE2 BIN Archive
+"""
+RE2 BIN Archive - Resident Evil 2 PS1 dat/*.BIN archives (port of
+bin_header_t / list_files from reevengi-tools bin.c). The 0x800 byte entry
+headers are walked once over the memory-mapped file; entries come back as
+memoryview slices of the mapping, so listing and previewing copy nothing.
+"""
+
+import mmap
+import os
+import struct
+from typing import List, Optional, Tuple
+
+##Methods list -
+# parse_bin_header
+
+##class BinArchive: -
+# __init__
+# __enter__
+# __exit__
+# __len__
+# _build_index
+# close
+# find
+# get_entry
+# names
+
+BIN_HEADER_SIZE = 0x800
+BIN_HEADER_FORMAT = "<3I"             # id, length, blocks1
+BIN_NAME_OFFSET = 0x40                # after id, length, blocks1, unknown1[1+12]
+BIN_BLOCK_SIZE = 0x800
+BIN_END_ID = 0xFFFFFFFF
+BIN_EXTENSION = ".bin"
+
+
+def parse_bin_header(data, offset: int = 0) -> Tuple[int, int, int, str]: #vers 1
+    """(id, length, blocks1, filename) of one bin_header_t"""
+    entry_id, length, blocks = struct.unpack_from(BIN_HEADER_FORMAT, data, offset)
+    raw_name = bytes(data[offset + BIN_NAME_OFFSET:offset + BIN_HEADER_SIZE])
+    name = raw_name.split(b"\0", 1)[0].decode('ascii', 'replace').strip()
+    return entry_id, length, blocks, name
+
+
+class BinArchive: #vers 1
+    """Indexed BIN archive - (offset, length, id, name) per entry, data sliced from the mapping"""
+
+    def __init__(self, file_path: str): #vers 1
+        """Map archive and walk entry headers - no entry data is read yet"""
+        self.file_path = str(file_path)
+        self.file_size = os.path.getsize(self.file_path)
+        if self.file_size < BIN_HEADER_SIZE:
+            raise ValueError(f"Not a BIN archive (too small): {self.file_path}")
+        with open(self.file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self.entries: List[Tuple[int, int, int, str]] = self._build_index()
+        if not self.entries:
+            self.close()
+            raise ValueError(f"No BIN entries: {self.file_path}")
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def __len__(self): #vers 1
+        return len(self.entries)
+
+    def _build_index(self) -> List[Tuple[int, int, int, str]]: #vers 1
+        """Follow list_files - next header at blocks1 * 0x800, id 1 one block less, id 5/9 one more"""
+        entries = []
+        offset = 0
+        seen = set()
+        while 0 <= offset and offset + BIN_HEADER_SIZE <= self.file_size and offset not in seen:
+            seen.add(offset)
+            entry_id, length, blocks, name = parse_bin_header(self._view, offset)
+            if entry_id == BIN_END_ID or length == 0:
+                break
+            data_offset = offset + BIN_HEADER_SIZE
+            length = min(length, self.file_size - data_offset)
+            entries.append((data_offset, length, entry_id, name or f"{len(entries):04d}.dat"))
+
+            offset += blocks * BIN_BLOCK_SIZE
+            if entry_id == 1:
+                offset -= BIN_BLOCK_SIZE
+            elif entry_id in (5, 9):
+                offset += BIN_BLOCK_SIZE
+        return entries
+
+    def close(self): #vers 1
+        """Unmap the archive"""
+        if self._mmap is None:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Caller still holds an entry view - mapping is freed with it
+            pass
+        self._mmap = None
+
+    def names(self) -> List[str]: #vers 1
+        return [entry[3] for entry in self.entries]
+
+    def find(self, name: str) -> Optional[int]: #vers 1
+        """Index of the first entry with this filename (case insensitive)"""
+        name = name.lower()
+        for index, entry in enumerate(self.entries):
+            if entry[3].lower() == name:
+                return index
+        return None
+
+    def get_entry(self, index: int) -> memoryview: #vers 1
+        """Zero-copy slice of the mapping for one entry"""
+        offset, length, _, _ = self.entries[index]
+        return self._view[offset:offset + length]
@@ -0,0 +1,506 @@
+#this belongs in apps/methods/bss_file.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - BSS MDEC Background Decoder
+"""
+BSS MDEC Background Decoder - Resident Evil 2/3 PSX room backgrounds (port of
+vlc_depack from reevengi-tools depack_vlc.c, mdec_depack/mdec_surface from
+depack_mdec.c, the 320x240 defaults of bss2bmp.c and the mask depackers of
+depack_bsssld.c / bsssld2tim.c).
+Each camera frame is VLC decoded through one 17 bit lookup table into a
+(blocks, 64) coefficient array; dequantize, IDCT and YCbCr -> RGB then run
+for the whole frame at once as NumPy matrix products. Result is RGBA8888.
+The TIM mask stored after each background is depacked in place from the
+mapped file (RE2 or RE3 scheme) and kept per camera for the open room.
+"""
+
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from apps.methods.sld_file import depack_sld
+from apps.methods.tim_image import TimImage, is_tim
+
+##Methods list -
+# _build_ac_table
+# _build_dc_table
+# _code
+# _code0
+# _code1
+# _code2
+# _idct_matrix
+# decode_vlc
+# depack_bsssld
+# depack_bsssld_re2
+# mdec_to_rgba
+
+##class BSSFile: -
+# __init__
+# __enter__
+# __exit__
+# __len__
+# _cache_frame
+# _find_frames
+# close
+# find_mask_offset
+# get_frame
+# get_mask
+# get_masked_frame
+# get_rgba_bytes
+
+VLC_ID = 0x3800
+VLC_HEADER_FORMAT = "<4H"        # length, id, quant, version
+VLC_HEADER_SIZE = struct.calcsize(VLC_HEADER_FORMAT)
+VLC_PEEK_BITS = 17               # SBIT of vlc_decode
+
+BSS_WIDTH = 320                  # bss2bmp -w default
+BSS_HEIGHT = 240                 # bss2bmp -h default
+BSS_FRAME_SIZE = 0x10000         # one camera background per 64KB slot
+BSS_FRAME_CACHE_SIZE = 4
+
+BSSSLD_RE2 = 2                   # bsssld2tim default
+BSSSLD_RE3 = 3                   # bsssld2tim -re3
+BSSSLD_RE2_HEADER_SIZE = 6       # depacked length, 2 unknown bytes
+BSSSLD_MAX_SIZE = 0x40000        # sanity limit for the RE2 depacked length
+
+MDEC_BLOCKS_PER_MACROBLOCK = 6   # Cr, Cb, Y0 (TL), Y1 (TR), Y2 (BL), Y3 (BR)
+
+_ZSCAN = np.array([
+     0,  1,  8, 16,  9,  2,  3, 10,
+    17, 24, 32, 25, 18, 11,  4,  5,
+    12, 19, 26, 33, 40, 48, 41, 34,
+    27, 20, 13,  6,  7, 14, 21, 28,
+    35, 42, 49, 56, 57, 50, 43, 36,
+    29, 22, 15, 23, 30, 37, 44, 51,
+    58, 59, 52, 45, 38, 31, 39, 46,
+    53, 60, 61, 54, 47, 55, 62, 63,
+], dtype=np.intp)
+
+_BS_IQTAB = np.array([
+     2, 16, 19, 22, 26, 27, 29, 34,
+    16, 16, 22, 24, 27, 29, 34, 37,
+    19, 22, 26, 27, 29, 34, 34, 38,
+    22, 22, 26, 27, 29, 34, 37, 40,
+    22, 26, 27, 29, 32, 35, 40, 48,
+    26, 27, 29, 32, 35, 40, 48, 58,
+    26, 27, 29, 34, 38, 46, 56, 69,
+    27, 29, 35, 38, 46, 56, 69, 83,
+], dtype=np.float32)
+
+# Rows are (Y, Cb, Cr) -> columns (R, G, B), standard JFIF coefficients
+_YCBCR_TO_RGB = np.array([
+    [1.0, 1.0, 1.0],
+    [0.0, -0.3437, 1.772],
+    [1.402, -0.7143, 0.0],
+], dtype=np.float32)
+
+
+def _code1(run: int, level: int, bits: int) -> int: #vers 1
+    return (run << 10) | (level & 0x3FF) | (bits << 16)
+
+
+def _code(run: int, level: int, bits: int) -> List[int]: #vers 1
+    """CODE - sign bit follows the code"""
+    return [_code1(run, level, bits + 1), _code1(run, -level, bits + 1)]
+
+
+def _code0(run: int, level: int, bits: int) -> List[int]: #vers 1
+    return [_code1(run, level, bits)] * 2
+
+
+def _code2(run: int, level: int, bits: int) -> List[int]: #vers 1
+    return [_code1(run, level, bits + 1)] * 2
+
+
+VLC_EOB_CODE = _code1(63, 512, 2)
+VLC_ESCAPE_CODE = _code1(63, 0, 6)
+
+
+def _build_ac_table() -> List[int]: #vers 1
+    """Table B-14 sub-tables of vlc_decode merged into one 2^17 entry lookup (0 = invalid)"""
+    tab_next = (_code(0, 2, 4) + _code(2, 1, 4) + _code2(1, 1, 3) + _code2(1, -1, 3)
+                + _code0(63, 512, 2) * 4
+                + _code2(0, 1, 2) * 2 + _code2(0, -1, 2) * 2)
+    tab0 = (_code0(63, 0, 6) * 4
+            + _code2(2, 2, 7) + _code2(2, -2, 7) + _code2(9, 1, 7) + _code2(9, -1, 7)
+            + _code2(0, 4, 7) + _code2(0, -4, 7) + _code2(8, 1, 7) + _code2(8, -1, 7)
+            + _code2(7, 1, 6) * 2 + _code2(7, -1, 6) * 2
+            + _code2(6, 1, 6) * 2 + _code2(6, -1, 6) * 2
+            + _code2(1, 2, 6) * 2 + _code2(1, -2, 6) * 2
+            + _code2(5, 1, 6) * 2 + _code2(5, -1, 6) * 2
+            + _code(13, 1, 8) + _code(0, 6, 8) + _code(12, 1, 8) + _code(11, 1, 8)
+            + _code(3, 2, 8) + _code(1, 3, 8) + _code(0, 5, 8) + _code(10, 1, 8)
+            + _code2(0, 3, 5) * 4 + _code2(0, -3, 5) * 4
+            + _code2(4, 1, 5) * 4 + _code2(4, -1, 5) * 4
+            + _code2(3, 1, 5) * 4 + _code2(3, -1, 5) * 4)
+    tab1 = sum((_code(*c, 10) for c in ((16, 1), (5, 2), (0, 7), (2, 3),
+                                        (1, 4), (15, 1), (14, 1), (4, 2))), [])
+    tab2 = sum((_code(*c, 12) for c in ((0, 11), (8, 2), (4, 3), (0, 10), (2, 4), (7, 2), (21, 1), (20, 1),
+                                        (0, 9), (19, 1), (18, 1), (1, 5), (3, 3), (0, 8), (6, 2), (17, 1))), [])
+    tab3 = sum((_code(*c, 13) for c in ((10, 2), (9, 2), (5, 3), (3, 4), (2, 5), (1, 7), (1, 6), (0, 15),
+                                        (0, 14), (0, 13), (0, 12), (26, 1), (25, 1), (24, 1), (23, 1), (22, 1))), [])
+    tab4 = sum((_code(0, level, 14) for level in range(31, 15, -1)), [])
+    tab5 = sum((_code(*c, 15) for c in ((0, 40), (0, 39), (0, 38), (0, 37), (0, 36), (0, 35), (0, 34), (0, 33),
+                                        (0, 32), (1, 14), (1, 13), (1, 12), (1, 11), (1, 10), (1, 9), (1, 8))), [])
+    tab6 = sum((_code(*c, 16) for c in ((1, 18), (1, 17), (1, 16), (1, 15), (6, 3), (16, 2), (15, 2), (14, 2),
+                                        (13, 2), (12, 2), (11, 2), (31, 1), (30, 1), (29, 1), (28, 1), (27, 1))), [])
+
+    table = np.zeros(1 << VLC_PEEK_BITS, dtype=np.int64)
+    # (sub-table, code shift, first index) - same ranges as the if/else chain in vlc_decode
+    for entries, shift, first in ((tab_next, 12, 8), (tab0, 8, 8), (tab1, 6, 16), (tab2, 4, 32),
+                                  (tab3, 3, 32), (tab4, 2, 32), (tab5, 1, 32), (tab6, 0, 32)):
+        span = 1 << shift
+        table[first << shift:(first + len(entries)) << shift] = np.repeat(entries, span)
+    return table.tolist()
+
+
+def _build_dc_table(sizes: List[Tuple[int, int, List[int]]]) -> List[int]: #vers 1
+    """DC_Ytab0 / DC_UVtab0 - (bits, repeat, levels) rows expanded to a 6 bit lookup"""
+    table = []
+    for bits, repeat, levels in sizes:
+        for level in levels:
+            table += [_code1(0, level, bits)] * repeat
+    return table
+
+
+_AC_TABLE = _build_ac_table()
+_DC_Y_TABLE = _build_dc_table([(3, 8, [-1, 1]), (4, 4, [-3, -2, 2, 3]), (3, 8, [0]),
+                               (6, 1, [-7, -6, -5, -4, 4, 5, 6, 7])])
+_DC_UV_TABLE = _build_dc_table([(2, 16, [0]), (3, 8, [-1, 1]), (4, 4, [-3, -2, 2, 3]),
+                                (6, 1, [-7, -6, -5, -4, 4, 5, 6, 7])])
+
+
+def _idct_matrix() -> np.ndarray: #vers 1
+    """(64, 64) float32 - row major coefficients @ matrix = row major 8x8 pixels"""
+    freq = np.arange(8)[:, None]
+    pos = np.arange(8)[None, :]
+    basis = np.cos((2 * pos + 1) * freq * np.pi / 16) * 0.5
+    basis[0] *= np.sqrt(0.5)
+    return np.kron(basis, basis).astype(np.float32)
+
+
+_IDCT_MATRIX = _idct_matrix()
+
+
+def decode_vlc(data, offset: int = 0, block_count: Optional[int] = None) -> Tuple[np.ndarray, int, int]: #vers 1
+    """VLC frame -> ((blocks, 64) int32 quantized coefficients in row order, quant, end offset)"""
+    _, vlc_id, quant, version = struct.unpack_from(VLC_HEADER_FORMAT, data, offset)
+    if vlc_id != VLC_ID:
+        raise ValueError(f"Unknown vlc id: 0x{vlc_id:04X}")
+    if block_count is None:
+        block_count = ((BSS_WIDTH + 15) // 16) * ((BSS_HEIGHT + 15) // 16) * MDEC_BLOCKS_PER_MACROBLOCK
+
+    # 16 bit little endian words, MSB first - swap once so bits read straight from bytes
+    start = offset + VLC_HEADER_SIZE
+    word_count = (len(data) - start) // 2
+    src = np.frombuffer(data, dtype="<u2", count=word_count, offset=start).astype(">u2").tobytes()
+    src += b"\0\0\0\0"
+    total_bits = word_count * 16
+    from_bytes = int.from_bytes
+    pos = 0
+
+    def peek(num_bits):
+        byte = pos >> 3
+        return (from_bytes(src[byte:byte + 4], 'big') >> (32 - (pos & 7) - num_bits)) & ((1 << num_bits) - 1)
+
+    dc_values = np.zeros(block_count, dtype=np.int32)
+    ac_blocks, ac_index, ac_levels = [], [], []
+    ac_table = _AC_TABLE
+    last_dc = [0, 0, 0]
+    decoded = 0
+    stream_end = False
+
+    for block in range(block_count):
+        if stream_end or pos >= total_bits:
+            break
+        decoded = block + 1
+
+        # DC
+        if version == 2:
+            dc = peek(10)
+            pos += 10
+        else:
+            component = block % MDEC_BLOCKS_PER_MACROBLOCK
+            code = peek(6)
+            table, first_bit, dc_slot = ((_DC_Y_TABLE, 3, 2) if component >= 2 else
+                                         (_DC_UV_TABLE, 4, component))
+            if code < len(table):
+                entry = table[code]
+                last_dc[dc_slot] += (((entry & 0x3FF) ^ 0x200) - 0x200) * 4
+                pos += entry >> 16
+            else:
+                bit = first_bit
+                while peek(bit) & 1:
+                    bit += 1
+                    if bit > 11:
+                        raise ValueError("MDEC DC code too long")
+                if component >= 2:
+                    bit += 1
+                    num_bits = bit * 2 - 1
+                else:
+                    num_bits = bit * 2
+                value = peek(num_bits) & ((1 << bit) - 1)
+                if not value & (1 << (bit - 1)):
+                    value -= (1 << bit) - 1
+                last_dc[dc_slot] += value * 4
+                pos += num_bits
+            dc = last_dc[dc_slot]
+        dc_values[block] = ((dc & 0x3FF) ^ 0x200) - 0x200
+
+        # AC
+        k = 0
+        while True:
+            entry = ac_table[peek(VLC_PEEK_BITS)]
+            if entry == VLC_EOB_CODE:
+                pos += 2
+                break
+            if entry == 0:
+                # Invalid code - vlc_decode pads the rest of the frame with EOB
+                stream_end = True
+                break
+            if entry == VLC_ESCAPE_CODE:
+                pos += 6
+                entry = peek(16) | (16 << 16)
+            pos += entry >> 16
+            k += ((entry >> 10) & 0x3F) + 1
+            if k > 63:
+                raise ValueError(f"MDEC coefficient index out of range in block {block}")
+            ac_blocks.append(block)
+            ac_index.append(k)
+            ac_levels.append(((entry & 0x3FF) ^ 0x200) - 0x200)
+
+    coeffs = np.zeros((decoded, 64), dtype=np.int32)
+    coeffs[:, 0] = dc_values[:decoded]
+    if ac_blocks:
+        coeffs[ac_blocks, _ZSCAN[ac_index]] = ac_levels
+    end_offset = start + ((min(pos, total_bits) + 15) >> 4) * 2
+    return coeffs, quant, end_offset
+
+
+def depack_bsssld_re2(data, offset: int = 0) -> bytearray: #vers 1
+    """bsssld_depack_re2 - 4 bit run/offset copies and 5 bit literal runs, 0xFF ends"""
+    src = memoryview(data)
+    src_len = len(src)
+    buf_len = struct.unpack_from("<I", src, offset)[0]
+    if buf_len > BSSSLD_MAX_SIZE:
+        raise ValueError(f"BSS mask length out of range: {buf_len}")
+    pos = offset + BSSSLD_RE2_HEADER_SIZE
+    out = bytearray()
+
+    while pos < src_len and len(out) < buf_len:
+        while src[pos] & 0x10 == 0:
+            if pos + 1 >= src_len:
+                raise ValueError("BSS mask stream truncated")
+            start = src[pos]
+            back = 0x800 - (((start & 0xE0) << 3) | src[pos + 1])
+            count = start & 0x0F
+            if count == 0x0F:
+                count += src[pos + 2]
+                pos += 3
+            else:
+                pos += 2
+            count += 3
+            copy_from = len(out) - back
+            if copy_from < 0:
+                raise ValueError("BSS mask back reference before start of output")
+            if count <= back:
+                out += out[copy_from:copy_from + count]
+            else:
+                pattern = out[copy_from:]
+                out += (pattern * (count // back + 1))[:count]
+            if pos >= src_len:
+                raise ValueError("BSS mask stream truncated")
+        if src[pos] == 0xFF:
+            break
+        count = (~src[pos] & 0x0F) + 1
+        pos += 1
+        if count == 0x10:
+            count += src[pos]
+            pos += 1
+        out += src[pos:pos + count]
+        pos += count
+
+    # Output buffer is zero filled to the stored length
+    del out[buf_len:]
+    out += bytes(buf_len - len(out))
+    return out
+
+
+def depack_bsssld(data, offset: int = 0, game: int = BSSSLD_RE2) -> bytearray: #vers 1
+    """Depack a BSS mask with the RE2 or RE3 (same as sld_depack) scheme"""
+    if game == BSSSLD_RE3:
+        return depack_sld(data, offset)
+    if game == BSSSLD_RE2:
+        return depack_bsssld_re2(data, offset)
+    raise ValueError(f"Unknown BSS mask scheme: {game}")
+
+
+def mdec_to_rgba(coeffs: np.ndarray, quant: int, width: int = BSS_WIDTH,
+                 height: int = BSS_HEIGHT) -> np.ndarray: #vers 1
+    """(blocks, 64) quantized coefficients -> (height, width, 4) uint8 RGBA8888"""
+    columns = (width + 15) // 16
+    rows = (height + 15) // 16
+    macroblocks = columns * rows
+    needed = macroblocks * MDEC_BLOCKS_PER_MACROBLOCK
+    if len(coeffs) < needed:
+        coeffs = np.concatenate((coeffs, np.zeros((needed - len(coeffs), 64), dtype=coeffs.dtype)))
+
+    # Dequantize (DC has its own factor) then IDCT every block in one product
+    scale = _BS_IQTAB * np.float32(quant / 8.0)
+    scale[0] = _BS_IQTAB[0]
+    blocks = (coeffs[:needed].astype(np.float32) * scale) @ _IDCT_MATRIX
+    blocks = blocks.reshape(macroblocks, MDEC_BLOCKS_PER_MACROBLOCK, 8, 8)
+
+    luma = blocks[:, 2:].reshape(macroblocks, 2, 2, 8, 8).transpose(0, 1, 3, 2, 4).reshape(macroblocks, 16, 16)
+    chroma = blocks[:, :2].repeat(2, axis=2).repeat(2, axis=3)
+    ycbcr = np.stack((luma + 128.0, chroma[:, 1], chroma[:, 0]), axis=-1)
+    rgb = np.clip(np.rint(ycbcr @ _YCBCR_TO_RGB), 0, 255).astype(np.uint8)
+
+    # Macroblocks run top to bottom in 16 pixel columns
+    rgb = rgb.reshape(columns, rows, 16, 16, 3).transpose(1, 2, 0, 3, 4).reshape(rows * 16, columns * 16, 3)
+    rgba = np.full((height, width, 4), 255, dtype=np.uint8)
+    rgba[..., :3] = rgb[:height, :width]
+    return rgba
+
+
+class BSSFile: #vers 2
+    """Memory-mapped BSS archive - frame N is the background of camera N"""
+
+    def __init__(self, file_path: str, width: int = BSS_WIDTH, height: int = BSS_HEIGHT,
+                 game: Optional[int] = None): #vers 2
+        """Map file and find VLC frame headers - nothing is decoded yet; game None detects mask scheme"""
+        self.file_path = str(file_path)
+        self.file_size = os.path.getsize(self.file_path)
+        self.width = width
+        self.height = height
+        self.game = game
+        self._mmap = None
+        self._view = memoryview(b"")
+        if self.file_size:
+            with open(self.file_path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        self.frames: List[int] = self._find_frames()
+        if not self.frames:
+            self.close()
+            raise ValueError(f"No VLC frame found in {os.path.basename(self.file_path)}")
+        self._frame_cache: "OrderedDict[Tuple[int, bool], np.ndarray]" = OrderedDict()
+        self._frame_ends: Dict[int, int] = {}
+        # Masks are small - every camera of the room stays decoded once asked for
+        self._mask_cache: Dict[int, Optional[TimImage]] = {}
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def __len__(self): #vers 1
+        return len(self.frames)
+
+    def _find_frames(self) -> List[int]: #vers 1
+        """Offsets of frame slots that start with a VLC header"""
+        frames = []
+        for offset in range(0, self.file_size - VLC_HEADER_SIZE + 1, BSS_FRAME_SIZE):
+            _, vlc_id, _, version = struct.unpack_from(VLC_HEADER_FORMAT, self._view, offset)
+            if vlc_id == VLC_ID and version in (2, 3):
+                frames.append(offset)
+        return frames
+
+    def close(self): #vers 2
+        """Drop cached frames/masks and unmap the file"""
+        if getattr(self, "_frame_cache", None):
+            self._frame_cache.clear()
+            self._mask_cache.clear()
+        if self._mmap is None:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # numpy still references the mapping - freed with it
+            pass
+        self._mmap = None
+
+    def find_mask_offset(self, index: int) -> Optional[int]: #vers 1
+        """File offset of the mask after the VLC stream of a frame (None if the slot is empty)"""
+        if index not in self._frame_ends:
+            self.get_frame(index)
+        slot_end = min(self.frames[index] + BSS_FRAME_SIZE, self.file_size)
+        offset = (self._frame_ends[index] + 3) & ~3
+        # Skip zero padding between background and mask
+        while offset + 4 <= slot_end and not struct.unpack_from("<I", self._view, offset)[0]:
+            offset += 4
+        return offset if offset + 4 <= slot_end else None
+
+    def get_mask(self, index: int) -> Optional[TimImage]: #vers 1
+        """Mask TIM of one camera, depacked straight from the mapping - cached per room"""
+        if index in self._mask_cache:
+            return self._mask_cache[index]
+        mask = None
+        offset = self.find_mask_offset(index)
+        if offset is not None:
+            slot = self._view[:min(self.frames[index] + BSS_FRAME_SIZE, self.file_size)]
+            games = (self.game,) if self.game else (BSSSLD_RE2, BSSSLD_RE3)
+            for game in games:
+                try:
+                    data = depack_bsssld(slot, offset, game)
+                except (ValueError, IndexError, struct.error):
+                    continue
+                if is_tim(data):
+                    mask = TimImage(data=bytes(data))
+                    if self.game is None:
+                        # Rest of the room uses the same scheme
+                        self.game = game
+                    break
+        self._mask_cache[index] = mask
+        return mask
+
+    def get_masked_frame(self, index: int) -> np.ndarray: #vers 1
+        """Background with the mask TIM drawn over it at the top left (transparent colour skipped)"""
+        key = (index, True)
+        rgba = self._frame_cache.get(key)
+        if rgba is not None:
+            self._frame_cache.move_to_end(key)
+            return rgba
+        rgba = self.get_frame(index)
+        mask = self.get_mask(index)
+        if mask is not None:
+            rgba = rgba.copy()
+            height, width = min(mask.height, self.height), min(mask.width, self.width)
+            mask_rgba = mask.to_rgba()[:height, :width]
+            target = rgba[:height, :width]
+            np.copyto(target, mask_rgba, where=mask_rgba[..., 3:] > 0)
+            rgba.setflags(write=False)
+        self._cache_frame(key, rgba)
+        return rgba
+
+    def _cache_frame(self, key: Tuple[int, bool], rgba: np.ndarray): #vers 1
+        self._frame_cache[key] = rgba
+        while len(self._frame_cache) > BSS_FRAME_CACHE_SIZE:
+            self._frame_cache.popitem(last=False)
+
+    def get_frame(self, index: int) -> np.ndarray: #vers 2
+        """(height, width, 4) uint8 RGBA of one camera - small LRU, read only"""
+        key = (index, False)
+        rgba = self._frame_cache.get(key)
+        if rgba is not None:
+            self._frame_cache.move_to_end(key)
+            return rgba
+        if not 0 <= index < len(self.frames):
+            raise IndexError(f"BSS frame out of range: {index}")
+        offset = self.frames[index]
+        end = min(offset + BSS_FRAME_SIZE, self.file_size)
+        block_count = ((self.width + 15) // 16) * ((self.height + 15) // 16) * MDEC_BLOCKS_PER_MACROBLOCK
+        coeffs, quant, vlc_end = decode_vlc(self._view[offset:end], 0, block_count)
+        self._frame_ends[index] = offset + vlc_end
+        rgba = mdec_to_rgba(coeffs, quant, self.width, self.height)
+        rgba.setflags(write=False)
+        self._cache_frame(key, rgba)
+        return rgba
+
+    def get_rgba_bytes(self, index: int, masked: bool = False) -> bytes: #vers 2
+        """Packed RGBA8888 rows for QImage - masked draws the camera mask over the background"""
+        return (self.get_masked_frame(index) if masked else self.get_frame(index)).tobytes()
@@ -1,19 +1,24 @@
-#this belongs in components/Col_Editor/depends/col_3d_viewport.py - Version: 1
+#this belongs in components/Col_Editor/depends/col_3d_viewport.py - Version: 3
 # X-Seti - October20 2025 - IMG Factory 1.5 - COL 3D Viewport
 
 """
 COL 3D Viewport - OpenGL-based 3D rendering widget for COL collision models
 Renders vertices, faces, spheres, boxes, and shadow meshes with mouse navigation
+Clicks are picked by casting a ray through a CollisionBVH of the shown meshes
 Based on Steve M's COL Editor II approach using OpenGL
 """
 
 import math
 from typing import Optional, List, Tuple
+
+import numpy as np
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal
 from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QTransform
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 
+from apps.methods.collision_bvh import CollisionBVH
+
 try:
     from OpenGL.GL import *
     from OpenGL.GLU import *
@@ -33,16 +38,21 @@ QSurfaceFormat.setDefaultFormat(fmt)
 # _draw_bounding_box
 # _draw_checkerboard
 # _draw_grid
+# _draw_selection
 # _draw_shadow_mesh
 # draw_box
 # draw_face_mesh
+# draw_mesh_arrays
 # draw_sphere
 # fit_to_window
 # initializeGL
 # mouseMoveEvent
 # mousePressEvent
+# mouseReleaseEvent
 # pan
 # paintGL
+# pick
+# pick_ray
 # render_collision
 # reset_view
 # resizeGL
@@ -52,7 +62,9 @@ QSurfaceFormat.setDefaultFormat(fmt)
 # set_background_color
 # set_checkerboard_background
 # set_current_model
+# set_mesh_arrays
 # set_model
+# set_pick_bvh
 # set_view_options
 # setPixmap
 # update_display
@@ -65,7 +77,7 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
     
     model_selected = pyqtSignal(int)
     
-    def __init__(self, parent=None): #vers 1
+    def __init__(self, parent=None): #vers 2
         super().__init__(parent)
         
         # View state
@@ -110,6 +122,12 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
         self.current_model = None
         self.current_file = None
         self.selected_model_index = -1
+        self.mesh_arrays = []  # [(vertices int16 (N,3), triangles uint16 (T,3)), ...]
+        self.mesh_scale = 1.0 / 256.0
+        self.pick_meshes = []
+        self.pick_bvh = None  # CollisionBVH in mesh units, built on first click
+        self.selected_element = ()  # CollisionBVH.element() of the last pick
+        self.press_pos = QPoint()
         
         # Colors
         self.bg_color = QColor(30, 30, 30)
@@ -225,7 +243,7 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
         gluPerspective(45.0, aspect, 0.1, 1000.0)
         glMatrixMode(GL_MODELVIEW)
     
-    def paintGL(self): #vers 1
+    def paintGL(self): #vers 2
         """Render the 3D scene"""
         if not OPENGL_AVAILABLE:
             self._paint_fallback()
@@ -241,6 +259,11 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
         
         # Draw grid
         self._draw_grid()
+
+        if self.mesh_arrays:
+            self.draw_mesh_arrays()
+        if self.selected_element:
+            self._draw_selection()
         
         if not self.current_model:
             return
@@ -301,6 +324,77 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
         
         glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
     
+    def set_mesh_arrays(self, meshes, scale=None): #vers 2
+        """Set EMD style meshes - objects with int16 .vertices and uint16 .triangles"""
+        self.mesh_arrays = [(mesh.vertices, mesh.triangles) for mesh in meshes]
+        self.pick_meshes = list(meshes)
+        if scale is not None:
+            self.mesh_scale = scale
+        self.pick_bvh = None
+        self.selected_element = ()
+        self.update()
+
+    def set_pick_bvh(self, bvh): #vers 1
+        """Pick against a prebuilt CollisionBVH (e.g. SCA prisms + meshes) in mesh units"""
+        self.pick_bvh = bvh
+        self.selected_element = ()
+        self.update()
+
+    def pick_ray(self, x, y) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+        """Widget pixel -> (origin, direction) in mesh units - inverse of the paintGL/draw_mesh_arrays transform"""
+        width, height = max(self.width(), 1), max(self.height(), 1)
+        tan_half = math.tan(math.radians(45.0) / 2)
+        ndc_x = 2.0 * x / width - 1.0
+        ndc_y = 1.0 - 2.0 * y / height
+        eye_dir = np.array([ndc_x * tan_half * width / height, ndc_y * tan_half, -1.0])
+
+        ax, ay = math.radians(self.rotation_x), math.radians(self.rotation_y)
+        rot_x = np.array([[1, 0, 0], [0, math.cos(ax), -math.sin(ax)], [0, math.sin(ax), math.cos(ax)]])
+        rot_y = np.array([[math.cos(ay), 0, math.sin(ay)], [0, 1, 0], [-math.sin(ay), 0, math.cos(ay)]])
+        scale = np.array([self.mesh_scale, -self.mesh_scale, self.mesh_scale])
+        # mesh -> eye is translate(pan, -zoom) * rot_x * rot_y * scale
+        to_world = (rot_x @ rot_y).T
+        offset = np.array([self.pan_x, -self.pan_y, -self.zoom])
+        origin = (to_world @ -offset) / scale
+        direction = (to_world @ eye_dir) / scale
+        return origin, direction
+
+    def pick(self, x, y) -> int: #vers 1
+        """BVH primitive under a widget pixel, -1 if nothing is hit"""
+        if self.pick_bvh is None:
+            if not self.pick_meshes:
+                return -1
+            self.pick_bvh = CollisionBVH.from_scene(meshes=self.pick_meshes)
+        origin, direction = self.pick_ray(x, y)
+        _, prims = self.pick_bvh.ray_cast(origin, direction)
+        return int(prims[0])
+
+    def draw_mesh_arrays(self): #vers 1
+        """Draw array meshes straight from their buffers - no per-vertex calls"""
+        if self.show_wireframe:
+            glDisable(GL_LIGHTING)
+            glColor3f(self.wireframe_color.redF(), self.wireframe_color.greenF(),
+                     self.wireframe_color.blueF())
+            glPolygonMode(GL_FRONT_AND_BACK, GL_LINE)
+        else:
+            glEnable(GL_LIGHTING)
+            glColor3f(self.mesh_color.redF(), self.mesh_color.greenF(),
+                     self.mesh_color.blueF())
+            glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+
+        glPushMatrix()
+        glScalef(self.mesh_scale, -self.mesh_scale, self.mesh_scale)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        for vertices, triangles in self.mesh_arrays:
+            if len(triangles) == 0:
+                continue
+            glVertexPointer(3, GL_SHORT, 0, vertices)
+            glDrawElements(GL_TRIANGLES, triangles.size, GL_UNSIGNED_SHORT, triangles)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glPopMatrix()
+
+        glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+
     def draw_sphere(self, sphere): #vers 1
         """Draw collision sphere"""
         if not hasattr(sphere, 'center') or not hasattr(sphere, 'radius'):
@@ -389,6 +483,38 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
         glVertex3f(0, 0, 10)
         glEnd()
     
+    def _draw_selection(self): #vers 1
+        """Outline the picked triangle or SCA prism"""
+        bvh = self.pick_bvh
+        if bvh is None:
+            return
+        prim = None
+        if self.selected_element[0] == "sca":
+            prim = int(np.nonzero(bvh.box_ids == self.selected_element[1])[0][0])
+        elif self.selected_element[0] == "mesh":
+            matches = np.nonzero((bvh.triangle_ids == self.selected_element[1:]).all(axis=1))[0]
+            prim = bvh.num_boxes + int(matches[0]) if len(matches) else None
+        if prim is None:
+            return
+
+        glDisable(GL_LIGHTING)
+        glColor3f(1.0, 1.0, 0.0)
+        glPushMatrix()
+        glScalef(self.mesh_scale, -self.mesh_scale, self.mesh_scale)
+        if prim < bvh.num_boxes:
+            (x0, y0, z0), (x1, y1, z1) = bvh.boxes[prim]
+            for y in (y0, y1):
+                glBegin(GL_LINE_LOOP)
+                for x, z in ((x0, z0), (x1, z0), (x1, z1), (x0, z1)):
+                    glVertex3f(x, y, z)
+                glEnd()
+        else:
+            glBegin(GL_LINE_LOOP)
+            for corner in bvh.triangles[prim - bvh.num_boxes]:
+                glVertex3f(*corner)
+            glEnd()
+        glPopMatrix()
+
     def _draw_bounding_box(self, bbox): #vers 1
         """Draw bounding box"""
         if not bbox or not hasattr(bbox, 'min') or not hasattr(bbox, 'max'):
@@ -447,10 +573,22 @@ class COL3DViewport(QOpenGLWidget if OPENGL_AVAILABLE else QWidget):
         
         glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
     
-    def mousePressEvent(self, event): #vers 1
+    def mousePressEvent(self, event): #vers 2
         """Handle mouse press for rotation/zoom"""
         self.last_mouse_pos = event.pos()
+        self.press_pos = event.pos()
         self.mouse_button = event.button()
+
+    def mouseReleaseEvent(self, event): #vers 1
+        """Left click without drag picks the element under the cursor"""
+        moved = (event.pos() - self.press_pos).manhattanLength()
+        if event.button() == Qt.MouseButton.LeftButton and moved < 4:
+            prim = self.pick(event.pos().x(), event.pos().y())
+            self.selected_element = self.pick_bvh.element(prim) if prim >= 0 else ()
+            if prim >= 0:
+                self.model_selected.emit(prim)
+            self.update()
+        self.mouse_button = Qt.MouseButton.NoButton
     
     def mouseMoveEvent(self, event): #vers 1
         """Handle mouse movement for navigation"""
@@ -0,0 +1,242 @@
+#this belongs in apps/methods/collision_bvh.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - Collision BVH
+"""
+Collision BVH - Bounding volume hierarchy over SCA boundary prisms (the 2D
+boundaries extruded to a box) and EMD triangles. Nodes are kept in flat NumPy
+arrays and rays are traced as a batch: every step tests all live (ray, node)
+pairs at once, so viewport picking and room wide line-of-sight checks never
+loop over faces or rays in Python.
+"""
+
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from apps.methods.sca_collision import SCA_BLOCKING_TYPES
+
+##Methods list -
+# camera_line_of_sight
+# mesh_triangles
+# sca_prisms
+
+##class CollisionBVH: -
+# __init__
+# __len__
+# _build
+# _hit_boxes
+# _hit_triangles
+# _slabs
+# element
+# from_scene
+# line_of_sight
+# ray_cast
+
+BVH_LEAF_SIZE = 4
+SCA_PRISM_HEIGHT = 1800      # boundaries carry no height - prisms span floor (y 0) to this far up (-y)
+RAY_EPSILON = 1e-6
+
+
+def sca_prisms(collision, types: Optional[Sequence[int]] = SCA_BLOCKING_TYPES,
+               y_range: Tuple[float, float] = (-SCA_PRISM_HEIGHT, 0)) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+    """(N, 2, 3) min/max boxes of SCA boundaries and their boundary indices - all types if types is None"""
+    ids = np.arange(len(collision))
+    if types is not None:
+        ids = ids[np.isin(collision.types, types)]
+    rects = collision.boxes[ids].astype(np.float64)
+    boxes = np.empty((len(ids), 2, 3), dtype=np.float64)
+    boxes[:, 0] = np.stack((rects[:, 0], np.full(len(ids), y_range[0]), rects[:, 1]), axis=1)
+    boxes[:, 1] = np.stack((rects[:, 2], np.full(len(ids), y_range[1]), rects[:, 3]), axis=1)
+    return boxes, ids
+
+
+def mesh_triangles(meshes) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+    """(T, 3, 3) triangle corners of EmdMesh-like objects and (T, 2) (mesh, face) indices"""
+    corners, ids = [], []
+    for mesh_index, mesh in enumerate(meshes):
+        if not len(mesh.triangles):
+            continue
+        corners.append(mesh.vertices[mesh.triangles].astype(np.float64))
+        faces = np.arange(len(mesh.triangles))
+        ids.append(np.stack((np.full(len(faces), mesh_index), faces), axis=1))
+    if not corners:
+        return np.empty((0, 3, 3), dtype=np.float64), np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(corners), np.concatenate(ids)
+
+
+class CollisionBVH: #vers 2
+    """Static BVH - primitives 0..B-1 are boxes, B..B+T-1 triangles"""
+
+    def __init__(self, boxes: Optional[np.ndarray] = None, triangles: Optional[np.ndarray] = None,
+                 box_ids: Optional[np.ndarray] = None, triangle_ids: Optional[np.ndarray] = None,
+                 leaf_size: int = BVH_LEAF_SIZE): #vers 1
+        """boxes (B, 2, 3) min/max, triangles (T, 3, 3) - ids map primitives back to their source"""
+        self.boxes = np.empty((0, 2, 3)) if boxes is None else np.asarray(boxes, dtype=np.float64).reshape(-1, 2, 3)
+        self.triangles = (np.empty((0, 3, 3)) if triangles is None
+                          else np.asarray(triangles, dtype=np.float64).reshape(-1, 3, 3))
+        self.box_ids = np.arange(len(self.boxes)) if box_ids is None else np.asarray(box_ids)
+        self.triangle_ids = np.arange(len(self.triangles)) if triangle_ids is None else np.asarray(triangle_ids)
+        self.num_boxes = len(self.boxes)
+        self.leaf_size = max(int(leaf_size), 1)
+
+        prim_min = np.concatenate((self.boxes[:, 0], self.triangles.min(axis=1)))
+        prim_max = np.concatenate((self.boxes[:, 1], self.triangles.max(axis=1)))
+        self._build(prim_min, prim_max)
+
+    def __len__(self): #vers 1
+        return self.num_boxes + len(self.triangles)
+
+    @classmethod
+    def from_scene(cls, collision=None, meshes=None, types: Optional[Sequence[int]] = SCA_BLOCKING_TYPES,
+                   y_range: Tuple[float, float] = (-SCA_PRISM_HEIGHT, 0)) -> "CollisionBVH": #vers 1
+        """BVH over an SCACollision (as prisms) and/or a list of EMD meshes"""
+        boxes, box_ids = sca_prisms(collision, types, y_range) if collision is not None else (None, None)
+        triangles, triangle_ids = mesh_triangles(meshes) if meshes else (None, None)
+        return cls(boxes, triangles, box_ids, triangle_ids)
+
+    def _build(self, prim_min: np.ndarray, prim_max: np.ndarray): #vers 1
+        """Median split on the longest centroid axis - nodes stored depth first in flat arrays"""
+        count = len(prim_min)
+        self.order = np.arange(count)
+        centroids = (prim_min + prim_max) * 0.5
+        node_min, node_max, node_child, node_range = [], [], [], []
+
+        pending = [(0, count, -1, 0)]          # (start, end, parent, side)
+        while pending:
+            start, end, parent, side = pending.pop()
+            node = len(node_min)
+            if parent >= 0:
+                node_child[parent][side] = node
+            prims = self.order[start:end]
+            if len(prims):
+                node_min.append(prim_min[prims].min(axis=0))
+                node_max.append(prim_max[prims].max(axis=0))
+            else:
+                node_min.append(np.zeros(3))
+                node_max.append(np.full(3, -1.0))   # empty box never hit
+            node_child.append([-1, -1])
+            node_range.append((start, end - start))
+            if end - start <= self.leaf_size:
+                continue
+            extent = centroids[prims].max(axis=0) - centroids[prims].min(axis=0)
+            axis = int(np.argmax(extent))
+            mid = (end - start) // 2
+            split = np.argpartition(centroids[prims, axis], mid)
+            self.order[start:end] = prims[split]
+            pending.append((start + mid, end, node, 1))
+            pending.append((start, start + mid, node, 0))
+
+        self.node_min = np.array(node_min, dtype=np.float64).reshape(-1, 3)
+        self.node_max = np.array(node_max, dtype=np.float64).reshape(-1, 3)
+        self.node_child = np.array(node_child, dtype=np.int64).reshape(-1, 2)
+        self.node_range = np.array(node_range, dtype=np.int64).reshape(-1, 2)
+
+    @staticmethod
+    def _slabs(origins, inv_dirs, box_min, box_max) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+        """Entry/exit distance of each ray against its box - exit < entry means a miss"""
+        with np.errstate(invalid='ignore'):
+            t1 = (box_min - origins) * inv_dirs
+            t2 = (box_max - origins) * inv_dirs
+        # NaN (ray parallel to and on a slab plane) is ignored by fmin/fmax
+        near = np.fmax.reduce(np.fmin(t1, t2), axis=1)
+        far = np.fmin.reduce(np.fmax(t1, t2), axis=1)
+        return near, far
+
+    def _hit_boxes(self, origins, inv_dirs, prims, min_t: float = 0.0) -> np.ndarray: #vers 2
+        """Distance to the first box surface past min_t, inf on miss - a ray starting inside hits the exit face"""
+        near, far = self._slabs(origins, inv_dirs, self.boxes[prims, 0], self.boxes[prims, 1])
+        t = np.where(near > min_t, near, far)
+        return np.where((near <= far) & (t > min_t), t, np.inf)
+
+    def _hit_triangles(self, origins, directions, prims, min_t: float = 0.0) -> np.ndarray: #vers 2
+        """Moller-Trumbore for each (ray, triangle) pair, inf on miss or at t <= min_t"""
+        tri = self.triangles[prims]
+        edge1 = tri[:, 1] - tri[:, 0]
+        edge2 = tri[:, 2] - tri[:, 0]
+        pvec = np.cross(directions, edge2)
+        det = np.einsum('ij,ij->i', edge1, pvec)
+        valid = np.abs(det) > RAY_EPSILON
+        inv_det = np.where(valid, 1.0 / np.where(valid, det, 1.0), 0.0)
+        tvec = origins - tri[:, 0]
+        u = np.einsum('ij,ij->i', tvec, pvec) * inv_det
+        qvec = np.cross(tvec, edge1)
+        v = np.einsum('ij,ij->i', directions, qvec) * inv_det
+        t = np.einsum('ij,ij->i', edge2, qvec) * inv_det
+        hit = valid & (u >= 0) & (v >= 0) & (u + v <= 1) & (t > min_t)
+        return np.where(hit, t, np.inf)
+
+    def ray_cast(self, origins: np.ndarray, directions: np.ndarray, max_t: float = np.inf,
+                 min_t: float = 0.0) -> Tuple[np.ndarray, np.ndarray]: #vers 2
+        """Nearest hit in (min_t, max_t) of every ray - (t, primitive) with t in units of direction,
+        primitive -1 on miss"""
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        ray_count = len(origins)
+        best_t = np.full(ray_count, float(max_t))
+        best_prim = np.full(ray_count, -1, dtype=np.int64)
+        if not ray_count or not len(self):
+            return best_t, best_prim
+        with np.errstate(divide='ignore'):
+            inv_dirs = 1.0 / directions
+
+        rays = np.arange(ray_count)
+        nodes = np.zeros(ray_count, dtype=np.int64)
+        while rays.size:
+            near, far = self._slabs(origins[rays], inv_dirs[rays], self.node_min[nodes], self.node_max[nodes])
+            live = (near <= far) & (far > min_t) & (near <= best_t[rays])
+            rays, nodes = rays[live], nodes[live]
+
+            leaf = self.node_child[nodes, 0] < 0
+            leaf_rays, leaf_nodes = rays[leaf], nodes[leaf]
+            if leaf_rays.size:
+                starts, counts = self.node_range[leaf_nodes, 0], self.node_range[leaf_nodes, 1]
+                pair_rays = np.repeat(leaf_rays, counts)
+                offsets = np.arange(pair_rays.size) - np.repeat(np.cumsum(counts) - counts, counts)
+                pair_prims = self.order[np.repeat(starts, counts) + offsets]
+
+                t = np.full(pair_rays.size, np.inf)
+                is_box = pair_prims < self.num_boxes
+                if is_box.any():
+                    r = pair_rays[is_box]
+                    t[is_box] = self._hit_boxes(origins[r], inv_dirs[r], pair_prims[is_box], min_t)
+                if not is_box.all():
+                    r = pair_rays[~is_box]
+                    t[~is_box] = self._hit_triangles(origins[r], directions[r],
+                                                     pair_prims[~is_box] - self.num_boxes, min_t)
+
+                # Keep the closest pair per ray, then merge with what earlier leaves found
+                first = np.lexsort((t, pair_rays))
+                pair_rays, t, pair_prims = pair_rays[first], t[first], pair_prims[first]
+                head = np.concatenate(([True], pair_rays[1:] != pair_rays[:-1]))
+                r, t, p = pair_rays[head], t[head], pair_prims[head]
+                better = t < best_t[r]
+                best_t[r[better]] = t[better]
+                best_prim[r[better]] = p[better]
+
+            inner_rays, inner_nodes = rays[~leaf], nodes[~leaf]
+            rays = np.concatenate((inner_rays, inner_rays))
+            nodes = np.concatenate((self.node_child[inner_nodes, 0], self.node_child[inner_nodes, 1]))
+        return best_t, best_prim
+
+    def line_of_sight(self, starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: #vers 2
+        """(visible, blocking primitive) for each start -> end segment - touching either end does not block,
+        a start inside a prism is blocked when the segment leaves it"""
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        _, prims = self.ray_cast(starts, ends - starts, max_t=1.0 - RAY_EPSILON, min_t=RAY_EPSILON)
+        return prims < 0, prims
+
+    def element(self, prim: int) -> Tuple: #vers 1
+        """Source of a primitive - ('sca', boundary) or ('mesh', mesh, face) / ('triangle', index)"""
+        if prim < 0:
+            return ()
+        if prim < self.num_boxes:
+            return ("sca", int(self.box_ids[prim]))
+        source = self.triangle_ids[prim - self.num_boxes]
+        if np.ndim(source):
+            return ("mesh", int(source[0]), int(source[1]))
+        return ("triangle", int(source))
+
+
+def camera_line_of_sight(bvh: CollisionBVH, cameras: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+    """Eye -> target visibility of every rdt_camera_t in one batched cast - (visible, blocking primitive)"""
+    return bvh.line_of_sight(cameras["from"], cameras["to"])
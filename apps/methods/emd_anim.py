@@ -0,0 +1,220 @@
+#this belongs in apps/methods/emd_anim.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - EMD Animation Poses
+"""
+EMD Animation Poses - Resident Evil 1 skeleton + animation sections
+(emd_skel_header_t, emd1_skel_anim_t, emd1_anim_header_t). Each animation
+sequence is baked once into a (frames, bones, 4, 4) float32 matrix array so
+scrubbing or looping is an array lookup. Baked clips live in a byte-budgeted LRU.
+"""
+
+import struct
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from apps.methods.emd_model import EmdModel, read_emd1_directory
+
+##Methods list -
+# _rotation_matrices
+
+##class EmdSkeleton: -
+# __init__
+# _read_armature
+# _read_movements
+# _read_sequences
+
+##class PoseCache: -
+# __init__
+# clear
+# get
+# put
+
+##class EmdAnimation: -
+# __init__
+# bake_sequence
+# get_clip
+# get_pose
+# sequence_count
+
+EMD_SKEL_HEADER_FORMAT = "<4H"   # relpos_len, move_offset, count, move_size
+EMD_SKEL_HEADER_SIZE = struct.calcsize(EMD_SKEL_HEADER_FORMAT)
+EMD_ANGLE_UNITS = 4096.0          # PSX fixed point - 4096 per full turn
+EMD1_MAX_BONES = 15
+
+
+def _rotation_matrices(angles: np.ndarray) -> np.ndarray: #vers 1
+    """(..., 3) radians -> (..., 3, 3) rotation Rx @ Ry @ Rz"""
+    cx, cy, cz = np.cos(angles[..., 0]), np.cos(angles[..., 1]), np.cos(angles[..., 2])
+    sx, sy, sz = np.sin(angles[..., 0]), np.sin(angles[..., 1]), np.sin(angles[..., 2])
+    rot = np.empty(angles.shape[:-1] + (3, 3), dtype=np.float32)
+    rot[..., 0, 0] = cy * cz
+    rot[..., 0, 1] = -cy * sz
+    rot[..., 0, 2] = sy
+    rot[..., 1, 0] = sx * sy * cz + cx * sz
+    rot[..., 1, 1] = -sx * sy * sz + cx * cz
+    rot[..., 1, 2] = -sx * cy
+    rot[..., 2, 0] = -cx * sy * cz + sx * sz
+    rot[..., 2, 1] = cx * sy * sz + sx * cz
+    rot[..., 2, 2] = cx * cy
+    return rot
+
+
+class EmdSkeleton: #vers 1
+    """Bone hierarchy, movement table and animation sequences of an RE1 EMD"""
+
+    def __init__(self, data): #vers 1
+        directory = read_emd1_directory(data)
+        skel = directory["skeleton"]
+        relpos_len, move_offset, count, move_size = struct.unpack_from(EMD_SKEL_HEADER_FORMAT, data, skel)
+        if count == 0 or count > EMD1_MAX_BONES:
+            raise ValueError(f"EMD skeleton bone count out of range: {count}")
+
+        self.bone_count = count
+        self.relpos = np.frombuffer(data, dtype="<i2", count=count * 3,
+                                    offset=skel + EMD_SKEL_HEADER_SIZE).reshape(count, 3).astype(np.float32)
+        self.parents, self.order = self._read_armature(data, skel + relpos_len, count)
+        self.sequences = self._read_sequences(data, directory["animation"])
+        num_moves = max((int(seq.max()) for seq in self.sequences if len(seq)), default=-1) + 1
+        self.move_pos, self.move_angles = self._read_movements(
+            data, skel + move_offset, move_size, num_moves, count)
+
+    def _read_armature(self, data, base: int, count: int) -> Tuple[np.ndarray, List[int]]: #vers 1
+        """Walk emd_armature_header_t tree from bone 0 - parents first order"""
+        headers = np.frombuffer(data, dtype="<u2", count=count * 2, offset=base).reshape(count, 2)
+        parents = np.full(count, -1, dtype=np.int32)
+        order = []
+        stack = [0]
+        while stack:
+            bone = stack.pop()
+            if bone in order:
+                raise ValueError("EMD armature contains a cycle")
+            order.append(bone)
+            num_mesh, offset = int(headers[bone, 0]), int(headers[bone, 1])
+            children = data[base + offset:base + offset + num_mesh]
+            for child in reversed(bytes(children)):
+                if child >= count:
+                    raise ValueError(f"EMD armature child out of range: {child}")
+                parents[child] = bone
+                stack.append(child)
+        return parents, order
+
+    def _read_sequences(self, data, base: int) -> List[np.ndarray]: #vers 1
+        """emd1_anim_header_t table -> movement index per frame for each sequence"""
+        first_offset = struct.unpack_from("<H", data, base + 2)[0]
+        num_seq = first_offset // 4
+        headers = np.frombuffer(data, dtype="<u2", count=num_seq * 2, offset=base).reshape(num_seq, 2)
+        sequences = []
+        for frame_count, offset in headers:
+            frames = np.frombuffer(data, dtype="<u4", count=int(frame_count), offset=base + int(offset))
+            sequences.append((frames & 0xFFFF).astype(np.int32))
+        return sequences
+
+    def _read_movements(self, data, base: int, move_size: int, num_moves: int,
+                        count: int) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+        """emd1_skel_anim_t records (stride move_size) -> positions and bone angles"""
+        move_dtype = np.dtype({
+            "names": ["pos", "speed", "angles"],
+            "formats": [("<i2", (3,)), ("<i2", (3,)), ("<i2", (count, 3))],
+            "offsets": [0, 6, 12],
+            "itemsize": move_size,
+        })
+        moves = np.frombuffer(data, dtype=move_dtype, count=num_moves, offset=base)
+        return moves["pos"].astype(np.float32), moves["angles"].astype(np.float32)
+
+
+class PoseCache: #vers 1
+    """Thread-safe LRU of baked clips limited by total bytes"""
+
+    def __init__(self, budget_bytes: int = 64 * 1024 * 1024): #vers 1
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self._entries: "OrderedDict[Tuple[str, int], np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple[str, int]) -> Optional[np.ndarray]: #vers 1
+        with self._lock:
+            clip = self._entries.get(key)
+            if clip is not None:
+                self._entries.move_to_end(key)
+            return clip
+
+    def put(self, key: Tuple[str, int], clip: np.ndarray): #vers 1
+        """Store clip, evicting least recently used clips over budget"""
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.used_bytes -= old.nbytes
+            if clip.nbytes > self.budget_bytes:
+                return
+            self._entries[key] = clip
+            self.used_bytes += clip.nbytes
+            while self.used_bytes > self.budget_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.used_bytes -= evicted.nbytes
+
+    def clear(self): #vers 1
+        with self._lock:
+            self._entries.clear()
+            self.used_bytes = 0
+
+
+# Shared between models - keys carry the model file hash
+emd_pose_cache = PoseCache()
+
+
+class EmdAnimation: #vers 2
+    """Baked skeletal animation playback for one RE1 EmdModel"""
+
+    def __init__(self, model: EmdModel, cache: Optional[PoseCache] = None): #vers 1
+        if model.version != 1:
+            raise ValueError(f"Animation baking supports RE1 EMD only (got RE{model.version})")
+        self.model = model
+        self.cache = cache if cache is not None else emd_pose_cache
+        self.skeleton = EmdSkeleton(model.data)
+
+    @property
+    def sequence_count(self) -> int: #vers 1
+        return len(self.skeleton.sequences)
+
+    def bake_sequence(self, index: int) -> np.ndarray: #vers 2
+        """(frames, bones, 4, 4) float32 world matrices - one hierarchy walk per clip, bones not reached
+        from bone 0 keep their local transform"""
+        skel = self.skeleton
+        moves = skel.sequences[index]
+        frames = len(moves)
+        angles = skel.move_angles[moves] * np.float32(2.0 * np.pi / EMD_ANGLE_UNITS)
+
+        local = np.zeros((frames, skel.bone_count, 4, 4), dtype=np.float32)
+        local[..., :3, :3] = _rotation_matrices(angles)
+        local[..., :3, 3] = skel.relpos
+        local[:, 0, :3, 3] += skel.move_pos[moves]
+        local[..., 3, 3] = 1.0
+
+        world = local.copy()
+        for bone in skel.order:
+            parent = skel.parents[bone]
+            if parent >= 0:
+                np.matmul(world[:, parent], local[:, bone], out=world[:, bone])
+        return world
+
+    def get_clip(self, index: int) -> np.ndarray: #vers 1
+        """Baked clip, cached per model"""
+        if not 0 <= index < self.sequence_count:
+            raise IndexError(f"Animation sequence out of range: {index}")
+        key = (self.model.file_hash, index)
+        clip = self.cache.get(key)
+        if clip is None:
+            clip = self.bake_sequence(index)
+            clip.setflags(write=False)
+            self.cache.put(key, clip)
+        return clip
+
+    def get_pose(self, index: int, frame: int, loop: bool = True) -> np.ndarray: #vers 1
+        """(bones, 4, 4) matrices for one frame - wraps when looping, clamps otherwise"""
+        clip = self.get_clip(index)
+        if len(clip) == 0:
+            raise ValueError(f"Animation sequence {index} has no frames")
+        frame = frame % len(clip) if loop else min(max(frame, 0), len(clip) - 1)
+        return clip[frame]
@@ -0,0 +1,416 @@
+#this belongs in apps/methods/emd_model.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - EMD Model Loader
+"""
+EMD Model Loader - Resident Evil 1/2/3 EMD geometry (port of getEmdVersion and
+the emd1/emd2/emd3 model paths from reevengi-tools emd2xml.c).
+Every mesh is returned as contiguous int16 / uint16 NumPy arrays decoded with
+np.frombuffer, ready for glVertexPointer / glDrawElements or an exporter.
+Decoded meshes are kept in a shared LRU keyed by file hash and mesh index.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+##Methods list -
+# _assemble_mesh
+# _decode_emd1_mesh
+# _decode_emd2_mesh
+# _decode_emd3_mesh
+# _emd_directory_entry
+# _face_set
+# _vertex4_array
+# decode_emd_mesh
+# emd_mesh_count
+# get_emd_version
+# load_emd1_meshes
+# read_emd1_directory
+
+##class EmdMesh: -
+# __init__
+# __repr__
+# face_count
+# vertex_count
+
+##class EmdMeshCache: -
+# __init__
+# __len__
+# clear
+# get
+# put
+
+##class EmdModel: -
+# __init__
+# __repr__
+# data
+# get_mesh
+# get_meshes
+
+EMD_HEADER_FORMAT = "<2I"         # emd_header_t - offset, length (RE2/RE3 only)
+EMD1_DIRECTORY_FORMAT = "<4I"     # skeleton, animation, model, tim
+EMD1_DIRECTORY_SIZE = struct.calcsize(EMD1_DIRECTORY_FORMAT)
+EMD1_MODEL_HEADER_FORMAT = "<3I"  # length, unknown, count
+EMD1_MODEL_HEADER_SIZE = struct.calcsize(EMD1_MODEL_HEADER_FORMAT)
+EMD2_DIRECTORY_MODEL = 7          # emd2_directory_t.model
+EMD2_MODEL_HEADER_FORMAT = "<3I"  # length, unknown, count (2 entries per mesh)
+EMD3_DIRECTORY_MODEL = 14         # emd3_directory_t.model
+EMD3_MODEL_HEADER_FORMAT = "<2I"  # length, count
+
+# emd1_model_mesh_t
+EMD1_MESH_DTYPE = np.dtype([
+    ("vtx_offset", "<u4"), ("vtx_count", "<u4"),
+    ("nor_offset", "<u4"), ("nor_count", "<u4"),
+    ("tri_offset", "<u4"), ("tri_count", "<u4"),
+    ("dummy", "<u4"),
+])
+
+# emd1_model_triangle_t
+EMD1_TRIANGLE_DTYPE = np.dtype([
+    ("unknown", "<u4"),
+    ("tu0", "u1"), ("tv0", "u1"), ("clutid", "<u2"),
+    ("tu1", "u1"), ("tv1", "u1"), ("page", "<u2"),
+    ("tu2", "u1"), ("tv2", "u1"), ("dummy", "<u2"),
+    ("n0", "<u2"), ("v0", "<u2"),
+    ("n1", "<u2"), ("v1", "<u2"),
+    ("n2", "<u2"), ("v2", "<u2"),
+])
+
+# emd2_model_object_t - triangle part then quad part
+_EMD2_PART = [("vtx_offset", "<u4"), ("vtx_count", "<u4"), ("nor_offset", "<u4"),
+              ("nor_count", "<u4"), ("face_offset", "<u4"), ("face_count", "<u4"),
+              ("tex_offset", "<u4")]
+EMD2_OBJECT_DTYPE = np.dtype([("triangle", _EMD2_PART), ("quad", _EMD2_PART)])
+EMD2_TRIANGLE_DTYPE = np.dtype([("n0", "<u2"), ("v0", "<u2"), ("n1", "<u2"), ("v1", "<u2"),
+                                ("n2", "<u2"), ("v2", "<u2")])
+EMD2_TRIANGLE_TEX_DTYPE = np.dtype([
+    ("tu0", "u1"), ("tv0", "u1"), ("clutid", "<u2"),
+    ("tu1", "u1"), ("tv1", "u1"), ("page", "<u2"),
+    ("tu2", "u1"), ("tv2", "u1"), ("dummy", "<u2"),
+])
+EMD2_QUAD_DTYPE = np.dtype([("n0", "<u2"), ("v0", "<u2"), ("n1", "<u2"), ("v1", "<u2"),
+                            ("n2", "<u2"), ("v2", "<u2"), ("n3", "<u2"), ("v3", "<u2")])
+EMD2_QUAD_TEX_DTYPE = np.dtype([
+    ("tu0", "u1"), ("tv0", "u1"), ("clutid", "<u2"),
+    ("tu1", "u1"), ("tv1", "u1"), ("page", "<u2"),
+    ("tu2", "u1"), ("tv2", "u1"), ("dummy0", "<u2"),
+    ("tu3", "u1"), ("tv3", "u1"), ("dummy1", "<u2"),
+])
+
+# emd3_model_object_t
+EMD3_OBJECT_DTYPE = np.dtype([
+    ("vtx_offset", "<u4"), ("nor_offset", "<u4"), ("vtx_count", "<u4"),
+    ("tri_offset", "<u4"), ("quad_offset", "<u4"),
+    ("tri_count", "<u2"), ("quad_count", "<u2"),
+])
+EMD3_TRIANGLE_DTYPE = np.dtype([
+    ("tu0", "u1"), ("tv0", "u1"), ("page", "u1"), ("dummy0", "u1"),
+    ("tu1", "u1"), ("tv1", "u1"), ("clutid", "u1"), ("v0", "u1"),
+    ("tu2", "u1"), ("tv2", "u1"), ("v1", "u1"), ("v2", "u1"),
+])
+EMD3_QUAD_DTYPE = np.dtype([
+    ("tu0", "u1"), ("tv0", "u1"), ("page", "u1"), ("dummy0", "u1"),
+    ("tu1", "u1"), ("tv1", "u1"), ("clutid", "u1"), ("dummy1", "u1"),
+    ("tu2", "u1"), ("tv2", "u1"), ("v0", "u1"), ("v1", "u1"),
+    ("tu3", "u1"), ("tv3", "u1"), ("v2", "u1"), ("v3", "u1"),
+])
+
+# PSX quads are drawn as (0, 1, 2) + (1, 3, 2)
+QUAD_SPLIT = np.array([[0, 1, 2], [1, 3, 2]], dtype=np.intp)
+
+
+class EmdMesh: #vers 2
+    """Decoded mesh - all arrays are C-contiguous, quads are also split into triangles"""
+
+    def __init__(self, vertices: np.ndarray, normals: np.ndarray, triangles: np.ndarray,
+                 normal_indices: np.ndarray, uvs: np.ndarray, tex_page: np.ndarray,
+                 clut: np.ndarray, quads: Optional[np.ndarray] = None): #vers 2
+        self.vertices = vertices              # (N, 3) int16
+        self.normals = normals                # (N, 3) int16
+        self.triangles = triangles            # (T, 3) uint16 vertex indices
+        self.normal_indices = normal_indices  # (T, 3) uint16
+        self.uvs = uvs                        # (T, 3, 2) uint8
+        self.tex_page = tex_page              # (T,) uint16
+        self.clut = clut                      # (T,) uint16
+        self.quads = quads if quads is not None else np.empty((0, 4), dtype=np.uint16)
+
+    def __repr__(self): #vers 1
+        return f"<EmdMesh vertices={self.vertex_count} faces={self.face_count}>"
+
+    @property
+    def vertex_count(self) -> int: #vers 1
+        return len(self.vertices)
+
+    @property
+    def face_count(self) -> int: #vers 1
+        return len(self.triangles)
+
+
+def read_emd1_directory(data) -> dict: #vers 1
+    """Directory is the last 16 bytes of an RE1 EMD"""
+    if len(data) < EMD1_DIRECTORY_SIZE:
+        raise ValueError(f"EMD too small: {len(data)} bytes")
+    skeleton, animation, model, tim = struct.unpack_from(
+        EMD1_DIRECTORY_FORMAT, data, len(data) - EMD1_DIRECTORY_SIZE)
+    return {"skeleton": skeleton, "animation": animation, "model": model, "tim": tim}
+
+
+def _vertex4_array(data, offset: int, count: int) -> np.ndarray: #vers 1
+    """emd_vertex4_t run -> contiguous (count, 3) int16, pad column dropped"""
+    raw = np.frombuffer(data, dtype="<i2", count=count * 4, offset=offset).reshape(count, 4)
+    return np.ascontiguousarray(raw[:, :3])
+
+
+def get_emd_version(data) -> int: #vers 1
+    """RE1 has no emd_header_t - RE2/RE3 header offset + length*4 equals file size"""
+    if len(data) >= 8:
+        hdr_offset, hdr_length = struct.unpack_from(EMD_HEADER_FORMAT, data, 0)
+        if hdr_offset + hdr_length * 4 == len(data):
+            return 2 if hdr_length == 8 else 3
+    return 1
+
+
+def _face_set(faces, tex, corners: int, normal_fields: bool = True) -> Dict: #vers 1
+    """Gather vertex/normal indices from faces and uvs, page, clut from tex records"""
+    v_idx = np.stack([faces["v%d" % i] for i in range(corners)], axis=1).astype(np.uint16)
+    if normal_fields:
+        n_idx = np.stack([faces["n%d" % i] for i in range(corners)], axis=1).astype(np.uint16)
+    else:
+        n_idx = v_idx
+    uvs = np.stack([np.stack([tex["tu%d" % i], tex["tv%d" % i]], axis=1)
+                    for i in range(corners)], axis=1).astype(np.uint8)
+    return {
+        "v": v_idx,
+        "n": n_idx,
+        "uv": uvs,
+        "page": (tex["page"].astype(np.uint16) << 1) & 0xFF,
+        "clut": tex["clutid"].astype(np.uint16) & 3,
+    }
+
+
+def _assemble_mesh(pools: List[Tuple[np.ndarray, np.ndarray, Optional[Dict], Optional[Dict]]]) -> EmdMesh: #vers 1
+    """Merge (vertices, normals, tri_faces, quad_faces) pools into one EmdMesh"""
+    vertices, normals = [], []
+    tri_v, tri_n, tri_uv, tri_page, tri_clut, quads = [], [], [], [], [], []
+    v_base = n_base = 0
+    for pool_vertices, pool_normals, tri_faces, quad_faces in pools:
+        for faces in (tri_faces, quad_faces):
+            if faces is None or len(faces["v"]) == 0:
+                continue
+            if faces["v"].max() >= len(pool_vertices) or faces["n"].max() >= max(len(pool_normals), 1):
+                raise ValueError("EMD face index out of range")
+        if tri_faces is not None:
+            tri_v.append(tri_faces["v"] + v_base)
+            tri_n.append(tri_faces["n"] + n_base)
+            tri_uv.append(tri_faces["uv"])
+            tri_page.append(tri_faces["page"])
+            tri_clut.append(tri_faces["clut"])
+        if quad_faces is not None:
+            quads.append(quad_faces["v"] + v_base)
+            tri_v.append((quad_faces["v"][:, QUAD_SPLIT] + v_base).reshape(-1, 3))
+            tri_n.append((quad_faces["n"][:, QUAD_SPLIT] + n_base).reshape(-1, 3))
+            tri_uv.append(quad_faces["uv"][:, QUAD_SPLIT].reshape(-1, 3, 2))
+            tri_page.append(np.repeat(quad_faces["page"], 2))
+            tri_clut.append(np.repeat(quad_faces["clut"], 2))
+        vertices.append(pool_vertices)
+        normals.append(pool_normals)
+        v_base += len(pool_vertices)
+        n_base += len(pool_normals)
+
+    def join(parts, shape, dtype):
+        if not parts:
+            return np.empty(shape, dtype=dtype)
+        return np.ascontiguousarray(np.concatenate(parts).astype(dtype, copy=False))
+
+    return EmdMesh(
+        join(vertices, (0, 3), np.int16),
+        join(normals, (0, 3), np.int16),
+        join(tri_v, (0, 3), np.uint16),
+        join(tri_n, (0, 3), np.uint16),
+        join(tri_uv, (0, 3, 2), np.uint8),
+        join(tri_page, (0,), np.uint16),
+        join(tri_clut, (0,), np.uint16),
+        join(quads, (0, 4), np.uint16),
+    )
+
+
+def _emd_directory_entry(data, index: int) -> int: #vers 1
+    """RE2/RE3 directory lives at emd_header_t.offset"""
+    dir_offset = struct.unpack_from("<I", data, 0)[0]
+    return struct.unpack_from("<I", data, dir_offset + index * 4)[0]
+
+
+def emd_mesh_count(data, version: int) -> int: #vers 1
+    """Number of meshes in the model section"""
+    if version == 1:
+        model_offset = read_emd1_directory(data)["model"]
+        return struct.unpack_from(EMD1_MODEL_HEADER_FORMAT, data, model_offset)[2]
+    if version == 2:
+        model_offset = _emd_directory_entry(data, EMD2_DIRECTORY_MODEL)
+        return struct.unpack_from(EMD2_MODEL_HEADER_FORMAT, data, model_offset)[2] >> 1
+    if version == 3:
+        model_offset = _emd_directory_entry(data, EMD3_DIRECTORY_MODEL)
+        return struct.unpack_from(EMD3_MODEL_HEADER_FORMAT, data, model_offset)[1]
+    raise ValueError(f"Unknown EMD version: {version}")
+
+
+def _decode_emd1_mesh(data, index: int) -> EmdMesh: #vers 1
+    """RE1 - offsets relative to the mesh table after emd1_model_header_t"""
+    model_offset = read_emd1_directory(data)["model"]
+    base = model_offset + EMD1_MODEL_HEADER_SIZE
+    entry = np.frombuffer(data, dtype=EMD1_MESH_DTYPE, count=1,
+                          offset=base + index * EMD1_MESH_DTYPE.itemsize)[0]
+    vertices = _vertex4_array(data, base + int(entry["vtx_offset"]), int(entry["vtx_count"]))
+    normals = _vertex4_array(data, base + int(entry["nor_offset"]), int(entry["nor_count"]))
+    tri = np.frombuffer(data, dtype=EMD1_TRIANGLE_DTYPE, count=int(entry["tri_count"]),
+                        offset=base + int(entry["tri_offset"]))
+    return _assemble_mesh([(vertices, normals, _face_set(tri, tri, 3), None)])
+
+
+def _decode_emd2_mesh(data, index: int) -> EmdMesh: #vers 1
+    """RE2 - separate triangle and quad pools, textures in parallel arrays"""
+    model_offset = _emd_directory_entry(data, EMD2_DIRECTORY_MODEL)
+    base = model_offset + struct.calcsize(EMD2_MODEL_HEADER_FORMAT)
+    obj = np.frombuffer(data, dtype=EMD2_OBJECT_DTYPE, count=1,
+                        offset=base + index * EMD2_OBJECT_DTYPE.itemsize)[0]
+    pools = []
+    for part, face_dtype, tex_dtype, corners in (
+            ("triangle", EMD2_TRIANGLE_DTYPE, EMD2_TRIANGLE_TEX_DTYPE, 3),
+            ("quad", EMD2_QUAD_DTYPE, EMD2_QUAD_TEX_DTYPE, 4)):
+        entry = obj[part]
+        vertices = _vertex4_array(data, base + int(entry["vtx_offset"]), int(entry["vtx_count"]))
+        normals = _vertex4_array(data, base + int(entry["nor_offset"]), int(entry["nor_count"]))
+        count = int(entry["face_count"])
+        faces = np.frombuffer(data, dtype=face_dtype, count=count, offset=base + int(entry["face_offset"]))
+        tex = np.frombuffer(data, dtype=tex_dtype, count=count, offset=base + int(entry["tex_offset"]))
+        face_set = _face_set(faces, tex, corners)
+        pools.append((vertices, normals, face_set, None) if corners == 3 else (vertices, normals, None, face_set))
+    return _assemble_mesh(pools)
+
+
+def _decode_emd3_mesh(data, index: int) -> EmdMesh: #vers 1
+    """RE3 - one pool, byte vertex indices, normal index == vertex index"""
+    model_offset = _emd_directory_entry(data, EMD3_DIRECTORY_MODEL)
+    base = model_offset + struct.calcsize(EMD3_MODEL_HEADER_FORMAT)
+    obj = np.frombuffer(data, dtype=EMD3_OBJECT_DTYPE, count=1,
+                        offset=base + index * EMD3_OBJECT_DTYPE.itemsize)[0]
+    vtx_count = int(obj["vtx_count"])
+    vertices = _vertex4_array(data, base + int(obj["vtx_offset"]), vtx_count)
+    normals = _vertex4_array(data, base + int(obj["nor_offset"]), vtx_count)
+    tri = np.frombuffer(data, dtype=EMD3_TRIANGLE_DTYPE, count=int(obj["tri_count"]),
+                        offset=base + int(obj["tri_offset"]))
+    quad = np.frombuffer(data, dtype=EMD3_QUAD_DTYPE, count=int(obj["quad_count"]),
+                         offset=base + int(obj["quad_offset"]))
+    return _assemble_mesh([(vertices, normals,
+                            _face_set(tri, tri, 3, normal_fields=False),
+                            _face_set(quad, quad, 4, normal_fields=False))])
+
+
+_MESH_DECODERS = {1: _decode_emd1_mesh, 2: _decode_emd2_mesh, 3: _decode_emd3_mesh}
+
+
+def decode_emd_mesh(data, version: int, index: int) -> EmdMesh: #vers 1
+    """Decode a single mesh of any EMD version"""
+    count = emd_mesh_count(data, version)
+    if not 0 <= index < count:
+        raise IndexError(f"EMD mesh index out of range: {index} (meshes: {count})")
+    return _MESH_DECODERS[version](data, index)
+
+
+def load_emd1_meshes(data) -> List[EmdMesh]: #vers 2
+    """Decode all meshes of an RE1 model section (directory entry 2)"""
+    return [_decode_emd1_mesh(data, i) for i in range(emd_mesh_count(data, 1))]
+
+
+class EmdMeshCache: #vers 1
+    """Thread-safe LRU of decoded meshes keyed by (file_hash, mesh_index)"""
+
+    def __init__(self, max_entries: int = 256): #vers 1
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, int], EmdMesh]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self): #vers 1
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, int]) -> Optional[EmdMesh]: #vers 1
+        with self._lock:
+            mesh = self._entries.get(key)
+            if mesh is not None:
+                self._entries.move_to_end(key)
+            return mesh
+
+    def put(self, key: Tuple[str, int], mesh: EmdMesh): #vers 1
+        with self._lock:
+            self._entries[key] = mesh
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self): #vers 1
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every EmdModel - revisiting a model never reparses it
+emd_mesh_cache = EmdMeshCache()
+
+# (path, size, mtime_ns) -> (file_hash, version, mesh_count), lets revisits skip reading the file
+_file_info_cache: "OrderedDict[Tuple[str, int, int], Tuple[str, int, int]]" = OrderedDict()
+_FILE_INFO_LIMIT = 1024
+
+
+class EmdModel: #vers 1
+    """EMD model of any game version with cached mesh decoding"""
+
+    def __init__(self, file_path: Optional[str] = None, data=None,
+                 cache: Optional[EmdMeshCache] = None): #vers 1
+        """Open from a path or from bytes already in memory"""
+        if file_path is None and data is None:
+            raise ValueError("EmdModel needs file_path or data")
+        self.file_path = file_path
+        self.cache = cache if cache is not None else emd_mesh_cache
+        self._data = data
+        self._info_key = None
+
+        if data is None:
+            stat = os.stat(file_path)
+            self._info_key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+            info = _file_info_cache.get(self._info_key)
+            if info is not None:
+                self.file_hash, self.version, self.mesh_count = info
+                return
+
+        self.file_hash = hashlib.sha1(self.data).hexdigest()
+        self.version = get_emd_version(self.data)
+        self.mesh_count = emd_mesh_count(self.data, self.version)
+        if self._info_key is not None:
+            _file_info_cache[self._info_key] = (self.file_hash, self.version, self.mesh_count)
+            while len(_file_info_cache) > _FILE_INFO_LIMIT:
+                _file_info_cache.popitem(last=False)
+
+    def __repr__(self): #vers 1
+        return f"<EmdModel RE{self.version} meshes={self.mesh_count} {self.file_path or ''}>"
+
+    @property
+    def data(self): #vers 1
+        """File bytes - only read when a mesh is not cached"""
+        if self._data is None:
+            with open(self.file_path, 'rb') as f:
+                self._data = f.read()
+        return self._data
+
+    def get_mesh(self, index: int) -> EmdMesh: #vers 1
+        key = (self.file_hash, index)
+        mesh = self.cache.get(key)
+        if mesh is None:
+            mesh = decode_emd_mesh(self.data, self.version, index)
+            self.cache.put(key, mesh)
+        return mesh
+
+    def get_meshes(self) -> List[EmdMesh]: #vers 1
+        return [self.get_mesh(i) for i in range(self.mesh_count)]
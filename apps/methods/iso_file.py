@@ -0,0 +1,229 @@
+#this belongs in apps/methods/iso_file.py - Version: 1
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - PS1 ISO Image Browser
+"""
+PS1 ISO Image Browser - ISO9660 CD images in 2048 (.iso) or raw 2352/2336
+(.bin) sector layouts (port of get_sector_size / extract_file from
+reevengi-tools iso_search.c). The directory tree is walked once from the
+memory-mapped image; file data is gathered from the user data part of each
+sector with a NumPy view and streamed, so nothing is extracted first.
+"""
+
+import mmap
+import os
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+##Methods list -
+# get_sector_size
+# is_iso_image
+# sector_data_offset
+
+##class ISOImage: -
+# __init__
+# __enter__
+# __exit__
+# __len__
+# _build_index
+# _read_dir_records
+# close
+# exists
+# file_info
+# iter_file
+# list_dir
+# paths
+# read
+# read_sectors
+
+ISO_DATA_LENGTH = 2048               # user data per sector (DATA_LENGTH)
+ISO_LAYOUTS = ((2048, 0), (2352, 16), (2352, 24), (2336, 8))   # (sector size, user data offset)
+ISO_SYNC_PATTERN = b"\x00" + b"\xff" * 10 + b"\x00"
+ISO_PVD_SECTOR = 16
+ISO_PVD_IDENT = b"\x01CD001"
+ISO_ROOT_RECORD_OFFSET = 156         # root directory record inside the PVD
+ISO_ROOT_RECORD_SIZE = 34
+ISO_DIR_FLAG = 0x02
+ISO_STREAM_SECTORS = 256             # iter_file chunk (512KB of user data)
+ISO_EXTENSIONS = (".iso", ".bin", ".img")
+
+
+def get_sector_size(data) -> int: #vers 1
+    """Raw sync pattern at sector 0 and 1 -> 2352, at sector 0 only -> 2336, else 2048"""
+    if bytes(data[0:12]) != ISO_SYNC_PATTERN:
+        return 2048
+    if bytes(data[2352:2352 + 12]) != ISO_SYNC_PATTERN:
+        return 2336
+    return 2352
+
+
+def sector_data_offset(data, sector_size: int) -> int: #vers 1
+    """Start of user data in a sector - 2352 uses the mode byte (mode 1: 16, mode 2 XA: 16+8)"""
+    if sector_size == 2048:
+        return 0
+    if sector_size == 2336:
+        return 8
+    return 16 if data[15] == 1 else 16 + 8
+
+
+def is_iso_image(file_path: str) -> bool: #vers 1
+    """True if a primary volume descriptor sits at sector 16 in any known sector layout"""
+    with open(file_path, 'rb') as f:
+        for sector_size, data_offset in ISO_LAYOUTS:
+            f.seek(ISO_PVD_SECTOR * sector_size + data_offset)
+            if f.read(len(ISO_PVD_IDENT)) == ISO_PVD_IDENT:
+                return True
+    return False
+
+
+class ISOImage: #vers 1
+    """Read-only ISO9660 image - directory tree indexed once, file data streamed from the mapping"""
+
+    def __init__(self, file_path: str): #vers 1
+        """Map image, detect sector layout and walk the directory tree"""
+        self.file_path = str(file_path)
+        self.file_size = os.path.getsize(self.file_path)
+        if self.file_size < (ISO_PVD_SECTOR + 1) * ISO_DATA_LENGTH:
+            raise ValueError(f"Not an ISO image (too small): {self.file_path}")
+        with open(self.file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        self.sector_size = get_sector_size(self._view)
+        self.data_offset = sector_data_offset(self._view, self.sector_size)
+        pvd_start = ISO_PVD_SECTOR * 2336 + 8
+        if self.sector_size == 2336 and bytes(self._view[pvd_start:pvd_start + 6]) != ISO_PVD_IDENT:
+            # Only sector 0 carries a sync pattern - still a 2352 image
+            self.sector_size = 2352
+            self.data_offset = sector_data_offset(self._view, 2352)
+        self.num_sectors = self.file_size // self.sector_size
+        # (sectors, sector_size) view - file data is a column slice of it
+        self._sectors = np.frombuffer(self._mmap, dtype=np.uint8,
+                                      count=self.num_sectors * self.sector_size
+                                      ).reshape(self.num_sectors, self.sector_size)
+
+        pvd = self.read_sectors(ISO_PVD_SECTOR, 1)
+        if bytes(pvd[0:6]) != ISO_PVD_IDENT:
+            raise ValueError(f"No ISO9660 volume descriptor ({self.sector_size} byte sectors): {self.file_path}")
+        self.volume_id = bytes(pvd[40:72]).decode('ascii', 'replace').strip()
+        self.entries: Dict[str, Tuple[int, int]] = {}
+        self._dirs: Dict[str, List[Tuple[str, bool]]] = {}
+        self._index: Dict[str, str] = {}
+        self._build_index(bytes(pvd[ISO_ROOT_RECORD_OFFSET:ISO_ROOT_RECORD_OFFSET + ISO_ROOT_RECORD_SIZE]))
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def __len__(self): #vers 1
+        return len(self.entries)
+
+    def _read_dir_records(self, lba: int, size: int) -> List[Tuple[str, int, int, bool]]: #vers 1
+        """(name, lba, size, is_dir) of one directory extent - records never cross sectors"""
+        data = self.read_sectors(lba, (size + ISO_DATA_LENGTH - 1) // ISO_DATA_LENGTH)
+        records = []
+        pos = 0
+        while pos < size:
+            length = data[pos]
+            if length == 0:
+                # Rest of this sector is padding
+                pos = (pos // ISO_DATA_LENGTH + 1) * ISO_DATA_LENGTH
+                continue
+            if pos + 33 > len(data):
+                break
+            extent = int.from_bytes(data[pos + 2:pos + 6], 'little')
+            extent_size = int.from_bytes(data[pos + 10:pos + 14], 'little')
+            flags = data[pos + 25]
+            name_length = data[pos + 32]
+            raw_name = bytes(data[pos + 33:pos + 33 + name_length])
+            pos += length
+            if raw_name in (b"\0", b"\1"):
+                continue
+            # Drop the ;1 version and the dot of names without extension
+            name = raw_name.decode('ascii', 'replace').split(";")[0]
+            if name.endswith(".") and not flags & ISO_DIR_FLAG:
+                name = name[:-1]
+            records.append((name, extent, extent_size, bool(flags & ISO_DIR_FLAG)))
+        return records
+
+    def _build_index(self, root_record: bytes): #vers 1
+        """Walk directories from the root record - path -> (lba, size)"""
+        root_lba = int.from_bytes(root_record[2:6], 'little')
+        root_size = int.from_bytes(root_record[10:14], 'little')
+        pending = [("", root_lba, root_size)]
+        visited = set()
+        while pending:
+            dir_path, lba, size = pending.pop()
+            if lba in visited or lba >= self.num_sectors:
+                continue
+            visited.add(lba)
+            children = self._dirs.setdefault(dir_path.lower(), [])
+            for name, extent, extent_size, is_dir in self._read_dir_records(lba, size):
+                path = f"{dir_path}/{name}" if dir_path else name
+                children.append((name, is_dir))
+                if is_dir:
+                    pending.append((path, extent, extent_size))
+                else:
+                    self.entries[path] = (extent, extent_size)
+                    self._index[path.lower()] = path
+
+    def close(self): #vers 1
+        """Unmap the image"""
+        if self._mmap is None:
+            return
+        self._sectors = None
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Caller still holds a file view - mapping is freed with it
+            pass
+        self._mmap = None
+
+    def read_sectors(self, lba: int, count: int) -> memoryview: #vers 1
+        """User data of count sectors from lba - zero-copy slice for 2048 byte images"""
+        if lba < 0 or lba + count > self.num_sectors:
+            raise ValueError(f"Sectors {lba}..{lba + count} outside image ({self.num_sectors} sectors)")
+        if self.sector_size == ISO_DATA_LENGTH:
+            return self._view[lba * ISO_DATA_LENGTH:(lba + count) * ISO_DATA_LENGTH]
+        rows = self._sectors[lba:lba + count, self.data_offset:self.data_offset + ISO_DATA_LENGTH]
+        return memoryview(rows.tobytes())
+
+    def exists(self, path: str) -> bool: #vers 1
+        return path.strip("/").lower() in self._index
+
+    def file_info(self, path: str) -> Dict: #vers 1
+        """Start sector, image offset and length of one file"""
+        name = self._index.get(path.strip("/").lower())
+        if name is None:
+            raise FileNotFoundError(f"ISO file not found: {path}")
+        lba, size = self.entries[name]
+        return {"path": name, "lba": lba, "offset": lba * self.sector_size + self.data_offset,
+                "length": size}
+
+    def list_dir(self, path: str = "") -> List[Tuple[str, bool]]: #vers 1
+        """(name, is_dir) children of a directory, directories first"""
+        children = self._dirs.get(path.strip("/").lower())
+        if children is None:
+            raise FileNotFoundError(f"ISO directory not found: {path}")
+        return sorted(children, key=lambda child: (not child[1], child[0].lower()))
+
+    def paths(self) -> List[str]: #vers 1
+        """All file paths (disc case) in directory walk order"""
+        return list(self.entries)
+
+    def iter_file(self, path: str, chunk_sectors: int = ISO_STREAM_SECTORS) -> Iterator[memoryview]: #vers 1
+        """Stream a file chunk_sectors sectors at a time - last chunk trimmed to the file length"""
+        info = self.file_info(path)
+        lba, remaining = info["lba"], info["length"]
+        while remaining > 0:
+            count = min(chunk_sectors, (remaining + ISO_DATA_LENGTH - 1) // ISO_DATA_LENGTH)
+            chunk = self.read_sectors(lba, count)
+            yield chunk[:remaining]
+            lba += count
+            remaining -= count * ISO_DATA_LENGTH
+
+    def read(self, path: str) -> bytes: #vers 1
+        """Whole file contents"""
+        return b"".join(self.iter_file(path))
@@ -0,0 +1,50 @@
+#this belongs in apps/methods/json_store.py - Version: 1
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - Versioned JSON Store
+"""
+Versioned JSON Store - Shared load/save for the persistent caches (RDT
+catalog, asset MD5 cache, script index). Files carry a format version; a
+missing, unreadable or other-version file reads as empty so callers rebuild.
+Saves go through a temp file and os.replace, so an interrupted write never
+leaves a truncated store behind.
+"""
+
+import json
+import os
+from typing import Dict, Optional
+
+from apps.methods.img_debug_functions import img_debugger
+
+##Methods list -
+# load_json_store
+# save_json_store
+
+
+def load_json_store(path: Optional[str], version: int, label: str) -> Dict: #vers 1
+    """Stored dict (incl. 'version'), empty when missing, unreadable or of another version"""
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        img_debugger.error(f"Error loading {label}: {e}")
+        return {}
+    if not isinstance(data, dict) or data.get("version") != version:
+        img_debugger.debug(f"{label} is of another version - rebuilding")
+        return {}
+    return data
+
+
+def save_json_store(path: Optional[str], version: int, payload: Dict, label: str) -> bool: #vers 1
+    """Write {'version': version, **payload} in compact form via a temp file"""
+    if not path:
+        return False
+    try:
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(payload, version=version), f, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        img_debugger.error(f"Error saving {label}: {e}")
+        return False
@@ -0,0 +1,276 @@
+#this belongs in apps/methods/pak_file.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - PAK Background Depacker/Packer
+"""
+PAK Background Depacker/Packer - Resident Evil PC PAK room backgrounds (port
+of pak_depack/pak_pack from reevengi-tools depack_pak.c / pack_pak.c and the
+remove_4_pixels helpers of pak2tim.c / file2pak.c).
+LZW stream, MSB first codes starting at 9 bits. Dictionary strings are kept as
+bytes and copied into a preallocated bytearray, the result is a 16bpp TIM.
+Batch packing runs one image per process and verifies every result.
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+##Methods list -
+# depack_pak
+# is_remove4pix_tim
+# load_pak_file
+# pack_pak
+# pack_pak_batch
+# pack_pak_file
+# remove_4_pixels
+# strip_4_pixels
+# verify_pak
+
+LZW_STOP = 0x100                 # End of stream
+LZW_NEXT = 0x101                 # Increment bit size
+LZW_CLEAR = 0x102                # Clear dictionary
+LZW_FIRST = 0x103                # First free code for string
+LZW_START_BITS = 9
+LZW_MAX_CODE = 0x8000            # Encoder clears dictionary here (depacker table is 35024)
+
+PAK_TIM_IMAGE_OFFSET = 16        # width/height of the image block in a CLUT-less TIM
+PAK_TIM_PIXEL_OFFSET = 20
+PAK_BACKGROUND_SIZE = PAK_TIM_PIXEL_OFFSET + 320 * 240 * 2
+
+_LZW_BASE = [bytes((i,)) for i in range(256)] + [b"", b"", b""]
+
+
+def depack_pak(data, expected_size: int = PAK_BACKGROUND_SIZE) -> bytearray: #vers 1
+    """Depack a PAK stream - output buffer preallocated to expected_size, grown if needed"""
+    src = bytes(data) + b"\0\0\0\0"
+    total_bits = len(data) * 8
+    out = bytearray(max(expected_size, 1024))
+    out_len = len(out)
+    out_pos = 0
+    bit_pos = 0
+    from_bytes = int.from_bytes
+
+    stop = False
+    while not stop:
+        table = list(_LZW_BASE)
+        num_bits = LZW_START_BITS
+        mask = (1 << num_bits) - 1
+
+        byte = bit_pos >> 3
+        code = (from_bytes(src[byte:byte + 4], 'big') >> (32 - (bit_pos & 7) - num_bits)) & mask
+        bit_pos += num_bits
+        if code == LZW_STOP:
+            break
+        if code > 0xFF:
+            raise ValueError(f"PAK stream starts with non literal code 0x{code:X}")
+        prev = table[code]
+        if out_pos + 1 > out_len:
+            out.extend(bytes(out_len))
+            out_len = len(out)
+        out[out_pos] = code
+        out_pos += 1
+
+        while True:
+            if bit_pos > total_bits:
+                raise ValueError("PAK stream truncated (no end code)")
+            byte = bit_pos >> 3
+            code = (from_bytes(src[byte:byte + 4], 'big') >> (32 - (bit_pos & 7) - num_bits)) & mask
+            bit_pos += num_bits
+            if code == LZW_STOP:
+                stop = True
+                break
+            if code == LZW_CLEAR:
+                break
+            if code == LZW_NEXT:
+                num_bits += 1
+                mask = (1 << num_bits) - 1
+                continue
+
+            if code < len(table):
+                entry = table[code]
+            elif code == len(table):
+                entry = prev + prev[:1]
+            else:
+                raise ValueError(f"PAK code 0x{code:X} beyond dictionary size 0x{len(table):X}")
+
+            end = out_pos + len(entry)
+            if end > out_len:
+                out.extend(bytes(max(out_len, end - out_len)))
+                out_len = len(out)
+            out[out_pos:end] = entry
+            out_pos = end
+            table.append(prev + entry[:1])
+            prev = entry
+
+    del out[out_pos:]
+    return out
+
+
+def is_remove4pix_tim(tim_data) -> bool: #vers 1
+    """True when a depacked TIM holds (w-4)*(h-4) pixels (shaking room backgrounds)"""
+    if len(tim_data) < PAK_TIM_PIXEL_OFFSET:
+        return False
+    magic, tim_type = struct.unpack_from("<2I", tim_data, 0)
+    if magic != 0x10 or tim_type != 2:
+        return False
+    width, height = struct.unpack_from("<2H", tim_data, PAK_TIM_IMAGE_OFFSET)
+    if width <= 4 or height <= 4:
+        return False
+    pixel_bytes = len(tim_data) - PAK_TIM_PIXEL_OFFSET
+    return (width - 4) * (height - 4) * 2 <= pixel_bytes < width * height * 2
+
+
+def remove_4_pixels(tim_data) -> bytearray: #vers 1
+    """Re-centre an image stored 4 pixels narrower/shorter into a full size 16bpp TIM"""
+    magic, tim_type = struct.unpack_from("<2I", tim_data, 0)
+    if magic != 0x10:
+        raise ValueError("Not a TIM image")
+    if tim_type != 2:
+        raise ValueError("Only 16 bpp TIM images can be reparsed")
+    width, height = struct.unpack_from("<2H", tim_data, PAK_TIM_IMAGE_OFFSET)
+    stored = np.frombuffer(tim_data, dtype="<u2", count=(width - 4) * (height - 4),
+                           offset=PAK_TIM_PIXEL_OFFSET).reshape(height - 4, width - 4)
+    full = np.zeros((height, width), dtype="<u2")
+    full[2:height - 2, 2:width - 2] = stored
+    result = bytearray(tim_data[:PAK_TIM_PIXEL_OFFSET])
+    result += full.tobytes()
+    return result
+
+
+def load_pak_file(file_path: str, remove4pix: Optional[bool] = None) -> bytearray: #vers 1
+    """PAK file -> TIM bytes; remove4pix None detects narrow images from the pixel count"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    tim_data = depack_pak(data)
+    if remove4pix is None:
+        remove4pix = is_remove4pix_tim(tim_data)
+    if remove4pix:
+        tim_data = remove_4_pixels(tim_data)
+    return tim_data
+
+
+def strip_4_pixels(tim_data) -> bytearray: #vers 1
+    """Store only the inner (w-4)*(h-4) pixels of a 16bpp TIM (file2pak -r4)"""
+    magic, tim_type = struct.unpack_from("<2I", tim_data, 0)
+    if magic != 0x10:
+        raise ValueError("Not a TIM image")
+    if tim_type != 2:
+        raise ValueError("Only 16 bpp TIM images can be reparsed")
+    width, height = struct.unpack_from("<2H", tim_data, PAK_TIM_IMAGE_OFFSET)
+    full = np.frombuffer(tim_data, dtype="<u2", count=width * height,
+                         offset=PAK_TIM_PIXEL_OFFSET).reshape(height, width)
+    result = bytearray(tim_data[:PAK_TIM_PIXEL_OFFSET])
+    result += full[2:height - 2, 2:width - 2].tobytes()
+    return result
+
+
+def pack_pak(data) -> bytes: #vers 1
+    """LZW pack to PAK stream - same code layout pak_depack expects"""
+    out = bytearray()
+    bit_buffer = 0
+    bit_count = 0
+    dictionary: Dict[int, int] = {}
+    out_code = LZW_FIRST
+    num_bits = LZW_START_BITS
+    current = -1
+
+    for char in bytes(data):
+        if current < 0:
+            current = char
+            continue
+        key = (current << 8) | char
+        code = dictionary.get(key)
+        if code is not None:
+            current = code
+            continue
+
+        # Need more bits ?
+        if out_code & (out_code - 1) == 0:
+            bit_buffer = (bit_buffer << num_bits) | LZW_NEXT
+            bit_count += num_bits
+            num_bits += 1
+        bit_buffer = (bit_buffer << num_bits) | current
+        bit_count += num_bits
+        dictionary[key] = out_code
+        out_code += 1
+        current = char
+
+        if out_code >= LZW_MAX_CODE:
+            bit_buffer = (bit_buffer << num_bits) | LZW_CLEAR
+            bit_count += num_bits
+            dictionary.clear()
+            out_code = LZW_FIRST
+            num_bits = LZW_START_BITS
+
+        if bit_count >= 32:
+            keep = bit_count & 7
+            out += (bit_buffer >> keep).to_bytes((bit_count - keep) >> 3, 'big')
+            bit_buffer &= (1 << keep) - 1
+            bit_count = keep
+
+    # Output last code, end of stream, flush remaining bits
+    if current >= 0:
+        bit_buffer = (bit_buffer << num_bits) | current
+        bit_count += num_bits
+    bit_buffer = (bit_buffer << num_bits) | LZW_STOP
+    bit_count += num_bits
+    pad = -bit_count & 7
+    out += (bit_buffer << pad).to_bytes((bit_count + pad) >> 3, 'big')
+    return bytes(out)
+
+
+def verify_pak(pak_data, tim_data, remove4pix: bool = False) -> bool: #vers 1
+    """Round trip check - depacked stream must equal the (optionally stripped) source TIM"""
+    expected = strip_4_pixels(tim_data) if remove4pix else tim_data
+    try:
+        return depack_pak(pak_data, len(expected)) == expected
+    except ValueError:
+        return False
+
+
+def pack_pak_file(file_path: str, dst_path: Optional[str] = None,
+                  remove4pix: bool = False, verify: bool = True) -> Dict: #vers 1
+    """Process pool worker - pack one TIM to .pak next to it (or dst_path)"""
+    with open(file_path, 'rb') as f:
+        tim_data = f.read()
+    source = strip_4_pixels(tim_data) if remove4pix else tim_data
+    pak_data = pack_pak(source)
+    if dst_path is None:
+        dst_path = os.path.splitext(file_path)[0] + ".pak"
+    with open(dst_path, 'wb') as f:
+        f.write(pak_data)
+    return {
+        "path": file_path,
+        "pak_path": dst_path,
+        "size": len(tim_data),
+        "packed_size": len(pak_data),
+        "verified": verify_pak(pak_data, tim_data, remove4pix) if verify else None,
+    }
+
+
+def pack_pak_batch(file_paths: List[str], out_dir: Optional[str] = None, remove4pix: bool = False,
+                   max_workers: Optional[int] = None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]: #vers 1
+    """Pack many TIMs across a process pool - results in input order, errors in 'error'"""
+    results: List[Optional[Dict]] = [None] * len(file_paths)
+    if not file_paths:
+        return []
+    done = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for index, file_path in enumerate(file_paths):
+            dst_path = None
+            if out_dir:
+                dst_path = os.path.join(out_dir, os.path.splitext(os.path.basename(file_path))[0] + ".pak")
+            futures[pool.submit(pack_pak_file, file_path, dst_path, remove4pix)] = index
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except (OSError, ValueError, struct.error) as e:
+                results[index] = {"path": file_paths[index], "error": str(e), "verified": False}
+            done += 1
+            if progress:
+                progress(done, len(file_paths))
+    return results
@@ -0,0 +1,184 @@
+#this belongs in apps/methods/prs_file.py - Version: 1
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - Saturn PRS Depacker
+"""
+Saturn PRS Depacker - SEGA PRS (LZS variant) compressed Saturn files (port of
+prs_depack from reevengi-tools depack_prs.c / prs2file.c).
+Reads straight from a memoryview; back references are slice copies into a
+preallocated output instead of byte-at-a-time writes. The optional 16 byte
+header of Saturn files is detected from where the stream end marker lands.
+Whole directories are depacked one file per process.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Tuple
+
+##Methods list -
+# _prs_decode
+# depack_prs
+# depack_prs_batch
+# depack_prs_file
+# find_prs_files
+# load_prs_file
+
+PRS_CHUNK_SIZE = 65536           # output grows in these steps (prs_write_dest)
+PRS_SHORT_WINDOW = 0x100
+PRS_LONG_WINDOW = 0x2000
+PRS_HEADER_SIZES = (0, 16)       # Saturn files may carry a 16 byte header
+PRS_EXTENSION = ".prs"
+
+
+def _prs_decode(data, offset: int = 0, size_hint: int = 0) -> Tuple[bytearray, int, bool]: #vers 1
+    """(depacked, end offset, end marker seen) - stops at the 0x0000 long copy marker"""
+    src = memoryview(data)
+    src_len = len(src)
+    pos = offset
+    out = bytearray(max(size_hint, PRS_CHUNK_SIZE))
+    out_len = len(out)
+    dst = 0
+    cmd = 0
+    cmd_bits = 0
+    terminated = False
+
+    def read_bit():
+        nonlocal pos, cmd, cmd_bits
+        if cmd_bits == 0:
+            cmd = src[pos]
+            pos += 1
+            cmd_bits = 8
+        bit = cmd & 1
+        cmd >>= 1
+        cmd_bits -= 1
+        return bit
+
+    try:
+        while pos < src_len:
+            if read_bit():
+                if dst >= out_len:
+                    out.extend(bytes(PRS_CHUNK_SIZE))
+                    out_len = len(out)
+                out[dst] = src[pos]
+                pos += 1
+                dst += 1
+                continue
+
+            if read_bit():
+                low, high = src[pos], src[pos + 1]
+                pos += 2
+                if low == 0 and high == 0:
+                    terminated = True
+                    break
+                back = PRS_LONG_WINDOW - (((high << 8) | low) >> 3)
+                amount = low & 7
+                if amount == 0:
+                    amount = src[pos] + 1
+                    pos += 1
+                else:
+                    amount += 2
+            else:
+                amount = (read_bit() << 1) | read_bit()
+                back = PRS_SHORT_WINDOW - src[pos]
+                pos += 1
+                amount += 2
+
+            end = dst + amount
+            if end > out_len:
+                out.extend(bytes(max(PRS_CHUNK_SIZE, end - out_len)))
+                out_len = len(out)
+            start = dst - back
+            if start < 0:
+                # Before the start of output reads as zero - buffer is already zero filled
+                skip = min(-start, amount)
+                dst += skip
+                start += skip
+            count = end - dst
+            if count <= back:
+                out[dst:end] = out[start:start + count]
+            elif count:
+                pattern = bytes(out[start:dst])
+                out[dst:end] = (pattern * (count // back + 1))[:count]
+            dst = end
+    except IndexError:
+        # Stream ends inside a command (no end marker) - keep what was written
+        pass
+
+    del out[dst:]
+    return out, min(pos, src_len), terminated
+
+
+def depack_prs(data, offset: int = 0, size_hint: int = 0) -> bytearray: #vers 1
+    """Depack one PRS stream starting at offset"""
+    return _prs_decode(data, offset, size_hint)[0]
+
+
+def load_prs_file(file_path: str, header_size: Optional[int] = None) -> bytearray: #vers 1
+    """PRS file -> depacked bytes; header_size None tries 0 then 16 byte Saturn header"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if header_size is not None:
+        return depack_prs(data, header_size)
+
+    first = None
+    for size in PRS_HEADER_SIZES:
+        # Nothing to copy from yet - a stream always opens with a literal
+        if size >= len(data) or not data[size] & 1:
+            continue
+        out, end, terminated = _prs_decode(data, size)
+        # End marker close to the end of the file (sector/word padding allowed)
+        if terminated and len(data) - end < 16:
+            return out
+        if first is None:
+            first = out
+    if first is None:
+        raise ValueError(f"Not a PRS stream: {os.path.basename(file_path)}")
+    return first
+
+
+def depack_prs_file(file_path: str, dst_path: Optional[str] = None) -> Dict: #vers 1
+    """Process pool worker - depack one file to its name without .prs (prs2file adds .out)"""
+    data = load_prs_file(file_path)
+    if dst_path is None:
+        base, ext = os.path.splitext(file_path)
+        dst_path = base if ext.lower() == PRS_EXTENSION else file_path + ".out"
+    with open(dst_path, 'wb') as f:
+        f.write(data)
+    return {"path": file_path, "out_path": dst_path,
+            "packed_size": os.path.getsize(file_path), "size": len(data)}
+
+
+def find_prs_files(root: str, extensions: Tuple[str, ...] = (PRS_EXTENSION,)) -> List[str]: #vers 1
+    """All files below root with one of the extensions (case insensitive), sorted"""
+    found = []
+    for dir_path, _, file_names in os.walk(root):
+        for name in file_names:
+            if os.path.splitext(name)[1].lower() in extensions:
+                found.append(os.path.join(dir_path, name))
+    return sorted(found)
+
+
+def depack_prs_batch(file_paths: List[str], out_dir: Optional[str] = None,
+                     max_workers: Optional[int] = None,
+                     progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]: #vers 1
+    """Depack many PRS files across a process pool - results in input order, errors in 'error'"""
+    results: List[Optional[Dict]] = [None] * len(file_paths)
+    if not file_paths:
+        return []
+    done = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for index, file_path in enumerate(file_paths):
+            dst_path = None
+            if out_dir:
+                base, ext = os.path.splitext(os.path.basename(file_path))
+                dst_path = os.path.join(out_dir, base if ext.lower() == PRS_EXTENSION else base + ext + ".out")
+            futures[pool.submit(depack_prs_file, file_path, dst_path)] = index
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except (OSError, ValueError) as e:
+                results[index] = {"path": file_paths[index], "error": str(e)}
+            done += 1
+            if progress:
+                progress(done, len(file_paths))
+    return results
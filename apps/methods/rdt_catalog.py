@@ -0,0 +1,137 @@
+#this belongs in apps/methods/rdt_catalog.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - RDT Stage Catalog
+"""
+RDT Stage Catalog - Scans an extracted RE1 STAGE* tree, parses every room
+header + offset table across a process pool and keeps the result in a compact
+JSON catalog keyed by path, size and mtime. Unchanged rooms are never reparsed.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional
+
+from apps.methods.json_store import load_json_store, save_json_store
+from apps.methods.rdt_file import RDT_CAMERA_OFFSET, parse_rdt_header
+
+##Methods list -
+# find_rdt_files
+# scan_rdt_header
+
+##class RDTCatalog: -
+# __init__
+# _load_catalog
+# _save_catalog
+# get_entry
+# get_rooms
+# scan
+
+CATALOG_VERSION = 1
+CATALOG_FILENAME = "rdt_catalog.json"
+
+
+def find_rdt_files(game_root: str) -> List[str]: #vers 1
+    """All *.rdt files below STAGE* folders (or the root itself if it is a stage)"""
+    rdt_files = []
+    root_is_stage = os.path.basename(os.path.normpath(game_root)).upper().startswith("STAGE")
+    for dirpath, dirnames, filenames in os.walk(game_root):
+        rel_parts = os.path.relpath(dirpath, game_root).split(os.sep)
+        in_stage = root_is_stage or any(part.upper().startswith("STAGE") for part in rel_parts)
+        if not in_stage:
+            continue
+        for name in filenames:
+            if name.lower().endswith(".rdt"):
+                rdt_files.append(os.path.join(dirpath, name))
+    return sorted(rdt_files)
+
+
+def scan_rdt_header(file_path: str) -> Dict: #vers 1
+    """Process pool worker - read and parse header + offset table only"""
+    stat = os.stat(file_path)
+    with open(file_path, 'rb') as f:
+        data = f.read(RDT_CAMERA_OFFSET)
+    header = parse_rdt_header(data)
+    return {
+        "path": file_path,
+        "size": stat.st_size,
+        "mtime": stat.st_mtime_ns,
+        "num_cameras": header["num_cameras"],
+        "num_sound_banks": header["num_sound_banks"],
+        "offsets": header["offsets"],
+    }
+
+
+class RDTCatalog: #vers 2
+    """Persistent room catalog for one game tree"""
+
+    def __init__(self, game_root: str, catalog_path: Optional[str] = None): #vers 1
+        """Load existing catalog - rooms are keyed by path relative to game_root"""
+        self.game_root = os.path.abspath(game_root)
+        self.catalog_path = catalog_path or os.path.join(self.game_root, CATALOG_FILENAME)
+        self.rooms: Dict[str, Dict] = self._load_catalog()
+        self.errors: Dict[str, str] = {}
+
+    def _load_catalog(self) -> Dict[str, Dict]: #vers 2
+        """Read catalog file, empty on first scan or version mismatch"""
+        return load_json_store(self.catalog_path, CATALOG_VERSION, "RDT catalog").get("rooms", {})
+
+    def _save_catalog(self) -> bool: #vers 2
+        """Write catalog in compact form"""
+        return save_json_store(self.catalog_path, CATALOG_VERSION, {"rooms": self.rooms}, "RDT catalog")
+
+    def get_entry(self, rel_path: str) -> Optional[Dict]: #vers 1
+        return self.rooms.get(rel_path)
+
+    def get_rooms(self) -> List[Dict]: #vers 1
+        """Valid catalog entries sorted by path, with absolute path added"""
+        rooms = []
+        for rel_path in sorted(self.rooms):
+            if "error" in self.rooms[rel_path]:
+                continue
+            entry = dict(self.rooms[rel_path])
+            entry["rel_path"] = rel_path
+            entry["path"] = os.path.join(self.game_root, rel_path)
+            rooms.append(entry)
+        return rooms
+
+    def scan(self, max_workers: Optional[int] = None,
+             progress: Optional[Callable[[int, int], None]] = None) -> int: #vers 1
+        """Reparse new or changed rooms, drop deleted ones, return reparsed count"""
+        current: Dict[str, os.stat_result] = {}
+        for file_path in find_rdt_files(self.game_root):
+            current[os.path.relpath(file_path, self.game_root)] = os.stat(file_path)
+
+        removed = [rel_path for rel_path in self.rooms if rel_path not in current]
+        for rel_path in removed:
+            del self.rooms[rel_path]
+
+        changed = []
+        for rel_path, stat in current.items():
+            entry = self.rooms.get(rel_path)
+            if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+                changed.append(rel_path)
+
+        self.errors = {}
+        if changed:
+            done = 0
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(scan_rdt_header, os.path.join(self.game_root, rel_path)): rel_path
+                    for rel_path in changed
+                }
+                for future in as_completed(futures):
+                    rel_path = futures[future]
+                    try:
+                        entry = future.result()
+                        del entry["path"]
+                        self.rooms[rel_path] = entry
+                    except (OSError, ValueError) as e:
+                        # Remember bad rooms too, so they are only retried once changed
+                        stat = current[rel_path]
+                        self.rooms[rel_path] = {"size": stat.st_size, "mtime": stat.st_mtime_ns, "error": str(e)}
+                        self.errors[rel_path] = str(e)
+                    done += 1
+                    if progress:
+                        progress(done, len(changed))
+        if changed or removed or not os.path.exists(self.catalog_path):
+            self._save_catalog()
+        return len(changed)
@@ -0,0 +1,296 @@
+#this belongs in apps/methods/rdt_file.py - Version: 5
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - RDT Room Loader
+"""
+RDT Room Loader - Memory-mapped Resident Evil 1 room file (roomSXX0.rdt).
+Only the header and the 19-entry offset table are read when a room is opened,
+each section is sliced from the mapping and decoded the first time it is used.
+Camera and item tables are NumPy structured arrays laid over the mapping.
+"""
+
+import mmap
+import os
+import struct
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from apps.methods.sca_collision import SCACollision
+
+##Methods list -
+# gather_cameras
+# gather_items
+# parse_rdt_header
+
+##class RDTFile: -
+# __init__
+# __enter__
+# __exit__
+# _decode_cameras
+# _decode_collision
+# _decode_event_scripts
+# _decode_items
+# _decode_raw
+# _decode_script
+# _decode_tmd_tim
+# cameras
+# close
+# collision
+# event_scripts
+# exec_script
+# get_section
+# get_section_bytes
+# get_section_range
+# has_section
+# init_script
+# items
+# tmd_tim
+
+RDT_NUM_OFFSETS = 19
+RDT_HEADER_FORMAT = "<BBB3s3H" + "3i2I" * 3
+RDT_HEADER_SIZE = struct.calcsize(RDT_HEADER_FORMAT)                   # 0x48
+RDT_OFFSETS_FORMAT = "<%dI" % RDT_NUM_OFFSETS
+RDT_CAMERA_OFFSET = RDT_HEADER_SIZE + struct.calcsize(RDT_OFFSETS_FORMAT)  # 0x94
+
+# rdt_camera_t - 11 longs
+RDT_CAMERA_DTYPE = np.dtype([
+    ("masks_offset", "<i4"),
+    ("tim_masks_offset", "<i4"),
+    ("from", "<i4", (3,)),
+    ("to", "<i4", (3,)),
+    ("unknown1", "<i4", (3,)),
+])
+RDT_CAMERA_SIZE = RDT_CAMERA_DTYPE.itemsize
+# Item placement record - PROVISIONAL: the research doc only names the fields (item type, position,
+# rotation, flags); this 12 byte order and the record count (section length // 12) are not verified
+RDT_ITEM_DTYPE = np.dtype([
+    ("type", "<u2"),
+    ("flags", "<u2"),
+    ("pos", "<i2", (3,)),
+    ("rotation", "<i2"),
+])
+RDT_ITEM_SIZE = RDT_ITEM_DTYPE.itemsize
+RDT_ITEM_LAYOUT_VERIFIED = False        # results built on RDT_ITEM_DTYPE are labelled unverified while False
+RDT_TMD_TIM_FORMAT = "<II"
+RDT_TMD_TIM_SIZE = struct.calcsize(RDT_TMD_TIM_FORMAT)
+
+# Section indices into the offset table (see RE1_FILE_FORMATS_RESEARCH.md)
+RDT_SECTION_CAMERA_SWITCHES = 0
+RDT_SECTION_COLLISION = 1
+RDT_SECTION_ITEMS = 2
+RDT_SECTION_TMD_TIM = 3
+RDT_SECTION_INIT_SCRIPT = 6
+RDT_SECTION_EXEC_SCRIPT = 7
+RDT_SECTION_EVENT_SCRIPTS = 8
+RDT_SECTION_SKELETON = 9
+RDT_SECTION_SKELETON_ANIM = 10
+RDT_SECTION_ROOM_ANIM = 13
+
+RDT_SECTION_NAMES = [
+    "Camera switches", "Collision boundaries", "Items/obstacles", "TMD/TIM pairs",
+    "Unknown 4", "Unknown 5", "Initialization script", "Execution script",
+    "Event scripts", "Skeleton", "Skeleton animation steps", "Unknown 11",
+    "Unknown 12", "Room animation", "Unknown 14", "Unknown 15", "Unknown 16",
+    "Unknown 17", "Unknown 18"
+]
+
+
+def parse_rdt_header(data) -> Dict: #vers 1
+    """Parse RDT header and offset table from the first RDT_CAMERA_OFFSET bytes"""
+    if len(data) < RDT_CAMERA_OFFSET:
+        raise ValueError(f"RDT too small: {len(data)} bytes, need {RDT_CAMERA_OFFSET}")
+
+    fields = struct.unpack_from(RDT_HEADER_FORMAT, data, 0)
+    parts = [fields[7 + i * 5:12 + i * 5] for i in range(3)]
+    return {
+        "unknown0": fields[0],
+        "num_cameras": fields[1],
+        "num_sound_banks": fields[2],
+        "unknown1": fields[3],
+        "unknown2": fields[4:7],
+        "unknown3": [{"pos": part[0:3], "unknown0": part[3:5]} for part in parts],
+        "offsets": list(struct.unpack_from(RDT_OFFSETS_FORMAT, data, RDT_HEADER_SIZE)),
+    }
+
+
+def gather_cameras(rooms: Sequence["RDTFile"]) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+    """Concatenate camera tables of many rooms - returns (room_index, cameras)
+
+    e.g. all camera positions in a stage: gather_cameras(rooms)[1]["from"]
+    """
+    tables = [room.cameras for room in rooms]
+    room_index = np.repeat(np.arange(len(tables), dtype=np.int32), [len(t) for t in tables])
+    if not tables:
+        return room_index, np.empty(0, dtype=RDT_CAMERA_DTYPE)
+    return room_index, np.concatenate(tables)
+
+
+def gather_items(rooms: Sequence["RDTFile"]) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+    """Concatenate item placement tables of many rooms - returns (room_index, items)"""
+    tables = [room.items if room.items is not None else np.empty(0, dtype=RDT_ITEM_DTYPE)
+              for room in rooms]
+    room_index = np.repeat(np.arange(len(tables), dtype=np.int32), [len(t) for t in tables])
+    if not tables:
+        return room_index, np.empty(0, dtype=RDT_ITEM_DTYPE)
+    return room_index, np.concatenate(tables)
+
+
+class RDTFile: #vers 4
+    """Lazily decoded RDT room backed by a read-only memory map"""
+
+    def __init__(self, file_path: str, data=None): #vers 2
+        """Map file (or wrap bytes already in memory) and read header + offset table only"""
+        self.file_path = str(file_path)
+        self.file_size = os.path.getsize(self.file_path) if data is None else len(data)
+        if self.file_size < RDT_CAMERA_OFFSET:
+            raise ValueError(f"Not an RDT file (too small): {self.file_path}")
+
+        self._mmap = None
+        if data is None:
+            with open(self.file_path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        else:
+            # Streamed from an image/archive - sections slice the caller's buffer
+            self._view = memoryview(data)
+
+        self.header = parse_rdt_header(self._view)
+        self.num_cameras = self.header["num_cameras"]
+        self.offsets = self.header["offsets"]
+        self._boundaries = sorted(set(o for o in self.offsets if 0 < o < self.file_size))
+        self._section_cache: Dict[int, object] = {}
+        self._decoders = {
+            RDT_SECTION_COLLISION: self._decode_collision,
+            RDT_SECTION_ITEMS: self._decode_items,
+            RDT_SECTION_TMD_TIM: self._decode_tmd_tim,
+            RDT_SECTION_INIT_SCRIPT: self._decode_script,
+            RDT_SECTION_EXEC_SCRIPT: self._decode_script,
+            RDT_SECTION_EVENT_SCRIPTS: self._decode_event_scripts,
+        }
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def close(self): #vers 1
+        """Drop decoded sections and unmap the file"""
+        self._section_cache.clear()
+        if self._mmap is None:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Caller still holds a section view - mapping is freed with it
+            pass
+        self._mmap = None
+
+    def has_section(self, index: int) -> bool: #vers 1
+        """True if offset table entry points inside the file"""
+        return 0 < self.offsets[index] < self.file_size
+
+    def get_section_range(self, index: int) -> Tuple[int, int]: #vers 1
+        """Return (start, end) of a section - end is the next section start or EOF"""
+        start = self.offsets[index]
+        if not self.has_section(index):
+            return (0, 0)
+        end = self.file_size
+        for boundary in self._boundaries:
+            if boundary > start:
+                end = boundary
+                break
+        return (start, end)
+
+    def get_section_bytes(self, index: int) -> memoryview: #vers 1
+        """Zero-copy slice of the mapping for one section"""
+        start, end = self.get_section_range(index)
+        return self._view[start:end]
+
+    def get_section(self, index: int): #vers 1
+        """Decode section on first access, cached afterwards"""
+        if not 0 <= index < RDT_NUM_OFFSETS:
+            raise IndexError(f"RDT section index out of range: {index}")
+        if index not in self._section_cache:
+            if not self.has_section(index):
+                self._section_cache[index] = None
+            else:
+                decoder = self._decoders.get(index, self._decode_raw)
+                self._section_cache[index] = decoder(self.get_section_bytes(index))
+        return self._section_cache[index]
+
+    @property
+    def cameras(self) -> np.ndarray: #vers 2
+        """Camera records at 0x94 (num_cameras entries) - read-only view over the file"""
+        if "cameras" not in self._section_cache:
+            self._section_cache["cameras"] = self._decode_cameras()
+        return self._section_cache["cameras"]
+
+    @property
+    def collision(self) -> Optional[SCACollision]: #vers 2
+        return self.get_section(RDT_SECTION_COLLISION)
+
+    @property
+    def items(self) -> Optional[np.ndarray]: #vers 2
+        return self.get_section(RDT_SECTION_ITEMS)
+
+    @property
+    def tmd_tim(self) -> Optional[List[Tuple[int, int]]]: #vers 1
+        return self.get_section(RDT_SECTION_TMD_TIM)
+
+    @property
+    def init_script(self) -> Optional[Dict]: #vers 1
+        return self.get_section(RDT_SECTION_INIT_SCRIPT)
+
+    @property
+    def exec_script(self) -> Optional[Dict]: #vers 1
+        return self.get_section(RDT_SECTION_EXEC_SCRIPT)
+
+    @property
+    def event_scripts(self) -> Optional[List[Dict]]: #vers 1
+        return self.get_section(RDT_SECTION_EVENT_SCRIPTS)
+
+    def _decode_cameras(self) -> np.ndarray: #vers 2
+        """rdt_camera_t records as a structured array over the mapping"""
+        end = RDT_CAMERA_OFFSET + self.num_cameras * RDT_CAMERA_SIZE
+        if end > self.file_size:
+            raise ValueError(f"Camera table overruns file: {self.file_path}")
+        return np.frombuffer(self._view[RDT_CAMERA_OFFSET:end], dtype=RDT_CAMERA_DTYPE)
+
+    def _decode_collision(self, data: memoryview) -> SCACollision: #vers 2
+        """SCA header and boundary entries as flat arrays - point grid built on first query"""
+        return SCACollision(data)
+
+    def _decode_items(self, data: memoryview) -> np.ndarray: #vers 3
+        """Packed item placement records up to the next section - view over the mapping,
+        provisional RDT_ITEM_DTYPE layout"""
+        count = len(data) // RDT_ITEM_SIZE
+        return np.frombuffer(data, dtype=RDT_ITEM_DTYPE, count=count)
+
+    def _decode_tmd_tim(self, data: memoryview) -> List[Tuple[int, int]]: #vers 1
+        """(tmd_offset, tim_offset) pairs"""
+        count = len(data) // RDT_TMD_TIM_SIZE
+        return list(struct.iter_unpack(RDT_TMD_TIM_FORMAT, data[:count * RDT_TMD_TIM_SIZE]))
+
+    def _decode_script(self, data: memoryview) -> Dict: #vers 1
+        """unsigned short length + bytecode"""
+        if len(data) < 2:
+            raise ValueError("Script section truncated")
+        length = struct.unpack_from("<H", data, 0)[0]
+        return {"length": length, "bytecode": data[2:2 + length]}
+
+    def _decode_event_scripts(self, data: memoryview) -> List[Dict]: #vers 1
+        """Consecutive length-prefixed event scripts"""
+        scripts = []
+        pos = 0
+        while pos + 2 <= len(data):
+            length = struct.unpack_from("<H", data, pos)[0]
+            if length == 0 or pos + 2 + length > len(data):
+                break
+            scripts.append({"length": length, "bytecode": data[pos + 2:pos + 2 + length]})
+            pos += 2 + length
+        return scripts
+
+    def _decode_raw(self, data: memoryview) -> memoryview: #vers 1
+        """Sections without a known layout stay as raw slices"""
+        return data
@@ -0,0 +1,328 @@
+#this belongs in apps/methods/rofs_file.py - Version: 3
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - ROFS Archive File System
+"""
+ROFS Archive File System - Resident Evil 3 PC ROFSxx.DAT archives (port of
+list_files / extract_file / decrypt_block / depack_block from reevengi-tools
+rofs.c). Every archive's directory is indexed once from the memory-mapped
+file; a single file is decrypted (XOR key stream built with NumPy) and
+depacked only when it is read, so nothing is extracted up front.
+"""
+
+import mmap
+import os
+import re
+import struct
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+##Methods list -
+# _next_key
+# _xor_stream
+# decrypt_rofs_block
+# depack_rofs_block
+# find_rofs_archives
+
+##class RofsArchive: -
+# __init__
+# __enter__
+# __exit__
+# __len__
+# _build_index
+# _read_name
+# close
+# file_length
+# read_file
+
+##class RofsFileSystem: -
+# __init__
+# __enter__
+# __exit__
+# __len__
+# close
+# exists
+# file_info
+# file_size
+# list_dir
+# paths
+# read
+
+ROFS_HEADER_SIZE = 4096
+ROFS_HEADER_UNKNOWN = 4 * 5 + 1          # rofs_header_t
+ROFS_DIR_FORMAT = "<2I"                  # offset (8 byte units), length
+ROFS_DIR_SIZE = struct.calcsize(ROFS_DIR_FORMAT)
+ROFS_CRYPT_FORMAT = "<2HI8s"             # data offset, num_keys, length, ident
+ROFS_CRYPT_SIZE = struct.calcsize(ROFS_CRYPT_FORMAT)
+ROFS_OFFSET_UNIT = 8
+ROFS_COMPRESSED_IDENT = b"Hi_Comp\0"
+ROFS_BLOCK_SIZE = 32768                  # depack_block output limit
+ROFS_WINDOW_SIZE = 4096
+ROFS_FILE_CACHE_SIZE = 16
+
+ROFS_BASE_ARRAY = (
+    0x00e6, 0x01a4, 0x00e6, 0x01c5, 0x0130, 0x00e8, 0x03db, 0x008b,
+    0x0141, 0x018e, 0x03ae, 0x0139, 0x00f0, 0x027a, 0x02c9, 0x01b0,
+    0x01f7, 0x0081, 0x0138, 0x0285, 0x025a, 0x015b, 0x030f, 0x0335,
+    0x02e4, 0x01f6, 0x0143, 0x00d1, 0x0337, 0x0385, 0x007b, 0x00c6,
+    0x0335, 0x0141, 0x0186, 0x02a1, 0x024d, 0x0342, 0x01fb, 0x03e5,
+    0x01b0, 0x006d, 0x0140, 0x00c0, 0x0386, 0x016b, 0x020b, 0x009a,
+    0x0241, 0x00de, 0x015e, 0x035a, 0x025b, 0x0154, 0x0068, 0x02e8,
+    0x0321, 0x0071, 0x01b0, 0x0232, 0x02d9, 0x0263, 0x0164, 0x0290,
+)
+
+# Window starts as 16 copies of every byte value plus 256 bytes of slack
+_ROFS_WINDOW_INIT = np.repeat(np.arange(256, dtype=np.uint8), 16).tobytes() + bytes(256)
+
+
+def _next_key(key: int) -> Tuple[int, int]: #vers 1
+    """re3_next_key - (new key, top byte)"""
+    key = (key * 0x5D588B65 + 0x8000000B) & 0xFFFFFFFF
+    return key, key >> 24
+
+
+def _xor_stream(key: int, length: int) -> np.ndarray: #vers 1
+    """decrypt_block key bytes - one Python step per run, runs expanded with np.repeat"""
+    key, xor_key = _next_key(key)
+    key, base = _next_key(key)
+    base %= 0x3F
+    run_keys, run_lengths = [], []
+    total = 0
+    while total < length:
+        run = ROFS_BASE_ARRAY[base] + 1
+        run_keys.append(xor_key)
+        run_lengths.append(run)
+        total += run
+        key, base = _next_key(key)
+        base %= 0x3F
+        key, xor_key = _next_key(key)
+    return np.repeat(np.array(run_keys, dtype=np.uint8), run_lengths)[:length]
+
+
+def decrypt_rofs_block(data, key: int) -> bytes: #vers 1
+    """XOR one block with its key stream"""
+    block = np.frombuffer(data, dtype=np.uint8)
+    return (block ^ _xor_stream(key, block.size)).tobytes()
+
+
+def depack_rofs_block(data, max_length: int = ROFS_BLOCK_SIZE) -> bytearray: #vers 1
+    """depack_block - 9 bit literals / 17 bit (12 bit window offset, 4 bit length) copies"""
+    src = bytes(data) + b"\0\0\0"
+    src_len = len(data)
+    window = bytearray(_ROFS_WINDOW_INIT)
+    out = bytearray()
+    from_bytes = int.from_bytes
+    pos = 0
+    win = 0
+    while (pos >> 3) < src_len and len(out) < max_length:
+        byte = pos >> 3
+        value = (from_bytes(src[byte:byte + 3], 'big') >> (7 - (pos & 7))) & 0x1FFFF
+        if not value & 0x10000:
+            literal = value >> 8
+            out.append(literal)
+            window[win] = literal
+            win += 1
+            pos += 9
+        else:
+            start = (value >> 4) & 0xFFF
+            count = min((value & 0x0F) + 2, max_length - len(out))
+            pos += 17
+            # Whole chunk is read before the window is written (two memcpy in rofs.c)
+            chunk = bytes(window[start:start + count])
+            out += chunk
+            window[win:win + count] = chunk
+            win += count
+        if win >= ROFS_WINDOW_SIZE:
+            win = 0
+    return out
+
+
+def find_rofs_archives(game_dir: str) -> List[str]: #vers 1
+    """ROFS*.DAT files of a game folder in archive number order"""
+    found = []
+    for name in os.listdir(game_dir):
+        match = re.fullmatch(r"rofs(\d*)\.dat", name, re.IGNORECASE)
+        if match:
+            found.append((int(match.group(1) or 0), os.path.join(game_dir, name)))
+    return [path for _, path in sorted(found)]
+
+
+class RofsArchive: #vers 2
+    """One memory-mapped ROFS archive - level1/level2/name index, files read on demand"""
+
+    def __init__(self, file_path: str): #vers 1
+        """Map archive and index its directory - nothing is decrypted yet"""
+        self.file_path = str(file_path)
+        self.file_size = os.path.getsize(self.file_path)
+        if self.file_size < ROFS_HEADER_SIZE:
+            raise ValueError(f"Not a ROFS archive (too small): {self.file_path}")
+        with open(self.file_path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self.level1 = ""
+        self.level2 = ""
+        self.entries: "OrderedDict[str, Tuple[int, int]]" = self._build_index()
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def __len__(self): #vers 1
+        return len(self.entries)
+
+    def _read_name(self, offset: int, limit: int) -> Tuple[str, int]: #vers 1
+        """C string at offset -> (name, offset after terminator)"""
+        end = self._mmap.find(b"\0", offset, limit)
+        if end < 0:
+            raise ValueError(f"ROFS name not terminated at 0x{offset:X}")
+        return bytes(self._view[offset:end]).decode('ascii', 'replace'), end + 1
+
+    def _build_index(self) -> "OrderedDict[str, Tuple[int, int]]": #vers 1
+        """'level1/level2/name' -> (data offset, length) for every file header"""
+        self.level1, offset = self._read_name(ROFS_HEADER_UNKNOWN, ROFS_HEADER_SIZE)
+        dir_offset, _ = struct.unpack_from(ROFS_DIR_FORMAT, self._view, offset)
+        self.level2, _ = self._read_name(offset + ROFS_DIR_SIZE, ROFS_HEADER_SIZE)
+
+        offset = dir_offset * ROFS_OFFSET_UNIT
+        if offset + 4 > self.file_size:
+            raise ValueError(f"ROFS directory beyond end of file: 0x{offset:X}")
+        num_files = struct.unpack_from("<I", self._view, offset)[0]
+        offset += 4
+        entries = OrderedDict()
+        prefix = f"{self.level1}/{self.level2}/"
+        for _ in range(num_files):
+            file_offset, length = struct.unpack_from(ROFS_DIR_FORMAT, self._view, offset)
+            name, offset = self._read_name(offset + ROFS_DIR_SIZE, self.file_size)
+            entries[prefix + name] = (file_offset * ROFS_OFFSET_UNIT, length)
+        return entries
+
+    def close(self): #vers 1
+        """Unmap the archive"""
+        if self._mmap is None:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # numpy still references the mapping - freed with it
+            pass
+        self._mmap = None
+
+    def file_length(self, name: str) -> int: #vers 1
+        """Decrypted/depacked length from the crypt header - nothing is decrypted"""
+        offset, _ = self.entries[name]
+        return struct.unpack_from(ROFS_CRYPT_FORMAT, self._view, offset)[2]
+
+    def read_file(self, name: str) -> bytes: #vers 1
+        """Decrypt (and depack Hi_Comp) one file - extract_file without writing to disk"""
+        offset, _ = self.entries[name]
+        data_offset, num_keys, length, ident = struct.unpack_from(ROFS_CRYPT_FORMAT, self._view, offset)
+        ident = bytes(b ^ ident[7] for b in ident)
+        compressed = ident == ROFS_COMPRESSED_IDENT
+        tables = np.frombuffer(self._view, dtype="<u4", count=num_keys * 2,
+                               offset=offset + ROFS_CRYPT_SIZE).astype(np.int64)
+        keys, block_lengths = tables[:num_keys], tables[num_keys:]
+
+        src = offset + data_offset
+        out = bytearray()
+        for key, block_length in zip(keys.tolist(), block_lengths.tolist()):
+            if not compressed:
+                block_length = max(0, min(block_length, length - len(out)))
+            if src + block_length > self.file_size:
+                raise ValueError(f"ROFS block beyond end of archive in {name}")
+            block = decrypt_rofs_block(self._view[src:src + block_length], key)
+            src += block_length
+            if compressed:
+                depacked = depack_rofs_block(block)
+                if depacked:
+                    block = depacked
+            out += block
+        # extract_file saves exactly 'length' bytes
+        del out[length:]
+        out += bytes(length - len(out))
+        return bytes(out)
+
+
+class RofsFileSystem: #vers 2
+    """Read-only view over several ROFS archives - paths indexed once, files depacked lazily"""
+
+    def __init__(self, archive_paths: List[str], cache_size: int = ROFS_FILE_CACHE_SIZE): #vers 1
+        """Index every archive; later archives override files of earlier ones"""
+        self.archives: List[RofsArchive] = []
+        self._index: Dict[str, Tuple[int, str]] = {}
+        self._dirs: Dict[str, set] = {"": set()}
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self.cache_size = cache_size
+        for archive_path in archive_paths:
+            archive = RofsArchive(archive_path)
+            number = len(self.archives)
+            self.archives.append(archive)
+            for name in archive.entries:
+                self._index[name.lower()] = (number, name)
+                parts = name.split("/")
+                for depth in range(len(parts)):
+                    parent = "/".join(parts[:depth]).lower()
+                    self._dirs.setdefault(parent, set()).add(
+                        (parts[depth], depth < len(parts) - 1))
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def __len__(self): #vers 1
+        return len(self._index)
+
+    def close(self): #vers 1
+        self._cache.clear()
+        for archive in self.archives:
+            archive.close()
+
+    def exists(self, path: str) -> bool: #vers 1
+        return path.strip("/").lower() in self._index
+
+    def file_info(self, path: str) -> Dict: #vers 1
+        """Archive, offset and stored length of one file"""
+        number, name = self._index[path.strip("/").lower()]
+        offset, length = self.archives[number].entries[name]
+        return {"path": name, "archive": self.archives[number].file_path,
+                "offset": offset, "length": length}
+
+    def file_size(self, path: str) -> int: #vers 1
+        """Length read() will return - taken from the crypt header, the file is not depacked"""
+        entry = self._index.get(path.strip("/").lower())
+        if entry is None:
+            raise FileNotFoundError(f"ROFS file not found: {path}")
+        number, name = entry
+        return self.archives[number].file_length(name)
+
+    def list_dir(self, path: str = "") -> List[Tuple[str, bool]]: #vers 1
+        """(name, is_dir) children of a directory, directories first"""
+        children = self._dirs.get(path.strip("/").lower())
+        if children is None:
+            raise FileNotFoundError(f"ROFS directory not found: {path}")
+        return sorted(children, key=lambda child: (not child[1], child[0].lower()))
+
+    def paths(self) -> List[str]: #vers 1
+        """All file paths (original case) in index order"""
+        return [name for _, name in self._index.values()]
+
+    def read(self, path: str) -> bytes: #vers 1
+        """File contents - decrypted/depacked on first read, small LRU after that"""
+        key = path.strip("/").lower()
+        data = self._cache.get(key)
+        if data is not None:
+            self._cache.move_to_end(key)
+            return data
+        entry = self._index.get(key)
+        if entry is None:
+            raise FileNotFoundError(f"ROFS file not found: {path}")
+        number, name = entry
+        data = self.archives[number].read_file(name)
+        self._cache[key] = data
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return data
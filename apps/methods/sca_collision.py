@@ -0,0 +1,180 @@
+#this belongs in apps/methods/sca_collision.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - SCA Collision Boundaries
+"""
+SCA Collision Boundaries - Resident Evil 1 RDT collision section (offset 1):
+rdt_sca_header_t (Cx/Cz + five per-type counts) followed by the wall, floor,
+door, obstacle and unknown boundary entries (12 byte rectangles relative to
+Cx/Cz, as in reevengi rdt1_sca_t). Entries are decoded into flat NumPy arrays
+and indexed by a 2D uniform grid, so a point query only tests the boundaries
+of one cell and whole batches of points are answered without a Python loop.
+"""
+
+import struct
+from typing import Optional, Tuple
+
+import numpy as np
+
+##Methods list -
+# (none)
+
+##class UniformGrid: -
+# __init__
+# _cell_of
+# query_point
+# query_points
+
+##class SCACollision: -
+# __init__
+# __len__
+# boundaries_at
+# grid
+# query_points
+# type_name
+
+SCA_HEADER_FORMAT = "<HH5I"             # Cx, Cz, counts[5]
+SCA_HEADER_SIZE = struct.calcsize(SCA_HEADER_FORMAT)
+# Boundary rectangle - x/z relative to Cx/Cz, width/depth, id, floor
+SCA_ENTRY_DTYPE = np.dtype([
+    ("x", "<i2"),
+    ("z", "<i2"),
+    ("w", "<u2"),
+    ("d", "<u2"),
+    ("id", "<u2"),
+    ("floor", "<u2"),
+])
+SCA_ENTRY_SIZE = SCA_ENTRY_DTYPE.itemsize
+SCA_TYPE_NAMES = ("wall", "floor", "door", "obstacle", "unknown")
+SCA_TYPE_WALL, SCA_TYPE_FLOOR, SCA_TYPE_DOOR, SCA_TYPE_OBSTACLE, SCA_TYPE_UNKNOWN = range(5)
+SCA_BLOCKING_TYPES = (SCA_TYPE_WALL, SCA_TYPE_OBSTACLE)
+GRID_TARGET_PER_CELL = 2                # aim for about this many boxes per cell
+GRID_MAX_CELLS_AXIS = 256
+
+
+class UniformGrid: #vers 1
+    """Static 2D uniform grid over axis-aligned boxes (x0, z0, x1, z1) - CSR cell lists built with NumPy"""
+
+    def __init__(self, boxes: np.ndarray, cell_size: Optional[float] = None): #vers 1
+        """Bin every box into each cell it overlaps"""
+        self.boxes = np.asarray(boxes, dtype=np.int64).reshape(-1, 4)
+        count = len(self.boxes)
+        if count:
+            self.origin = self.boxes[:, :2].min(axis=0)
+            extent = np.maximum(self.boxes[:, 2:].max(axis=0) - self.origin, 1)
+        else:
+            self.origin = np.zeros(2, dtype=np.int64)
+            extent = np.ones(2, dtype=np.int64)
+        if cell_size is None:
+            # Square cells, about GRID_TARGET_PER_CELL boxes each
+            cells_wanted = max(count // GRID_TARGET_PER_CELL, 1)
+            cell_size = float(np.sqrt(extent[0] * extent[1] / cells_wanted))
+            cell_size = max(cell_size, float(extent.max()) / GRID_MAX_CELLS_AXIS, 1.0)
+        self.cell_size = float(cell_size)
+        self.shape = tuple(int(n) for n in np.minimum(extent // self.cell_size + 1, GRID_MAX_CELLS_AXIS))
+        nx, nz = self.shape
+
+        lo = self._cell_of(self.boxes[:, :2])
+        hi = self._cell_of(self.boxes[:, 2:])
+        span_x = hi[:, 0] - lo[:, 0] + 1
+        span = span_x * (hi[:, 1] - lo[:, 1] + 1)
+        box_ids = np.repeat(np.arange(count), span)
+        first = np.repeat(np.cumsum(span) - span, span)
+        local = np.arange(box_ids.size) - first
+        cell_x = lo[box_ids, 0] + local % span_x[box_ids]
+        cell_z = lo[box_ids, 1] + local // span_x[box_ids]
+        cells = cell_z * nx + cell_x
+
+        order = np.argsort(cells, kind="stable")
+        self.cell_items = box_ids[order].astype(np.int32)
+        counts = np.bincount(cells, minlength=nx * nz)
+        self.cell_start = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+    def _cell_of(self, points: np.ndarray) -> np.ndarray: #vers 1
+        """(N, 2) grid cell coordinates, clamped to the grid"""
+        cell = np.floor((np.asarray(points, dtype=np.float64) - self.origin) / self.cell_size).astype(np.int64)
+        return np.clip(cell, 0, np.array(self.shape) - 1)
+
+    def query_point(self, x: float, z: float) -> np.ndarray: #vers 1
+        """Indices of boxes containing (x, z) - edges count as inside"""
+        return self.query_points(np.array([[x, z]]))[1]
+
+    def query_points(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+        """All (point index, box index) containment pairs for an (M, 2) point array"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64))
+        if not len(points) or not len(self.boxes):
+            return empty
+        nx, nz = self.shape
+        upper = self.origin + np.array(self.shape) * self.cell_size
+        inside = np.all((points >= self.origin) & (points <= upper), axis=1)
+        point_ids = np.nonzero(inside)[0]
+        cell = self._cell_of(points[point_ids])
+        cell_ids = cell[:, 1] * nx + cell[:, 0]
+
+        starts = self.cell_start[cell_ids]
+        counts = self.cell_start[cell_ids + 1] - starts
+        pair_points = np.repeat(point_ids, counts)
+        if not pair_points.size:
+            return empty
+        offsets = np.arange(pair_points.size) - np.repeat(np.cumsum(counts) - counts, counts)
+        pair_boxes = self.cell_items[np.repeat(starts, counts) + offsets].astype(np.int64)
+
+        px = points[pair_points, 0]
+        pz = points[pair_points, 1]
+        box = self.boxes[pair_boxes]
+        hit = (px >= box[:, 0]) & (px <= box[:, 2]) & (pz >= box[:, 1]) & (pz <= box[:, 3])
+        return pair_points[hit], pair_boxes[hit]
+
+
+class SCACollision: #vers 1
+    """Decoded SCA section - boxes (N, 4) absolute x0, z0, x1, z1 plus per-entry type, id and floor"""
+
+    def __init__(self, data, cell_size: Optional[float] = None): #vers 1
+        """Parse header and all boundary entries - the grid is built on first query"""
+        data = memoryview(data)
+        if len(data) < SCA_HEADER_SIZE:
+            raise ValueError(f"SCA section truncated: {len(data)} bytes")
+        fields = struct.unpack_from(SCA_HEADER_FORMAT, data, 0)
+        self.cx, self.cz = fields[0], fields[1]
+        self.counts = list(fields[2:7])
+
+        available = (len(data) - SCA_HEADER_SIZE) // SCA_ENTRY_SIZE
+        total = min(sum(self.counts), available)
+        self.entries = np.frombuffer(data, dtype=SCA_ENTRY_DTYPE, count=total, offset=SCA_HEADER_SIZE)
+        # Counts larger than the section (bad header) are cut to what is there
+        self.types = np.repeat(np.arange(len(self.counts), dtype=np.uint8), self.counts)[:total]
+
+        x0 = self.entries["x"].astype(np.int32) + self.cx
+        z0 = self.entries["z"].astype(np.int32) + self.cz
+        self.boxes = np.stack((x0, z0, x0 + self.entries["w"], z0 + self.entries["d"]), axis=1)
+        self.ids = self.entries["id"]
+        self.floors = self.entries["floor"]
+        self._cell_size = cell_size
+        self._grid: Optional[UniformGrid] = None
+
+    def __len__(self): #vers 1
+        return len(self.boxes)
+
+    @property
+    def grid(self) -> UniformGrid: #vers 1
+        if self._grid is None:
+            self._grid = UniformGrid(self.boxes, self._cell_size)
+        return self._grid
+
+    def type_name(self, index: int) -> str: #vers 1
+        return SCA_TYPE_NAMES[self.types[index]]
+
+    def boundaries_at(self, x: float, z: float, types: Optional[Tuple[int, ...]] = None) -> np.ndarray: #vers 1
+        """Indices of boundaries containing (x, z), optionally only some types"""
+        hits = self.grid.query_point(x, z)
+        if types is not None:
+            hits = hits[np.isin(self.types[hits], types)]
+        return hits
+
+    def query_points(self, points: np.ndarray,
+                     types: Optional[Tuple[int, ...]] = None) -> Tuple[np.ndarray, np.ndarray]: #vers 1
+        """(point index, boundary index) pairs for an (M, 2) array of XZ points"""
+        point_ids, hits = self.grid.query_points(points)
+        if types is not None:
+            keep = np.isin(self.types[hits], types)
+            point_ids, hits = point_ids[keep], hits[keep]
+        return point_ids, hits
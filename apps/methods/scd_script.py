@@ -0,0 +1,310 @@
+#this belongs in apps/methods/scd_script.py - Version: 1
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - SCD/EVT Script Disassembler
+"""
+SCD/EVT Script Disassembler - Resident Evil 1 room scripts (RDT sections 6, 7
+and 8, unsigned short length + bytecode). Instructions are found with a
+256-entry opcode length table and kept as a compact (offset, opcode, length)
+array over the original bytecode; operands are slices of it. Results are
+cached by content hash, so reopening a room or a shared script is free.
+"""
+
+import hashlib
+import json
+import struct
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from apps.methods.rdt_file import RDTFile
+
+##Methods list -
+# disassemble_rdt
+# disassemble_rooms
+# disassemble_script
+# format_scripts
+# walk_bytecode
+
+##class SCDOpcodeTable: -
+# __init__
+# _rebuild
+# load_json
+# name
+
+##class SCDScript: -
+# __init__
+# __len__
+# format
+# operands
+
+##class SCDCache: -
+# __init__
+# __len__
+# clear
+# get
+# put
+
+SCD_INSTRUCTION_DTYPE = np.dtype([
+    ("offset", "<u4"),
+    ("opcode", "u1"),
+    ("length", "u1"),
+])
+SCD_IF, SCD_ELSE, SCD_END_IF = 0x01, 0x02, 0x03
+
+# RE1 opcode -> (name, total length in bytes incl. opcode), 0 length = unknown
+SCD_OPCODES: Dict[int, Tuple[str, int]] = {
+    0x00: ("NOP", 2),
+    0x01: ("IF", 2),
+    0x02: ("ELSE", 2),
+    0x03: ("END_IF", 2),
+    0x04: ("BIT_TEST", 4),
+    0x05: ("BIT_OP", 4),
+    0x06: ("OBJ06_TEST", 4),
+    0x07: ("OBJ07_TEST", 6),
+    0x08: ("STAGE_ROOM_CAM_SET", 4),
+    0x09: ("CUT_SET", 2),
+    0x0A: ("CUT_SET_0A", 2),
+    0x0B: ("MESSAGE_0B", 2),
+    0x0C: ("DOOR_SET", 26),
+    0x0D: ("ITEM_SET", 18),
+    0x0E: ("NOP_0E", 2),
+    0x0F: ("OP_0F", 8),
+    0x10: ("OBJ10_TEST", 2),
+    0x11: ("OBJ11_TEST", 2),
+    0x12: ("ITEM_12", 10),
+    0x13: ("OBJ13_TEST", 4),
+    0x14: ("OP_14", 4),
+    0x15: ("OP_15", 2),
+    0x16: ("OP_16", 2),
+    0x17: ("OP_17", 10),
+    0x18: ("ITEM_MODEL_SET", 26),
+    0x19: ("OP_19", 4),
+    0x1A: ("OP_1A", 2),
+    0x1B: ("EM_SET", 22),
+    0x1C: ("OP_1C", 6),
+    0x1D: ("OP_1D", 2),
+    0x1E: ("OP_1E", 4),
+    0x1F: ("OM_SET", 28),
+    0x20: ("PLAYER_POS_SET", 14),
+    0x21: ("EM_POS_SET", 14),
+    0x22: ("OP_22", 4),
+    0x23: ("OP_23", 2),
+    0x24: ("OP_24", 4),
+    0x25: ("OP_25", 6),
+    0x26: ("OP_26", 2),
+    0x27: ("OP_27", 2),
+    0x28: ("OP_28", 6),
+    0x29: ("OP_29", 2),
+    0x2A: ("OP_2A", 12),
+    0x2B: ("OP_2B", 4),
+    0x2C: ("OP_2C", 2),
+    0x2D: ("OP_2D", 4),
+    0x2E: ("OP_2E", 2),
+    0x2F: ("OP_2F", 4),
+    0x30: ("OP_30", 12),
+    0x31: ("OP_31", 4),
+    0x32: ("OP_32", 4),
+    0x33: ("OP_33", 8),
+    0x34: ("OP_34", 8),
+    0x35: ("OP_35", 4),
+    0x36: ("OP_36", 4),
+    0x37: ("OP_37", 4),
+    0x38: ("OP_38", 4),
+    0x39: ("OP_39", 2),
+    0x3A: ("OP_3A", 4),
+    0x3B: ("OP_3B", 6),
+    0x3C: ("OP_3C", 6),
+    0x3D: ("OP_3D", 12),
+    0x3E: ("OP_3E", 2),
+    0x3F: ("OP_3F", 6),
+    0x40: ("OP_40", 16),
+    0x41: ("OP_41", 4),
+    0x42: ("OP_42", 4),
+    0x43: ("OP_43", 4),
+    0x44: ("OP_44", 2),
+    0x45: ("OP_45", 2),
+    0x46: ("OP_46", 2),
+    0x47: ("OP_47", 14),
+    0x48: ("OP_48", 2),
+    0x49: ("OP_49", 2),
+    0x4A: ("OP_4A", 2),
+    0x4B: ("OP_4B", 2),
+    0x4C: ("OP_4C", 4),
+    0x4D: ("OP_4D", 2),
+    0x4E: ("OP_4E", 4),
+    0x4F: ("OP_4F", 2),
+    0x50: ("OP_50", 2),
+}
+
+
+class SCDOpcodeTable: #vers 1
+    """Opcode names and lengths as flat 256-entry tables - JSON files can add or correct entries"""
+
+    def __init__(self, opcodes: Optional[Dict[int, Tuple[str, int]]] = None): #vers 1
+        self.opcodes = dict(SCD_OPCODES if opcodes is None else opcodes)
+        self._rebuild()
+
+    def _rebuild(self): #vers 1
+        self.lengths = tuple(self.opcodes.get(op, ("", 0))[1] for op in range(256))
+        self.names = tuple(self.opcodes.get(op, (f"OP_{op:02X}", 0))[0] for op in range(256))
+        # Part of every cache key - a changed table never returns stale listings
+        self.key = hashlib.sha1(bytes(self.lengths)).hexdigest()[:12]
+
+    def load_json(self, json_path: str) -> int: #vers 1
+        """Merge {"0x1B": {"name": "EM_SET", "length": 22}, ...} - returns entries loaded"""
+        with open(json_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        for op, entry in data.items():
+            opcode = int(op, 0)
+            if not 0 <= opcode < 256 or not 0 <= int(entry["length"]) < 256:
+                raise ValueError(f"Bad opcode entry {op}: {entry}")
+            self.opcodes[opcode] = (entry.get("name", f"OP_{opcode:02X}"), int(entry["length"]))
+        self._rebuild()
+        return len(data)
+
+    def name(self, opcode: int) -> str: #vers 1
+        return self.names[opcode]
+
+
+# Shared default table
+scd_opcodes = SCDOpcodeTable()
+
+
+def walk_bytecode(bytecode, lengths: Sequence[int]) -> Tuple[np.ndarray, int]: #vers 1
+    """(instructions, decoded end) - stops at an unknown opcode or one running past the end"""
+    data = bytes(bytecode)
+    size = len(data)
+    offsets = []
+    pos = 0
+    while pos < size:
+        length = lengths[data[pos]]
+        if not length or pos + length > size:
+            break
+        offsets.append(pos)
+        pos += length
+
+    instructions = np.empty(len(offsets), dtype=SCD_INSTRUCTION_DTYPE)
+    instructions["offset"] = offsets
+    instructions["opcode"] = np.frombuffer(data, dtype=np.uint8)[instructions["offset"]]
+    instructions["length"] = np.asarray(lengths, dtype=np.uint8)[instructions["opcode"]]
+    return instructions, pos
+
+
+class SCDScript: #vers 1
+    """One disassembled script - instruction array plus the bytecode it indexes"""
+
+    def __init__(self, bytecode, instructions: np.ndarray, end: int, table: SCDOpcodeTable): #vers 1
+        self.bytecode = bytes(bytecode)
+        self.instructions = instructions
+        self.end = end                # bytes from here on could not be decoded
+        self.table = table
+
+    def __len__(self): #vers 1
+        return len(self.instructions)
+
+    def operands(self, index: int) -> memoryview: #vers 1
+        """Operand bytes of one instruction (after the opcode byte)"""
+        offset, _, length = self.instructions[index]
+        return memoryview(self.bytecode)[offset + 1:offset + length]
+
+    def format(self) -> str: #vers 1
+        """Listing with IF/ELSE blocks indented and undecoded bytes dumped at the end"""
+        lines = []
+        depth = 0
+        names = self.table.names
+        for index, (offset, opcode, _) in enumerate(self.instructions.tolist()):
+            if opcode in (SCD_ELSE, SCD_END_IF):
+                depth = max(depth - 1, 0)
+            operands = self.operands(index).hex(' ').upper()
+            lines.append(f"{offset:04X}: {'  ' * depth}{names[opcode]:<20} {operands}".rstrip())
+            if opcode in (SCD_IF, SCD_ELSE):
+                depth += 1
+        if self.end < len(self.bytecode):
+            rest = self.bytecode[self.end:]
+            lines.append(f"{self.end:04X}: ; unknown opcode 0x{rest[0]:02X} - {len(rest)} bytes not decoded")
+            lines.append(f"      db {rest[:32].hex(' ').upper()}{' ...' if len(rest) > 32 else ''}")
+        return "\n".join(lines)
+
+
+class SCDCache: #vers 1
+    """Thread-safe LRU of instruction arrays keyed by (content hash, opcode table key)"""
+
+    def __init__(self, max_entries: int = 4096): #vers 1
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[np.ndarray, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self): #vers 1
+        return len(self._entries)
+
+    def get(self, key: Tuple[str, str]) -> Optional[Tuple[np.ndarray, int]]: #vers 1
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Tuple[str, str], entry: Tuple[np.ndarray, int]): #vers 1
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self): #vers 1
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every room - the same bytecode is only walked once per session
+scd_cache = SCDCache()
+
+
+def disassemble_script(bytecode, table: Optional[SCDOpcodeTable] = None,
+                       cache: Optional[SCDCache] = None) -> SCDScript: #vers 1
+    """Disassemble one script body (without its length prefix), reusing cached results"""
+    table = table if table is not None else scd_opcodes
+    cache = cache if cache is not None else scd_cache
+    data = bytes(bytecode)
+    key = (hashlib.blake2b(data, digest_size=16).hexdigest(), table.key)
+    entry = cache.get(key)
+    if entry is None:
+        entry = walk_bytecode(data, table.lengths)
+        entry[0].flags.writeable = False
+        cache.put(key, entry)
+    return SCDScript(data, entry[0], entry[1], table)
+
+
+def disassemble_rdt(rdt: RDTFile, table: Optional[SCDOpcodeTable] = None) -> List[Tuple[str, SCDScript]]: #vers 1
+    """(label, script) for the init, exec and every event script of a room"""
+    scripts = []
+    for label, section in (("init", rdt.init_script), ("exec", rdt.exec_script)):
+        if section is not None:
+            scripts.append((label, disassemble_script(section["bytecode"], table)))
+    for index, event in enumerate(rdt.event_scripts or []):
+        scripts.append((f"event {index:02d}", disassemble_script(event["bytecode"], table)))
+    return scripts
+
+
+def disassemble_rooms(file_paths: List[str], table: Optional[SCDOpcodeTable] = None,
+                      progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]: #vers 1
+    """Disassemble every script of many rooms - results in input order, errors in 'error'"""
+    results = []
+    for done, file_path in enumerate(file_paths, 1):
+        try:
+            with RDTFile(file_path) as rdt:
+                results.append({"path": file_path, "scripts": disassemble_rdt(rdt, table)})
+        except (OSError, ValueError, struct.error) as e:
+            results.append({"path": file_path, "error": str(e), "scripts": []})
+        if progress:
+            progress(done, len(file_paths))
+    return results
+
+
+def format_scripts(scripts: List[Tuple[str, SCDScript]]) -> str: #vers 1
+    """Text listing of several scripts, one header per script"""
+    blocks = []
+    for label, script in scripts:
+        blocks.append(f"; {label} - {len(script.bytecode)} bytes, {len(script)} instructions\n{script.format()}")
+    return "\n\n".join(blocks) if blocks else "; no scripts"
@@ -0,0 +1,203 @@
+#this belongs in apps/methods/script_index.py - Version: 4
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - Script Reference Index
+"""
+Script Reference Index - Cross-room inverted index of what RE1 room scripts
+(RDT sections 6-8) and item tables (section 2) touch: flags set and tested,
+items, enemy types and door targets. Rooms are decoded across a process pool,
+the postings are kept in one JSON file keyed by room path, size and mtime,
+so a rescan only re-indexes rooms that changed and a query is a dict lookup.
+Item table postings come from the provisional RDT_ITEM_DTYPE layout and are
+labelled unverified; ITEM_SET postings come from the scripts themselves.
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from apps.methods.json_store import load_json_store, save_json_store
+from apps.methods.rdt_catalog import find_rdt_files
+from apps.methods.rdt_file import RDT_ITEM_LAYOUT_VERIFIED, RDTFile
+from apps.methods.scd_script import disassemble_rdt
+
+##Methods list -
+# index_room_refs
+# make_ref_key
+# parse_ref_query
+# script_refs
+
+##class ScriptIndex: -
+# __init__
+# _add_postings
+# _load_index
+# _remove_postings
+# _save_index
+# kinds
+# query
+# scan
+# update_room
+
+INDEX_VERSION = 2
+INDEX_FILENAME = "script_index.json"
+
+# opcode -> (kind, byte positions of the key inside the instruction)
+SCD_REF_FIELDS: Dict[int, Tuple[str, Tuple[int, ...]]] = {
+    0x04: ("flag_test", (1, 2)),      # BIT_TEST bank, bit
+    0x05: ("flag_set", (1, 2)),       # BIT_OP bank, bit
+    0x0C: ("door", (18, 19)),         # DOOR_SET next stage, next room
+    0x0D: ("item", (10,)),            # ITEM_SET item type
+    0x1B: ("enemy", (3,)),            # EM_SET enemy type
+}
+REF_KINDS = ("flag_set", "flag_test", "item", "enemy", "door")
+# Posting label of item table entries - section 2 layout is provisional
+ITEMS_LABEL = "items" if RDT_ITEM_LAYOUT_VERIFIED else "items (unverified layout)"
+QUERY_ALIASES = {"flag": "flag_set", "set": "flag_set", "test": "flag_test", "em": "enemy", "room": "door"}
+
+
+def make_ref_key(kind: str, *values: int) -> str: #vers 1
+    """Posting key - e.g. flag_set:3:17"""
+    return ":".join([kind] + [str(int(value)) for value in values])
+
+
+def parse_ref_query(text: str) -> Tuple[str, Tuple[int, ...]]: #vers 2
+    """'flag 3 17' / 'enemy 0x12' / 'item 33' -> (kind, values) for ScriptIndex.query"""
+    parts = text.replace(",", " ").split()
+    if len(parts) < 2:
+        raise ValueError(f"Query needs a kind and a value: {text!r}")
+    kind = QUERY_ALIASES.get(parts[0].lower(), parts[0].lower())
+    if kind not in REF_KINDS:
+        raise ValueError(f"Unknown reference kind {parts[0]!r} - use one of {', '.join(REF_KINDS)}")
+    return kind, tuple(int(part, 0) for part in parts[1:])
+
+
+def script_refs(label: str, script) -> List[Tuple[str, str, int]]: #vers 1
+    """(key, label, offset) for every indexed instruction of one disassembled script"""
+    refs = []
+    if not len(script):
+        return refs
+    code = np.frombuffer(script.bytecode, dtype=np.uint8)
+    opcodes = script.instructions["opcode"]
+    for opcode, (kind, fields) in SCD_REF_FIELDS.items():
+        offsets = script.instructions["offset"][opcodes == opcode].astype(np.int64)
+        if not offsets.size:
+            continue
+        values = np.stack([code[offsets + field] for field in fields], axis=1)
+        for offset, row in zip(offsets.tolist(), values.tolist()):
+            refs.append((make_ref_key(kind, *row), label, offset))
+    return refs
+
+
+def index_room_refs(file_path: str) -> Dict: #vers 2
+    """Process pool worker - all references of one room plus its size/mtime stamp"""
+    stat = os.stat(file_path)
+    refs = []
+    with RDTFile(file_path) as rdt:
+        for label, script in disassemble_rdt(rdt):
+            refs += script_refs(label, script)
+        items = rdt.items
+        if items is not None:
+            for index, item_type in enumerate(items["type"].tolist()):
+                refs.append((make_ref_key("item", item_type), ITEMS_LABEL, index))
+    return {"path": file_path, "size": stat.st_size, "mtime": stat.st_mtime_ns, "refs": refs}
+
+
+class ScriptIndex: #vers 2
+    """Persistent inverted index - key -> [[room, script label, offset], ...]"""
+
+    def __init__(self, game_root: str, index_path: Optional[str] = None): #vers 1
+        """Load existing index - rooms are keyed by path relative to game_root"""
+        self.game_root = os.path.abspath(game_root)
+        self.index_path = index_path or os.path.join(self.game_root, INDEX_FILENAME)
+        self.rooms, self.postings = self._load_index()
+        self.errors: Dict[str, str] = {}
+
+    def _load_index(self) -> Tuple[Dict[str, Dict], Dict[str, List[List]]]: #vers 2
+        """Read index file, empty on first scan or version mismatch"""
+        data = load_json_store(self.index_path, INDEX_VERSION, "script index")
+        return data.get("rooms", {}), data.get("postings", {})
+
+    def _save_index(self) -> bool: #vers 2
+        """Write index in compact form"""
+        return save_json_store(self.index_path, INDEX_VERSION,
+                               {"rooms": self.rooms, "postings": self.postings}, "script index")
+
+    def _remove_postings(self, rel_paths: Sequence[str]): #vers 1
+        """Drop every posting of these rooms - only the keys they used are touched"""
+        for rel_path in rel_paths:
+            for key in self.rooms.get(rel_path, {}).get("keys", []):
+                postings = [p for p in self.postings.get(key, []) if p[0] != rel_path]
+                if postings:
+                    self.postings[key] = postings
+                else:
+                    self.postings.pop(key, None)
+
+    def _add_postings(self, rel_path: str, entry: Dict): #vers 1
+        """Store a worker result - room stamp plus one posting per reference"""
+        keys = []
+        for key, label, offset in entry["refs"]:
+            self.postings.setdefault(key, []).append([rel_path, label, offset])
+            keys.append(key)
+        self.rooms[rel_path] = {"size": entry["size"], "mtime": entry["mtime"], "keys": sorted(set(keys))}
+
+    def scan(self, max_workers: Optional[int] = None,
+             progress: Optional[Callable[[int, int], None]] = None) -> int: #vers 1
+        """Re-index new or changed rooms, drop deleted ones, return re-indexed count"""
+        current: Dict[str, os.stat_result] = {}
+        for file_path in find_rdt_files(self.game_root):
+            current[os.path.relpath(file_path, self.game_root)] = os.stat(file_path)
+
+        removed = [rel_path for rel_path in self.rooms if rel_path not in current]
+        changed = []
+        for rel_path, stat in current.items():
+            entry = self.rooms.get(rel_path)
+            if entry is None or entry["size"] != stat.st_size or entry["mtime"] != stat.st_mtime_ns:
+                changed.append(rel_path)
+        self._remove_postings(removed + changed)
+        for rel_path in removed:
+            del self.rooms[rel_path]
+
+        self.errors = {}
+        if changed:
+            done = 0
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                futures = {
+                    pool.submit(index_room_refs, os.path.join(self.game_root, rel_path)): rel_path
+                    for rel_path in changed
+                }
+                for future in as_completed(futures):
+                    rel_path = futures[future]
+                    try:
+                        self._add_postings(rel_path, future.result())
+                    except (OSError, ValueError, IndexError, struct.error) as e:
+                        # Remember bad rooms too, so they are only retried once changed
+                        stat = current[rel_path]
+                        self.rooms[rel_path] = {"size": stat.st_size, "mtime": stat.st_mtime_ns,
+                                                "keys": [], "error": str(e)}
+                        self.errors[rel_path] = str(e)
+                    done += 1
+                    if progress:
+                        progress(done, len(changed))
+        if changed or removed or not os.path.exists(self.index_path):
+            self._save_index()
+        return len(changed)
+
+    def update_room(self, file_path: str) -> bool: #vers 1
+        """Re-index one room in this process (e.g. right after saving it) and persist"""
+        rel_path = os.path.relpath(os.path.abspath(file_path), self.game_root)
+        self._remove_postings([rel_path])
+        if not os.path.exists(file_path):
+            self.rooms.pop(rel_path, None)
+        else:
+            self._add_postings(rel_path, index_room_refs(file_path))
+        return self._save_index()
+
+    def query(self, kind: str, *values: int) -> List[Tuple[str, str, int]]: #vers 1
+        """(room, script label, offset) postings - e.g. query('flag_set', 3, 17), query('enemy', 18)"""
+        return [tuple(posting) for posting in self.postings.get(make_ref_key(kind, *values), [])]
+
+    def kinds(self, kind: str) -> List[str]: #vers 1
+        """All indexed keys of one kind - e.g. every enemy type seen in the stage"""
+        prefix = kind + ":"
+        return sorted(key for key in self.postings if key.startswith(prefix))
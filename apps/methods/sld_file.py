@@ -0,0 +1,145 @@
+#this belongs in apps/methods/sld_file.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - SLD Mask Archive
+"""
+SLD Mask Archive - Resident Evil 3 PC Rxxx.SLD camera mask archives (port of
+list_files from reevengi-tools sld.c and sld_depack from depack_sld.c).
+The entry index is built once from the 8 byte headers of the memory-mapped
+file; a single entry is depacked to TIM bytes only when it is requested.
+"""
+
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from typing import List, Tuple
+
+from apps.methods.tim_image import TimImage
+
+##Methods list -
+# depack_sld
+
+##class SLDFile: -
+# __init__
+# __enter__
+# __exit__
+# __len__
+# _build_index
+# close
+# get_entry
+# get_tim
+# is_empty
+
+SLD_HEADER_FORMAT = "<2I"        # unknown, length (including header, 0 = empty)
+SLD_HEADER_SIZE = struct.calcsize(SLD_HEADER_FORMAT)
+SLD_ENTRY_CACHE_SIZE = 8
+
+
+def depack_sld(data, offset: int = 0) -> bytearray: #vers 2
+    """Depack one sld_depack stream (block count + literal/copy blocks)"""
+    src = memoryview(data)
+    num_blocks = struct.unpack_from("<I", src, offset)[0]
+    pos = offset + 4
+    out = bytearray()
+    src_len = len(src)
+    for _ in range(num_blocks):
+        if pos >= src_len:
+            raise ValueError("SLD stream truncated")
+        start = src[pos]
+        pos += 1
+        if start & 0x80:
+            count = start & 0x7F
+            if pos + count > src_len:
+                raise ValueError("SLD stream truncated")
+            out += src[pos:pos + count]
+            pos += count
+        else:
+            tmp = (start << 8) | src[pos]
+            pos += 1
+            back = (tmp & 0x7FF) + 4
+            count = (tmp >> 11) + 2
+            copy_from = len(out) - back
+            if copy_from < 0:
+                raise ValueError("SLD back reference before start of output")
+            if count <= back:
+                out += out[copy_from:copy_from + count]
+            else:
+                # Overlapping copy repeats the last 'back' bytes
+                pattern = out[copy_from:]
+                out += (pattern * (count // back + 1))[:count]
+    return out
+
+
+class SLDFile: #vers 1
+    """Indexed SLD archive - entry N is the mask TIM of camera N"""
+
+    def __init__(self, file_path: str): #vers 1
+        """Map file and index entry headers - nothing is depacked yet"""
+        self.file_path = str(file_path)
+        self.file_size = os.path.getsize(self.file_path)
+        self._mmap = None
+        self._view = memoryview(b"")
+        if self.file_size:
+            with open(self.file_path, 'rb') as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._view = memoryview(self._mmap)
+        self.entries: List[Tuple[int, int]] = self._build_index()
+        self._entry_cache: "OrderedDict[int, bytes]" = OrderedDict()
+
+    def __enter__(self): #vers 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback): #vers 1
+        self.close()
+
+    def __len__(self): #vers 1
+        return len(self.entries)
+
+    def _build_index(self) -> List[Tuple[int, int]]: #vers 1
+        """(offset, length) per entry - length 0 marks an empty slot"""
+        entries = []
+        offset = 0
+        while offset + SLD_HEADER_SIZE <= self.file_size:
+            _, length = struct.unpack_from(SLD_HEADER_FORMAT, self._view, offset)
+            if length and length < SLD_HEADER_SIZE:
+                raise ValueError(f"SLD entry {len(entries)} has bad length {length}")
+            entries.append((offset, length))
+            offset += length or SLD_HEADER_SIZE
+        return entries
+
+    def close(self): #vers 1
+        """Drop cached entries and unmap the file"""
+        self._entry_cache.clear()
+        if self._mmap is None:
+            return
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # Caller still holds an entry view - mapping is freed with it
+            pass
+        self._mmap = None
+
+    def is_empty(self, index: int) -> bool: #vers 1
+        return self.entries[index][1] == 0
+
+    def get_entry(self, index: int) -> bytes: #vers 1
+        """Depacked TIM bytes of one entry (b'' for empty slots) - small LRU"""
+        data = self._entry_cache.get(index)
+        if data is not None:
+            self._entry_cache.move_to_end(index)
+            return data
+        offset, length = self.entries[index]
+        if length == 0:
+            return b""
+        data = bytes(depack_sld(self._view[:offset + length], offset + SLD_HEADER_SIZE))
+        self._entry_cache[index] = data
+        while len(self._entry_cache) > SLD_ENTRY_CACHE_SIZE:
+            self._entry_cache.popitem(last=False)
+        return data
+
+    def get_tim(self, index: int) -> TimImage: #vers 1
+        """Mask TIM for camera index"""
+        data = self.get_entry(index)
+        if not data:
+            raise ValueError(f"SLD entry {index} is empty")
+        return TimImage(data=data)
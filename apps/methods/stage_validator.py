@@ -0,0 +1,147 @@
+#this belongs in apps/methods/stage_validator.py - Version: 4
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - Stage Collision Validator
+"""
+Stage Collision Validator - Checks every item placement (RDT section 2),
+enemy spawn (EM_SET in the room scripts, sections 6-8) and camera position of
+every room in a stage against the room's SCA boundaries (section 1). Each room
+is tested in one batched grid query, rooms are spread over a process pool.
+Item positions come from the provisional RDT_ITEM_DTYPE layout and are
+reported as unverified until that layout is confirmed.
+"""
+
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from apps.methods.rdt_file import RDT_ITEM_LAYOUT_VERIFIED, RDTFile
+from apps.methods.sca_collision import SCA_BLOCKING_TYPES, SCA_TYPE_NAMES
+from apps.methods.scd_script import disassemble_rdt
+
+##Methods list -
+# _point_issues
+# enemy_positions
+# format_validation_report
+# validate_room
+# validate_stage
+
+
+def _point_issues(collision, kind: str, points: np.ndarray, types: Sequence[int]) -> List[Dict]: #vers 1
+    """One issue per (point, boundary) overlap - points is (N, 2) XZ"""
+    point_ids, hits = collision.query_points(points, tuple(types))
+    issues = []
+    for point, boundary in zip(point_ids.tolist(), hits.tolist()):
+        issues.append({
+            "kind": kind,
+            "index": point,
+            "x": int(points[point, 0]),
+            "z": int(points[point, 1]),
+            "boundary": boundary,
+            "type": SCA_TYPE_NAMES[collision.types[boundary]],
+            "id": int(collision.ids[boundary]),
+        })
+    return issues
+
+
+# EM_SET - int16 x, y, z at these byte positions inside the 22 byte instruction
+SCD_EM_SET = 0x1B
+EM_SET_POS_X, EM_SET_POS_Z = 10, 14
+
+
+def enemy_positions(rdt: RDTFile) -> np.ndarray: #vers 1
+    """(N, 2) XZ spawn positions of every EM_SET in the room scripts, in script order"""
+    points = []
+    for _, script in disassemble_rdt(rdt):
+        if not len(script):
+            continue
+        offsets = script.instructions["offset"][script.instructions["opcode"] == SCD_EM_SET].astype(np.int64)
+        if not offsets.size:
+            continue
+        code = np.frombuffer(script.bytecode, dtype=np.uint8).astype(np.uint16)
+        fields = offsets[:, None] + np.array([EM_SET_POS_X, EM_SET_POS_Z])
+        points.append((code[fields] | (code[fields + 1] << 8)).view(np.int16).astype(np.int32))
+    return np.concatenate(points) if points else np.empty((0, 2), dtype=np.int32)
+
+
+def validate_room(file_path: str, types: Sequence[int] = SCA_BLOCKING_TYPES,
+                  check_cameras: bool = True, check_enemies: bool = True) -> Dict: #vers 4
+    """Process pool worker - items, enemy spawns and camera eyes inside blocking boundaries of one room"""
+    with RDTFile(file_path) as rdt:
+        collision = rdt.collision
+        items = rdt.items
+        cameras = rdt.cameras
+        enemies = enemy_positions(rdt) if check_enemies else np.empty((0, 2), dtype=np.int32)
+        result = {
+            "path": file_path,
+            "items": 0 if items is None else len(items),
+            "enemies": len(enemies),
+            "cameras": len(cameras),
+            "boundaries": 0 if collision is None else len(collision),
+            "issues": [],
+        }
+        if collision is None or not len(collision):
+            return result
+        if items is not None and len(items):
+            positions = items["pos"][:, [0, 2]].astype(np.int32)
+            item_issues = _point_issues(collision, "item", positions, types)
+            for issue in item_issues:
+                issue["unverified"] = not RDT_ITEM_LAYOUT_VERIFIED
+            result["issues"] += item_issues
+        if len(enemies):
+            result["issues"] += _point_issues(collision, "enemy", enemies, types)
+        if check_cameras and len(cameras):
+            positions = cameras["from"][:, [0, 2]]
+            result["issues"] += _point_issues(collision, "camera", positions, types)
+    return result
+
+
+def validate_stage(file_paths: List[str], types: Sequence[int] = SCA_BLOCKING_TYPES, check_cameras: bool = True,
+                   check_enemies: bool = True, max_workers: Optional[int] = None,
+                   progress: Optional[Callable[[int, int], None]] = None) -> List[Dict]: #vers 3
+    """Validate many rooms across a process pool - results in input order, errors in 'error'"""
+    results: List[Optional[Dict]] = [None] * len(file_paths)
+    if not file_paths:
+        return []
+    done = 0
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            pool.submit(validate_room, file_path, tuple(types), check_cameras, check_enemies): index
+            for index, file_path in enumerate(file_paths)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except (OSError, ValueError, IndexError, struct.error) as e:
+                results[index] = {"path": file_paths[index], "error": str(e), "issues": []}
+            done += 1
+            if progress:
+                progress(done, len(file_paths))
+    return results
+
+
+def format_validation_report(results: List[Dict], root: Optional[str] = None) -> str: #vers 2
+    """Plain text report - offending rooms only, then a summary line"""
+    lines = []
+    issue_count = 0
+    for result in results:
+        name = os.path.relpath(result["path"], root) if root else result["path"]
+        if "error" in result:
+            lines.append(f"{name}: ERROR {result['error']}")
+            continue
+        if not result["issues"]:
+            continue
+        issue_count += len(result["issues"])
+        lines.append(f"{name}: {len(result['issues'])} issue(s)")
+        for issue in result["issues"]:
+            lines.append(f"    {issue['kind']} {issue['index']:3d} at ({issue['x']}, {issue['z']}) "
+                         f"inside {issue['type']} {issue['boundary']} (id {issue['id']})"
+                         + (" [unverified item layout]" if issue.get("unverified") else ""))
+    errors = sum(1 for result in results if "error" in result)
+    lines.append("")
+    lines.append(f"{len(results)} rooms checked, {issue_count} issues, {errors} errors")
+    if not RDT_ITEM_LAYOUT_VERIFIED:
+        lines.append("Item positions use the provisional RDT item record layout - treat item issues as unverified")
+    return "\n".join(lines)
@@ -0,0 +1,181 @@
+#this belongs in apps/methods/tim_image.py - Version: 2
+# X-Seti - October18 2026 - ResBio-Evil-Workshop 1.0 - TIM Image Decoder
+"""
+TIM Image Decoder - Sony PSX TIM textures (4/8/16/24 bpp) as used standalone,
+inside EMD section 3 and for RDT masks. Pixels and palettes are read with
+np.frombuffer; CLUT lookup and BGR555+STP -> RGBA8888 are table lookups, so
+the result can go straight into QImage(..., Format_RGBA8888). The index plane
+is unpacked once and per-CLUT RGBA results are kept in a small LRU, so palette
+cycling is a cache hit or a single lookup.
+"""
+
+import struct
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+
+##Methods list -
+# _build_bgr555_table
+# bgr555_to_rgba
+# is_tim
+
+##class TimImage: -
+# __init__
+# __repr__
+# _palette_rgba
+# index_plane
+# palette_count
+# to_rgba
+# to_rgba_bytes
+
+TIM_MAGIC = 0x10
+TIM_HEADER_FORMAT = "<2I"         # magic, flags
+TIM_HEADER_SIZE = struct.calcsize(TIM_HEADER_FORMAT)
+TIM_BLOCK_FORMAT = "<I4H"         # length, x, y, width (16 bit units), height
+TIM_BLOCK_SIZE = struct.calcsize(TIM_BLOCK_FORMAT)
+TIM_FLAG_CLUT = 0x08
+TIM_BPP = {0: 4, 1: 8, 2: 16, 3: 24}
+TIM_PALETTE_COLORS = {4: 16, 8: 256}
+TIM_RGBA_CACHE_SIZE = 16
+
+
+def _build_bgr555_table() -> np.ndarray: #vers 1
+    """All 65536 PSX colours as little endian RGBA8888 words"""
+    colors = np.arange(0x10000, dtype=np.uint32)
+    expand = ((np.arange(32, dtype=np.uint32) * 255 + 15) // 31)
+    red = expand[colors & 0x1F]
+    green = expand[(colors >> 5) & 0x1F]
+    blue = expand[(colors >> 10) & 0x1F]
+    # 0x0000 is the transparent colour, anything else (STP or not) is drawn opaque
+    alpha = np.where(colors == 0, 0, 255).astype(np.uint32)
+    return (red | (green << 8) | (blue << 16) | (alpha << 24)).astype("<u4")
+
+
+_BGR555_TABLE = _build_bgr555_table()
+
+
+def bgr555_to_rgba(colors: np.ndarray) -> np.ndarray: #vers 1
+    """uint16 PSX colours of any shape -> (..., 4) uint8 RGBA"""
+    words = _BGR555_TABLE[np.asarray(colors, dtype=np.uint16)]
+    return words.view(np.uint8).reshape(words.shape + (4,))
+
+
+def is_tim(data, offset: int = 0) -> bool: #vers 1
+    """Quick magic + flags check"""
+    if len(data) < offset + TIM_HEADER_SIZE:
+        return False
+    magic, flags = struct.unpack_from(TIM_HEADER_FORMAT, data, offset)
+    return magic == TIM_MAGIC and (flags & ~0x0F) == 0 and (flags & 0x07) in TIM_BPP
+
+
+class TimImage: #vers 1
+    """One TIM image with optional CLUT block"""
+
+    def __init__(self, file_path: Optional[str] = None, data=None, offset: int = 0,
+                 rgba_cache_size: int = TIM_RGBA_CACHE_SIZE): #vers 2
+        """Parse from a path or from bytes (offset allows TIMs embedded in EMD/RDT)"""
+        if file_path is None and data is None:
+            raise ValueError("TimImage needs file_path or data")
+        if data is None:
+            with open(file_path, 'rb') as f:
+                data = f.read()
+        self.file_path = file_path
+        view = memoryview(data)
+
+        if not is_tim(view, offset):
+            raise ValueError(f"Not a TIM image at offset {offset}")
+        _, flags = struct.unpack_from(TIM_HEADER_FORMAT, view, offset)
+        self.bpp = TIM_BPP[flags & 0x07]
+        pos = offset + TIM_HEADER_SIZE
+
+        self.palettes = None
+        self.clut_origin = None
+        if flags & TIM_FLAG_CLUT:
+            length, x, y, clut_w, clut_h = struct.unpack_from(TIM_BLOCK_FORMAT, view, pos)
+            colors = np.frombuffer(view, dtype="<u2", count=clut_w * clut_h, offset=pos + TIM_BLOCK_SIZE)
+            per_palette = TIM_PALETTE_COLORS.get(self.bpp, clut_w)
+            # A 256 wide CLUT row holds 16 palettes for 4bpp images
+            if per_palette and colors.size % per_palette == 0:
+                self.palettes = colors.reshape(-1, per_palette)
+            else:
+                self.palettes = colors.reshape(clut_h, clut_w)
+            self.clut_origin = (x, y)
+            pos += length
+
+        length, x, y, word_w, self.height = struct.unpack_from(TIM_BLOCK_FORMAT, view, pos)
+        self.image_origin = (x, y)
+        self.width = {4: word_w * 4, 8: word_w * 2, 16: word_w, 24: word_w * 2 // 3}[self.bpp]
+        row_bytes = word_w * 2
+        pixel_start = pos + TIM_BLOCK_SIZE
+        if pixel_start + row_bytes * self.height > len(view):
+            raise ValueError("TIM pixel data truncated")
+        self._pixels = np.frombuffer(view, dtype=np.uint8, count=row_bytes * self.height,
+                                     offset=pixel_start).reshape(self.height, row_bytes)
+        self.end_offset = pos + length
+        self._index_plane = None
+        self._rgba_cache: "OrderedDict[int, bytes]" = OrderedDict()
+        self.rgba_cache_size = rgba_cache_size
+
+    def __repr__(self): #vers 1
+        return f"<TimImage {self.width}x{self.height} {self.bpp}bpp palettes={self.palette_count}>"
+
+    @property
+    def palette_count(self) -> int: #vers 1
+        return 0 if self.palettes is None else len(self.palettes)
+
+    @property
+    def index_plane(self) -> Optional[np.ndarray]: #vers 1
+        """(height, width) uint8 palette indices, unpacked once - None for direct colour"""
+        if self.bpp > 8:
+            return None
+        if self._index_plane is None:
+            if self.bpp == 8:
+                plane = self._pixels[:, :self.width].copy()
+            else:
+                plane = np.empty((self.height, self.width), dtype=np.uint8)
+                plane[:, 0::2] = self._pixels & 0x0F
+                plane[:, 1::2] = self._pixels >> 4
+            plane.setflags(write=False)
+            self._index_plane = plane
+        return self._index_plane
+
+    def _palette_rgba(self, palette: int) -> bytes: #vers 1
+        """Packed RGBA for one CLUT - LRU cached, index plane reused"""
+        rgba = self._rgba_cache.get(palette)
+        if rgba is not None:
+            self._rgba_cache.move_to_end(palette)
+            return rgba
+        if not 0 <= palette < self.palette_count:
+            raise IndexError(f"TIM palette out of range: {palette}")
+        lut = _BGR555_TABLE[self.palettes[palette]]
+        if lut.size < (1 << self.bpp):
+            lut = np.pad(lut, (0, (1 << self.bpp) - lut.size))
+        rgba = lut[self.index_plane].tobytes()
+        self._rgba_cache[palette] = rgba
+        while len(self._rgba_cache) > self.rgba_cache_size:
+            self._rgba_cache.popitem(last=False)
+        return rgba
+
+    def to_rgba(self, palette: int = 0) -> np.ndarray: #vers 2
+        """(height, width, 4) uint8 RGBA8888 - read only when served from the palette cache"""
+        if self.bpp == 24:
+            rgba = np.full((self.height, self.width, 4), 255, dtype=np.uint8)
+            rgba[..., :3] = self._pixels[:, :self.width * 3].reshape(self.height, self.width, 3)
+            return rgba
+        if self.bpp == 16:
+            return bgr555_to_rgba(self._pixels.view("<u2"))
+
+        if self.palettes is None:
+            # No CLUT - show indices as greyscale
+            gray = self.index_plane * np.uint8(255 // ((1 << self.bpp) - 1))
+            rgba = np.repeat(gray[..., None], 4, axis=2)
+            rgba[..., 3] = 255
+            return rgba
+        return np.frombuffer(self._palette_rgba(palette), dtype=np.uint8).reshape(self.height, self.width, 4)
+
+    def to_rgba_bytes(self, palette: int = 0) -> bytes: #vers 2
+        """Packed RGBA8888 rows for QImage"""
+        if self.bpp <= 8 and self.palettes is not None:
+            return self._palette_rgba(palette)
+        return np.ascontiguousarray(self.to_rgba(palette)).tobytes()